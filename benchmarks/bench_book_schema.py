@@ -0,0 +1,113 @@
+"""Benchmark parsing archived books into ``book_schema`` payloads.
+
+Reports the time to build payloads from decoded JSON (``BookPayload.from_dict``)
+and from raw text (``parse_book_payload``), plus the memory held by the parsed
+payload, all per 1,000 chapters. Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_book_schema.py --chapters 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+from learn_anything.book_schema import BookPayload, parse_book_payload
+
+_WORDS = ["kubectl", "**apply**", "pods", "`svc`", "deploy", "node", "*scale*", "cluster", "  padded  "]
+
+
+def _text(rnd: random.Random, words: int) -> str:
+    return " ".join(rnd.choice(_WORDS) for _ in range(words))
+
+
+def make_chapter(number: int, rnd: random.Random) -> dict:
+    """A chapter with the canonical keys that schema-validated output uses."""
+    return {
+        "chapter_number": number,
+        "title": f" Chapter {number} ",
+        "estimated_time_minutes": 45,
+        "learning_objectives": [_text(rnd, 6) for _ in range(4)] + [""],
+        "overview": _text(rnd, 80),
+        "theoretical_concepts": [{"title": f"Concept {k}", "content": _text(rnd, 40)} for k in range(3)],
+        "procedures": [{"title": "Steps", "content": _text(rnd, 40)}],
+        "examples": [{"title": "Example", "content": _text(rnd, 40)}],
+        "hands_on_exercises": [{"title": "Lab", "objective": _text(rnd, 8), "steps": [_text(rnd, 8) for _ in range(4)], "solution": _text(rnd, 30)}],
+        "troubleshooting": [{"problem": _text(rnd, 6), "solution": _text(rnd, 12), "notes": _text(rnd, 4)}],
+        "best_practices": [_text(rnd, 8) for _ in range(4)],
+        "summary": _text(rnd, 40),
+        "quiz": [
+            {"question": _text(rnd, 8), "question_type": "multiple_choice", "options": ["a", " b ", "c"], "answer": "a", "explanation": _text(rnd, 10)}
+            for _ in range(5)
+        ],
+    }
+
+
+def make_alias_chapter(number: int, rnd: random.Random) -> dict:
+    """The same chapter written with the alternate keys older outputs used."""
+    chapter = make_chapter(number, rnd)
+    chapter["recap"] = chapter.pop("summary")
+    chapter["theoretical_concepts"] = [{"heading": b["title"], "body": b["content"]} for b in chapter["theoretical_concepts"]]
+    chapter["troubleshooting"] = [{"issue": t["problem"], "resolution": t["solution"], "notes": t["notes"]} for t in chapter["troubleshooting"]]
+    chapter["quiz"] = [
+        {"prompt": q["question"], "type": q["question_type"], "options": q["options"], "answer": q["answer"], "rationale": q["explanation"]}
+        for q in chapter["quiz"]
+    ]
+    return chapter
+
+
+def make_book(chapters: int, aliases: bool = False, seed: int = 7) -> dict:
+    rnd = random.Random(seed)
+    make = make_alias_chapter if aliases else make_chapter
+    return {
+        "title": "Benchmark Book",
+        "introduction": {"topic_overview": _text(rnd, 40), "what_you_will_learn": [_text(rnd, 5) for _ in range(5)]},
+        "chapters": [make(number, rnd) for number in range(1, chapters + 1)],
+        "supplementary": {"recommended_tools": [{"name": "kubectl", "description": "CLI", "url": "https://k8s.io"}], "glossary": [{"term": "Pod", "definition": "unit"}]},
+        "summary": _text(rnd, 30),
+    }
+
+
+def _best_seconds(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chapters", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--aliases", action="store_true", help="use alternate field names throughout")
+    args = parser.parse_args()
+
+    data = make_book(args.chapters, aliases=args.aliases)
+    text = json.dumps(data)
+    per_thousand = 1000 / args.chapters
+
+    from_dict_s = _best_seconds(lambda: BookPayload.from_dict(data), args.repeat)
+    parse_s = _best_seconds(lambda: parse_book_payload(text), args.repeat)
+
+    gc.collect()
+    tracemalloc.start()
+    payload = BookPayload.from_dict(data)
+    payload_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(payload.chapters) == args.chapters
+
+    print(f"chapters:              {args.chapters}")
+    print(f"from_dict:             {from_dict_s * per_thousand * 1000:8.1f} ms / 1,000 chapters")
+    print(f"parse_book_payload:    {parse_s * per_thousand * 1000:8.1f} ms / 1,000 chapters")
+    print(f"payload memory:        {payload_bytes * per_thousand / 1e6:8.2f} MB / 1,000 chapters")
+
+
+if __name__ == "__main__":
+    main()
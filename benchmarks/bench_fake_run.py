@@ -0,0 +1,117 @@
+"""Benchmark whole runs against the fake LLM provider (``LLM_MODE=fake``).
+
+Runs the real CLI offline in fresh interpreters, once per chapter-worker count
+and repeat, and reads each run's telemetry. For every worker count it reports
+the best wall time, the run time, the summed LLM call time, the time at least
+one call was in flight, the orchestration time (run time with no call in
+flight: crew construction, planning fan-out, checkpoints, rendering) and the
+peak number of concurrent calls. With a non-zero ``--latency`` the sweep is a
+concurrency load test of the DAG mode; with the default zero latency it
+measures pure orchestration overhead. Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_fake_run.py --workers 1,4,8 --latency uniform:0.2:0.6
+"""
+
+from __future__ import annotations
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Tuple
+
+
+def _intervals(calls: List[Dict[str, Any]]) -> List[Tuple[float, float]]:
+    intervals = []
+    for call in calls:
+        start = datetime.fromisoformat(call["started_at"]).timestamp()
+        intervals.append((start, start + call["duration_seconds"]))
+    return sorted(intervals)
+
+
+def _busy_seconds(intervals: List[Tuple[float, float]]) -> float:
+    """Length of the union of the call intervals."""
+    busy, end = 0.0, float("-inf")
+    for start, stop in intervals:
+        if stop > end:
+            busy += stop - max(start, end)
+            end = stop
+    return busy
+
+
+def _peak_concurrency(intervals: List[Tuple[float, float]]) -> int:
+    events = sorted([(start, 1) for start, _ in intervals] + [(stop, -1) for _, stop in intervals])
+    peak = current = 0
+    for _, delta in events:
+        current += delta
+        peak = max(peak, current)
+    return peak
+
+
+def run_once(workers: int, args: argparse.Namespace) -> Dict[str, float]:
+    """Run the CLI once in a scratch directory and summarise its telemetry."""
+    with tempfile.TemporaryDirectory() as scratch:
+        env = dict(
+            os.environ,
+            CREWAI_TRACING_ENABLED="false",
+            OTEL_SDK_DISABLED="true",
+            LLM_MODE="fake",
+            FAKE_LATENCY=args.latency,
+            FAKE_TOKENS_PER_SECOND=str(args.tokens_per_second),
+            FAKE_CHAPTERS=str(args.chapters),
+            FAKE_SEED=args.seed,
+        )
+        output_dir = os.path.join(scratch, "outputs")
+        command = [sys.executable, "-m", "learn_anything.main", "run", "--topic", "Benchmark"]
+        command += ["--skill-level", "beginner", "--time-commitment", "1 week"]
+        command += ["--execution-mode", "dag", "--render-mode", "local"]
+        command += ["--max-chapter-workers", str(workers), "--output-dir", output_dir]
+        start = time.perf_counter()
+        subprocess.run(command, cwd=scratch, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, check=True)
+        wall = time.perf_counter() - start
+        with open(glob.glob(os.path.join(output_dir, "*.telemetry.json"))[0], encoding="utf-8") as handle:
+            telemetry = json.load(handle)
+
+    intervals = _intervals(telemetry["llm_calls"])
+    busy = _busy_seconds(intervals)
+    return {
+        "wall": wall,
+        "run": telemetry["duration_seconds"],
+        "calls": len(intervals),
+        "llm": sum(stop - start for start, stop in intervals),
+        "busy": busy,
+        "orchestration": max(0.0, telemetry["duration_seconds"] - busy),
+        "peak": _peak_concurrency(intervals),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", default="1,4", help="comma-separated --max-chapter-workers values to sweep")
+    parser.add_argument("--chapters", type=int, default=6, help="chapters the fake planner returns")
+    parser.add_argument("--latency", default="0", help="FAKE_LATENCY spec, e.g. 0.5 or uniform:0.2:1.5")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0, help="simulated generation speed (0: instant)")
+    parser.add_argument("--seed", default="0")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    header = f"{'workers':>7} {'wall s':>8} {'run s':>8} {'calls':>6} {'llm s':>8} {'busy s':>8} {'orch s':>8} {'peak':>5}"
+    print(f"chapters={args.chapters} latency={args.latency} tokens/s={args.tokens_per_second or 'inf'} repeat={args.repeat}")
+    print(header)
+    print("-" * len(header))
+    for workers in (int(value) for value in args.workers.split(",") if value.strip()):
+        runs = [run_once(workers, args) for _ in range(args.repeat)]
+        best = min(runs, key=lambda run: run["run"])
+        print(
+            f"{workers:>7} {min(run['wall'] for run in runs):>8.2f} {best['run']:>8.2f} {best['calls']:>6} "
+            f"{best['llm']:>8.2f} {best['busy']:>8.2f} {best['orchestration']:>8.2f} {best['peak']:>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
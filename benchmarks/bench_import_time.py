@@ -0,0 +1,83 @@
+"""Benchmark CLI start-up: import time of ``learn_anything.main`` and ``--help``.
+
+Runs ``python -X importtime`` in fresh interpreters, reports the best
+cumulative import time and wall time, and lists the slowest imports. Exits
+with status 1 when a module that must stay lazy (crewAI, LiteLLM, the crew
+itself) is imported at start-up or a ``--max-ms`` budget is exceeded, so it
+can run in CI. Run from the repository root::
+
+    PYTHONPATH=src python benchmarks/bench_import_time.py --max-ms 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+# Heavy modules the CLI must only import once a command needs them.
+LAZY_MODULES = ("crewai", "litellm", "learn_anything.crew", "learn_anything.llm_wrappers")
+
+
+def _importtime(code: List[str]) -> Tuple[float, Dict[str, int]]:
+    """Run one interpreter and return ``(wall_seconds, {module: cumulative_us})``."""
+    env = dict(os.environ, CREWAI_TRACING_ENABLED="false", OTEL_SDK_DISABLED="true")
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *code],
+        capture_output=True,
+        text=True,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        check=True,
+    )
+    wall = time.perf_counter() - start
+    cumulative: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    return wall, cumulative
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="slowest imports to list")
+    parser.add_argument("--max-ms", type=float, help="fail when importing learn_anything.main takes longer")
+    args = parser.parse_args()
+
+    best_import_us = None
+    best_help_s = float("inf")
+    modules: Dict[str, int] = {}
+    for _ in range(args.repeat):
+        _, cumulative = _importtime(["-c", "import learn_anything.main"])
+        if best_import_us is None or cumulative["learn_anything.main"] < best_import_us:
+            best_import_us, modules = cumulative["learn_anything.main"], cumulative
+        help_s, _ = _importtime(["-m", "learn_anything.main", "--help"])
+        best_help_s = min(best_help_s, help_s)
+
+    print(f"import learn_anything.main: {best_import_us / 1000:8.1f} ms")
+    print(f"main --help (wall):         {best_help_s * 1000:8.1f} ms")
+    print("slowest imports (cumulative):")
+    for name, us in sorted(modules.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    failures = []
+    eager = [name for name in LAZY_MODULES if name in modules]
+    if eager:
+        failures.append(f"imported at start-up: {', '.join(eager)}")
+    if args.max_ms is not None and best_import_us / 1000 > args.max_ms:
+        failures.append(f"import took {best_import_us / 1000:.1f} ms (budget {args.max_ms:.1f} ms)")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
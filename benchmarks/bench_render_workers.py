@@ -0,0 +1,83 @@
+"""Benchmark serial against process-pool rendering of chapter articles.
+
+Renders books of several sizes with ``workers=1`` and with each requested
+worker count, and reports the best time of each and the speed-up. The pool
+threshold (``HTML_RENDER_MIN_PARALLEL_CHAPTERS``) is disabled so the pool is
+always used, and the Markdown cache is off so every run converts every
+chapter. A pool only pays off once rendering the chapters takes longer than
+starting the workers and pickling every chapter to them and its HTML back,
+and only with as many idle CPUs as workers; use the output to choose
+``HTML_RENDER_WORKERS`` and the threshold for a machine. Run from the
+repository root::
+
+    PYTHONPATH=src python benchmarks/bench_render_workers.py --chapters 50,200,800 --workers 2,4
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import os
+import random
+import time
+from typing import Callable, List
+
+from bench_book_schema import make_book
+
+# Memoized fragments would let repeats (and forked workers) skip the Markdown
+# work the pool is meant to spread; disable the cache before the renderer loads.
+os.environ["MARKDOWN_CACHE_SIZE"] = "0"
+
+from learn_anything.book_schema import BookPayload  # noqa: E402
+from learn_anything.tools.html_builder import _render_chapter_articles  # noqa: E402
+
+
+def _best_seconds(func: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _chapters(count: int, words: int) -> List:
+    book = make_book(count)
+    rnd = random.Random(count)
+    for chapter in book["chapters"]:
+        # Pad the overview to scale the Markdown work per chapter.
+        chapter["overview"] += " " + " ".join(rnd.choice(["kubectl", "**pods**", "`svc`", "node"]) for _ in range(words))
+    return BookPayload.from_dict(book).chapters
+
+
+def _render_seconds(chapters: List, workers: int, repeat: int) -> float:
+    return _best_seconds(lambda: sum(1 for _ in _render_chapter_articles(chapters, workers)), repeat)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chapters", default="50,200,800", help="comma-separated chapter counts")
+    parser.add_argument("--workers", default="2,4", help="comma-separated pool sizes to compare with serial")
+    parser.add_argument("--words", type=int, default=0, help="extra overview words per chapter")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    os.environ["HTML_RENDER_MIN_PARALLEL_CHAPTERS"] = "0"
+    worker_counts = [int(value) for value in args.workers.split(",") if value.strip()]
+    print(f"CPUs available: {os.cpu_count()}  extra words/chapter: {args.words}")
+    header = f"{'chapters':>8} {'serial s':>9}" + "".join(f" {f'{w} workers s':>12} {'speed-up':>8}" for w in worker_counts)
+    print(header)
+    print("-" * len(header))
+    for count in (int(value) for value in args.chapters.split(",") if value.strip()):
+        chapters = _chapters(count, args.words)
+        serial = _render_seconds(chapters, 1, args.repeat)
+        row = f"{count:>8} {serial:>9.3f}"
+        for workers in worker_counts:
+            pooled = _render_seconds(chapters, workers, args.repeat)
+            row += f" {pooled:>12.3f} {serial / pooled:>7.2f}x"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Check that ``learn_anything.api.generate_tutorial`` leaves the working directory untouched.
+
+Generates a tutorial offline (``LLM_MODE=fake``) once per render mode and
+execution mode, each in a fresh empty working directory, and exits with status
+1 if any run created a file there (e.g. the LLM HTML task's
+``outputs/{topic}_tutorial.html``). The ``llm`` render mode runs the same HTML
+task that ``auto`` falls back to for unstructured books. Run from the
+repository root::
+
+    PYTHONPATH=src python benchmarks/check_api_writes.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+from typing import List
+
+RENDER_MODES = ("llm", "auto", "local")
+EXECUTION_MODES = ("dag", "sequential")
+
+
+def _created_files(root: str) -> List[str]:
+    return sorted(os.path.relpath(os.path.join(path, name), root) for path, _, names in os.walk(root) for name in names)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--render-modes", default=",".join(RENDER_MODES))
+    parser.add_argument("--execution-modes", default=",".join(EXECUTION_MODES))
+    args = parser.parse_args()
+
+    os.environ.update(LLM_MODE="fake", CREWAI_TRACING_ENABLED="false", OTEL_SDK_DISABLED="true")
+    from learn_anything.api import generate_tutorial
+
+    start_dir = os.getcwd()
+    failures = []
+    for execution_mode in args.execution_modes.split(","):
+        for render_mode in args.render_modes.split(","):
+            with tempfile.TemporaryDirectory() as scratch:
+                os.chdir(scratch)
+                try:
+                    result = asyncio.run(
+                        generate_tutorial(
+                            "Rust Basics", "beginner", "1 week", execution_mode=execution_mode, render_mode=render_mode
+                        )
+                    )
+                    created = _created_files(scratch)
+                finally:
+                    os.chdir(start_dir)
+            status = "ok" if not created else f"FAIL: wrote {', '.join(created)}"
+            print(f"{execution_mode:<11} {render_mode:<6} html={len(result.html):>7} chars  {status}")
+            if created:
+                failures.append((execution_mode, render_mode))
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
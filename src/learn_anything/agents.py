@@ -12,6 +12,7 @@ from .agents_srp import (
     get_tutorial_compiler,
     get_chapter_creator_1,
     get_chapter_creator_2,
+    get_chapter_creator,
     get_structure_analyzer,
     get_html_document_generator,
 )
@@ -23,6 +24,7 @@ __all__ = [
     "get_tutorial_compiler",
     "get_chapter_creator_1",
     "get_chapter_creator_2",
+    "get_chapter_creator",
     "get_structure_analyzer",
     "get_html_document_generator",
 ]
@@ -11,6 +11,7 @@ from .assessment_designer import get_assessment_designer
 from .tutorial_compiler import get_tutorial_compiler
 from .chapter_creator_1 import get_chapter_creator_1
 from .chapter_creator_2 import get_chapter_creator_2
+from .chapter_creator import get_chapter_creator
 from .structure_analyzer import get_structure_analyzer
 from .html_document_generator import get_html_document_generator
 
@@ -21,6 +22,7 @@ __all__ = [
     "get_tutorial_compiler",
     "get_chapter_creator_1",
     "get_chapter_creator_2",
+    "get_chapter_creator",
     "get_structure_analyzer",
     "get_html_document_generator",
 ]
\ No newline at end of file
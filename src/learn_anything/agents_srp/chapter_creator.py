@@ -0,0 +1,18 @@
+from crewai import Agent
+from learn_anything.llm_config import get_llm
+
+
+def get_chapter_creator() -> Agent:
+    """Book Chapter Creator agent for writing one batch of planned chapters."""
+    return Agent(
+        role="Book Chapter Creator",
+        goal="Generate complete, self-contained tutorial book chapters for the chapters of {topic} you are assigned, tailored to {skill_level} learners and the available study time of {time_commitment}.",
+        backstory="""You are a specialized tutorial book author and educational content creator. 
+    You work alongside other chapter authors, each writing a few chapters of the same book 
+    from a shared structure plan. You stay strictly within your assigned chapters, keep 
+    terminology consistent with the plan, and give every chapter the full depth readers 
+    need to master it.""",
+        verbose=True,
+        allow_delegation=False,
+        llm=get_llm("chapter_creator"),
+    )
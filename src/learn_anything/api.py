@@ -0,0 +1,106 @@
+"""Importable async API for generating a tutorial without the CLI.
+
+Example::
+
+    from learn_anything.api import generate_tutorial
+
+    result = await generate_tutorial("Kubernetes", "intermediate", "6 weeks")
+    result.book   # BookPayload, or None when the compiled book is not structured JSON
+    result.html   # complete HTML document
+
+Nothing is written to disk: no ``outputs/`` files (the LLM-rendered HTML, in
+any render mode, stays in the task output) and no run checkpoints.
+``benchmarks/check_api_writes.py`` checks this for every render mode.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional
+
+from crewai import CrewOutput
+
+from learn_anything.book_schema import BookPayload, parse_book_payload
+from learn_anything.crew import ComprehensiveTutorialGeneratorCrew
+from learn_anything.tools import build_html_document
+
+COMPILE_TASK_NAME = "compile_comprehensive_tutorial_book"
+RESOURCES_TASK_NAME = "curate_and_verify_resources"
+ASSESSMENTS_TASK_NAME = "create_assessments_and_exercises"
+
+
+@dataclass
+class TutorialResult:
+    topic: str
+    html: str
+    compiled_book: str
+    book: Optional[BookPayload]
+    crew_output: CrewOutput
+
+
+def _task_raw_output(result: CrewOutput, task_name: str) -> str:
+    for output in result.tasks_output or []:
+        if output.name == task_name and isinstance(output.raw, str):
+            return output.raw
+    return ""
+
+
+def build_tutorial_result(topic: str, crew_output: CrewOutput) -> TutorialResult:
+    """Parse the compiled book and render the HTML from a finished crew output."""
+    compiled_book = _task_raw_output(crew_output, COMPILE_TASK_NAME)
+    if not compiled_book:
+        raise ValueError(f"Crew output has no '{COMPILE_TASK_NAME}' result to render")
+
+    try:
+        book: Optional[BookPayload] = parse_book_payload(compiled_book)
+    except ValueError:
+        book = None
+
+    html = build_html_document(
+        topic,
+        compiled_book,
+        _task_raw_output(crew_output, RESOURCES_TASK_NAME),
+        _task_raw_output(crew_output, ASSESSMENTS_TASK_NAME),
+    )
+    return TutorialResult(topic=topic, html=html, compiled_book=compiled_book, book=book, crew_output=crew_output)
+
+
+async def generate_tutorial(
+    topic: str,
+    skill_level: str = "beginner",
+    time_commitment: str = "",
+    *,
+    execution_mode: Optional[str] = None,
+    render_mode: Optional[str] = None,
+    max_chapter_workers: Optional[int] = None,
+    chapters_per_task: Optional[int] = None,
+) -> TutorialResult:
+    """Generate a tutorial without blocking the event loop.
+
+    The crew runs in a worker thread via ``kickoff_async``; the options mirror
+    the ``run`` CLI flags and fall back to the same environment variables.
+    Cancelling the awaiting task does not stop a generation already running in
+    that thread.
+    """
+    topic = (topic or "").strip()
+    if not topic:
+        raise ValueError("topic is required")
+
+    crew_base = ComprehensiveTutorialGeneratorCrew(
+        execution_mode=execution_mode,
+        max_chapter_workers=max_chapter_workers,
+        chapters_per_task=chapters_per_task,
+        render_mode=render_mode,
+        save_html_file=False,
+    )
+    crew_output = await crew_base.kickoff_async(
+        inputs={"topic": topic, "skill_level": skill_level, "time_commitment": time_commitment}
+    )
+    return build_tutorial_result(topic, crew_output)
+
+
+# Alias for callers that prefer an explicit ``_async`` suffix.
+generate_tutorial_async = generate_tutorial
+
+
+__all__ = ["TutorialResult", "build_tutorial_result", "generate_tutorial", "generate_tutorial_async"]
@@ -0,0 +1,206 @@
+"""Run many tutorial jobs from a JSONL file on a shared worker pool."""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from learn_anything.checkpoints import _write_json_atomic
+
+BATCHES_DIRNAME = "batches"
+BATCH_MANIFEST_FILENAME = "batch.json"
+DEFAULT_BATCH_WORKERS = 2
+
+
+@dataclass
+class BatchJob:
+    job_id: str
+    inputs: Dict[str, str]
+    settings: Dict[str, Any] = field(default_factory=dict)
+
+
+def _safe_job_id(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", value.strip()).strip("_")
+
+
+def load_batch_jobs(
+    path: str,
+    input_fields: Iterable[str],
+    setting_fields: Iterable[str] = (),
+    defaults: Optional[Dict[str, Any]] = None,
+) -> List[BatchJob]:
+    """Read one job per JSONL line.
+
+    Each line is an object with the input fields (``topic`` is required) and,
+    optionally, an ``id`` and per-job overrides of the run settings. Values in
+    ``defaults`` fill in anything a line leaves out. Job ids are made unique so
+    every job gets its own output directory.
+    """
+
+    input_fields = list(input_fields)
+    setting_fields = list(setting_fields)
+    defaults = defaults or {}
+    jobs: List[BatchJob] = []
+    used_ids = set()
+
+    with open(path, encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON ({e})") from e
+            if not isinstance(entry, dict):
+                raise ValueError(f"{path}:{line_number}: expected a JSON object")
+
+            inputs = {key: str(entry.get(key) or defaults.get(key) or "").strip() for key in input_fields}
+            if not inputs.get("topic"):
+                raise ValueError(f"{path}:{line_number}: 'topic' is required")
+            settings = {
+                key: entry[key] if entry.get(key) is not None else defaults.get(key)
+                for key in setting_fields
+            }
+
+            base_id = _safe_job_id(str(entry.get("id") or "")) or (
+                f"{len(jobs) + 1:03d}-{_safe_job_id(inputs['topic'])[:40] or 'job'}"
+            )
+            job_id = base_id
+            suffix = 2
+            while job_id in used_ids:
+                job_id = f"{base_id}-{suffix}"
+                suffix += 1
+            used_ids.add(job_id)
+            jobs.append(BatchJob(job_id=job_id, inputs=inputs, settings=settings))
+    return jobs
+
+
+class BatchRun:
+    """A batch directory holding one subdirectory per job and a summary manifest.
+
+    Layout::
+
+        <output_dir>/batches/<batch_id>/batch.json   per-job status and timing
+        <output_dir>/batches/<batch_id>/<job_id>/    that job's outputs
+    """
+
+    def __init__(self, batch_dir: Path, jobs: List[BatchJob], workers: int):
+        self.batch_dir = Path(batch_dir)
+        self._lock = threading.Lock()
+        self._manifest: Dict[str, Any] = {
+            "batch_id": self.batch_dir.name,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "status": "running",
+            "workers": workers,
+            "jobs": {
+                job.job_id: {
+                    "job_id": job.job_id,
+                    "inputs": job.inputs,
+                    "settings": job.settings,
+                    "status": "pending",
+                    "output_dir": str(self.job_dir(job)),
+                }
+                for job in jobs
+            },
+        }
+
+    @classmethod
+    def create(cls, output_dir: str, jobs: List[BatchJob], workers: int) -> "BatchRun":
+        batch_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        batch = cls(Path(output_dir) / BATCHES_DIRNAME / batch_id, jobs, workers)
+        batch.batch_dir.mkdir(parents=True, exist_ok=True)
+        batch._write()
+        return batch
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.batch_dir / BATCH_MANIFEST_FILENAME
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        with self._lock:
+            return json.loads(json.dumps(self._manifest))
+
+    def job_dir(self, job: BatchJob) -> Path:
+        return self.batch_dir / job.job_id
+
+    def update_job(self, job_id: str, **fields: Any) -> None:
+        with self._lock:
+            self._manifest["jobs"][job_id].update(fields)
+            self._write()
+
+    def finish(self, duration_seconds: float) -> None:
+        with self._lock:
+            jobs = self._manifest["jobs"].values()
+            counts: Dict[str, int] = {}
+            for job in jobs:
+                counts[job["status"]] = counts.get(job["status"], 0) + 1
+            self._manifest["status"] = "failed" if counts.get("failed") else "completed"
+            self._manifest["counts"] = counts
+            self._manifest["duration_seconds"] = round(duration_seconds, 3)
+            self._manifest["finished_at"] = datetime.now().isoformat(timespec="seconds")
+            self._write()
+
+    def _write(self) -> None:
+        _write_json_atomic(self.manifest_path, self._manifest)
+
+
+def run_batch(
+    jobs: List[BatchJob],
+    run_job: Callable[[BatchJob, Path], Dict[str, Any]],
+    output_dir: str,
+    workers: int = DEFAULT_BATCH_WORKERS,
+) -> BatchRun:
+    """Run ``run_job(job, job_dir)`` for every job on a pool of ``workers`` threads.
+
+    Jobs run in one process so crewAI is imported once and shared. A failing job
+    is recorded in the manifest and does not stop the others. ``run_job`` may
+    return extra fields (output paths, run id) to store with the job.
+    """
+
+    workers = max(1, workers)
+    batch = BatchRun.create(output_dir, jobs, workers)
+    batch_started = time.perf_counter()
+
+    def _run_one(job: BatchJob) -> None:
+        job_dir = batch.job_dir(job)
+        job_dir.mkdir(parents=True, exist_ok=True)
+        started = time.perf_counter()
+        batch.update_job(job.job_id, status="running", started_at=datetime.now().isoformat(timespec="seconds"))
+        try:
+            details = run_job(job, job_dir) or {}
+        except Exception as e:
+            batch.update_job(
+                job.job_id,
+                status="failed",
+                error=f"{type(e).__name__}: {e}",
+                traceback=traceback.format_exc(),
+                finished_at=datetime.now().isoformat(timespec="seconds"),
+                duration_seconds=round(time.perf_counter() - started, 3),
+            )
+            return
+        batch.update_job(
+            job.job_id,
+            status="completed",
+            finished_at=datetime.now().isoformat(timespec="seconds"),
+            duration_seconds=round(time.perf_counter() - started, 3),
+            **details,
+        )
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch-job") as pool:
+        list(pool.map(_run_one, jobs))
+
+    batch.finish(time.perf_counter() - batch_started)
+    return batch
+
+
+__all__ = ["BatchJob", "BatchRun", "load_batch_jobs", "run_batch"]
@@ -0,0 +1,202 @@
+"""Assemble the compiled ``BookPayload`` locally from the per-task outputs.
+
+The chapter creators already return structured chapters, so instead of asking
+an LLM to re-emit every chapter the book is merged here: the front matter task
+supplies the title, introduction, and summary, each chapter task supplies its
+chapters, structured resources (when the curator returns JSON) fill the
+supplementary section, and per-chapter quizzes from the assessment designer
+fill chapters that came back without one. Output that is not valid JSON is kept as markdown
+rather than dropped, so assembly never fails on a malformed task result. A
+planned chapter that no task returned (dropped or renumbered) is reported and
+replaced by a placeholder from its plan entry, so the gap is visible in the book.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from learn_anything.book_schema import (
+    BookPayload,
+    ChapterPayload,
+    IntroductionPayload,
+    QuizQuestion,
+    SupplementaryResources,
+    _strip_code_fence,
+)
+from learn_anything.chapter_plan import ChapterPlanItem
+
+_MISSING_CHAPTER_NOTE = "This chapter was planned but the chapter task did not return it; regenerate the book to fill it in."
+
+_CHAPTER_HEADING = re.compile(r"^#{1,4}\s*(?:chapter|ch\.)\s*(\d{1,3})\b.*$", re.IGNORECASE | re.MULTILINE)
+
+
+def _load_json(text: str) -> Any:
+    try:
+        return json.loads(_strip_code_fence(text or ""))
+    except (TypeError, ValueError):
+        return None
+
+
+def _chapters_from_json(data: Any) -> Optional[List[ChapterPayload]]:
+    if isinstance(data, dict):
+        if isinstance(data.get("chapters"), list):
+            data = data["chapters"]
+        elif isinstance(data.get("chapter"), dict):
+            data = [data["chapter"]]
+        elif data.get("title") or data.get("chapter_number"):
+            data = [data]
+    if not isinstance(data, list):
+        return None
+
+    chapters: List[ChapterPayload] = []
+    for entry in data:
+        try:
+            chapters.append(ChapterPayload.from_dict(entry))
+        except (AttributeError, TypeError, ValueError):
+            continue
+    return chapters or None
+
+
+def _chapters_from_markdown(text: str, planned: Sequence[ChapterPlanItem]) -> List[ChapterPayload]:
+    """Keep unstructured chapter output as markdown overviews, split per planned chapter when possible."""
+    text = _strip_code_fence(text or "")
+    titles = {item.chapter_number: item.title for item in planned}
+    headings = list(_CHAPTER_HEADING.finditer(text))
+    if len(planned) > 1 and headings:
+        chapters = []
+        for position, match in enumerate(headings):
+            end = headings[position + 1].start() if position + 1 < len(headings) else len(text)
+            number = int(match.group(1))
+            body = text[match.end():end].strip()
+            chapters.append(ChapterPayload(chapter_number=number, title=titles.get(number, f"Chapter {number}"), overview=body))
+        return chapters
+
+    if headings and not text[:headings[0].start()].strip():
+        # The renderer adds its own chapter heading.
+        text = text[headings[0].end():].strip()
+    if planned:
+        first = planned[0]
+        title = first.title if len(planned) == 1 else " / ".join(item.title for item in planned)
+        return [ChapterPayload(chapter_number=first.chapter_number, title=title, overview=text)]
+    return [ChapterPayload(chapter_number=1, title="Tutorial Content", overview=text)]
+
+
+def parse_chapter_output(text: str, planned: Sequence[ChapterPlanItem] = ()) -> List[ChapterPayload]:
+    """Turn one chapter task result into chapters, filling gaps from its plan entries."""
+    chapters = _chapters_from_json(_load_json(text))
+    if chapters is None:
+        return _chapters_from_markdown(text, planned)
+
+    for position, chapter in enumerate(chapters):
+        item = planned[position] if position < len(planned) else None
+        if not chapter.chapter_number and item is not None:
+            chapter.chapter_number = item.chapter_number
+        if not chapter.title and item is not None:
+            chapter.title = item.title
+    return chapters
+
+
+def parse_front_matter(text: str) -> Tuple[str, IntroductionPayload, str]:
+    """Return ``(title, introduction, summary)`` from the front matter task result."""
+    data = _load_json(text)
+    if isinstance(data, dict) and isinstance(data.get("book"), dict):
+        data = data["book"]
+    if not isinstance(data, dict):
+        return "", IntroductionPayload(topic_overview=_strip_code_fence(text or "")), ""
+
+    try:
+        introduction = IntroductionPayload.from_dict(data.get("introduction") or {})
+    except (AttributeError, TypeError):
+        introduction = IntroductionPayload()
+    title = str(data.get("title") or data.get("book_title") or "").strip()
+    summary = str(data.get("summary") or data.get("conclusion") or data.get("next_steps") or "").strip()
+    return title, introduction, summary
+
+
+def parse_supplementary(text: str) -> SupplementaryResources:
+    """Structured resources when the curator returned JSON; otherwise empty.
+
+    Unstructured curator output is still rendered from the raw task result by
+    the HTML builder, so nothing is lost.
+    """
+    data = _load_json(text)
+    if isinstance(data, dict):
+        data = data.get("supplementary") or data.get("resources") or data
+        try:
+            return SupplementaryResources.from_dict(data)
+        except (AttributeError, TypeError):
+            pass
+    return SupplementaryResources()
+
+
+def parse_chapter_quizzes(text: str) -> Dict[int, List[QuizQuestion]]:
+    """Per-chapter quiz questions from the assessment designer's JSON, keyed by chapter number."""
+    data = _load_json(text)
+    entries = data.get("chapter_quizzes") if isinstance(data, dict) else None
+    quizzes: Dict[int, List[QuizQuestion]] = {}
+    for entry in entries if isinstance(entries, list) else []:
+        if not isinstance(entry, dict):
+            continue
+        try:
+            number = int(entry.get("chapter_number") or 0)
+        except (TypeError, ValueError):
+            continue
+        questions = [QuizQuestion.from_dict(item) for item in entry.get("questions") or []]
+        if number and questions:
+            quizzes.setdefault(number, questions)
+    return quizzes
+
+
+def assemble_book(
+    topic: str,
+    front_matter_text: str,
+    chapter_outputs: Sequence[Tuple[str, Sequence[ChapterPlanItem]]],
+    resources_text: str = "",
+    assessments_text: str = "",
+) -> BookPayload:
+    """Merge the front matter, chapter task results, and resources into one book.
+
+    ``chapter_outputs`` pairs each chapter task's raw output with the planned
+    chapters it was assigned. Chapters are ordered by number and the first
+    occurrence of a number wins. Planned chapters missing from every output
+    are added as placeholders with a warning.
+    """
+    title, introduction, summary = parse_front_matter(front_matter_text)
+
+    chapters: List[ChapterPayload] = []
+    seen = set()
+    for raw, planned in chapter_outputs:
+        for chapter in parse_chapter_output(raw, planned):
+            if chapter.chapter_number and chapter.chapter_number in seen:
+                continue
+            seen.add(chapter.chapter_number)
+            chapters.append(chapter)
+    missing = {item.chapter_number: item for _, planned in chapter_outputs for item in planned if item.chapter_number not in seen}
+    for item in missing.values():
+        print(f"Warning: {item.label} was not returned by its chapter task; inserting a placeholder")
+        chapters.append(ChapterPayload(chapter_number=item.chapter_number, title=item.title, overview=_MISSING_CHAPTER_NOTE))
+    chapters.sort(key=lambda chapter: chapter.chapter_number or 0)
+
+    quizzes = parse_chapter_quizzes(assessments_text)
+    for chapter in chapters:
+        if not chapter.quiz and chapter.chapter_number in quizzes:
+            chapter.quiz = quizzes[chapter.chapter_number]
+
+    return BookPayload(
+        title=title or f"{topic.strip().title()} Tutorial",
+        introduction=introduction,
+        chapters=chapters,
+        supplementary=parse_supplementary(resources_text),
+        summary=summary,
+    )
+
+
+__all__ = [
+    "assemble_book",
+    "parse_chapter_output",
+    "parse_chapter_quizzes",
+    "parse_front_matter",
+    "parse_supplementary",
+]
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, List, Optional
 
+from learn_anything.partial_json import parse_partial_json
+
 
 def _strip_code_fence(text: str) -> str:
     text = text.strip()
@@ -25,7 +26,29 @@ def _ensure_list(value: Any) -> List[Any]:
     return [value]
 
 
-@dataclass
+def _text(value: Any) -> str:
+    if isinstance(value, str):
+        return value.strip()
+    return "" if value is None else str(value).strip()
+
+
+def _texts(value: Any) -> List[str]:
+    """Stripped, non-empty strings from a value or list of values."""
+    if not value:
+        return []
+    if not isinstance(value, list):
+        value = [value]
+    return [text for text in (_text(item) for item in value) if text]
+
+
+def _int_or_none(value: Any) -> Optional[int]:
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(slots=True)
 class SectionBlock:
     title: str = ""
     content: str = ""
@@ -35,13 +58,14 @@ class SectionBlock:
     def from_dict(cls, data: Any) -> "SectionBlock":
         if not isinstance(data, dict):
             return cls(content=str(data or ""))
-        title = (data.get("title") or data.get("heading") or data.get("name") or "").strip()
-        content = (data.get("content") or data.get("body") or data.get("text") or "").strip()
-        kind = (data.get("kind") or data.get("type") or "content").strip()
-        return cls(title=title, content=content, kind=kind)
+        return cls(
+            title=_text(data.get("title") or data.get("heading") or data.get("name")),
+            content=_text(data.get("content") or data.get("body") or data.get("text")),
+            kind=_text(data.get("kind") or data.get("type")) or "content",
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class HandsOnExercise:
     title: str = ""
     objective: str = ""
@@ -53,14 +77,14 @@ class HandsOnExercise:
         if not isinstance(data, dict):
             return cls(title=str(data or ""))
         return cls(
-            title=(data.get("title") or data.get("name") or "").strip(),
-            objective=(data.get("objective") or data.get("goal") or "").strip(),
-            steps=[str(item).strip() for item in _ensure_list(data.get("steps")) if str(item).strip()],
-            solution=(data.get("solution") or data.get("answer") or "").strip(),
+            title=_text(data.get("title") or data.get("name")),
+            objective=_text(data.get("objective") or data.get("goal")),
+            steps=_texts(data.get("steps")),
+            solution=_text(data.get("solution") or data.get("answer")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TroubleshootingItem:
     problem: str = ""
     solution: str = ""
@@ -71,13 +95,13 @@ class TroubleshootingItem:
         if not isinstance(data, dict):
             return cls(problem=str(data or ""))
         return cls(
-            problem=(data.get("problem") or data.get("issue") or data.get("symptom") or "").strip(),
-            solution=(data.get("solution") or data.get("resolution") or "").strip(),
-            notes=(data.get("notes") or data.get("tip") or "").strip(),
+            problem=_text(data.get("problem") or data.get("issue") or data.get("symptom")),
+            solution=_text(data.get("solution") or data.get("resolution")),
+            notes=_text(data.get("notes") or data.get("tip")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class QuizQuestion:
     question: str = ""
     question_type: str = "short_answer"
@@ -90,15 +114,15 @@ class QuizQuestion:
         if not isinstance(data, dict):
             return cls(question=str(data or ""))
         return cls(
-            question=(data.get("question") or data.get("prompt") or "").strip(),
-            question_type=(data.get("question_type") or data.get("type") or "short_answer").strip().lower(),
-            options=[str(opt).strip() for opt in _ensure_list(data.get("options")) if str(opt).strip()],
-            answer=(data.get("answer") or data.get("solution") or "").strip(),
-            explanation=(data.get("explanation") or data.get("rationale") or "").strip(),
+            question=_text(data.get("question") or data.get("prompt")),
+            question_type=_text(data.get("question_type") or data.get("type")).lower() or "short_answer",
+            options=_texts(data.get("options")),
+            answer=_text(data.get("answer") or data.get("solution")),
+            explanation=_text(data.get("explanation") or data.get("rationale")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class IntroductionPayload:
     topic_overview: str = ""
     what_you_will_learn: List[str] = field(default_factory=list)
@@ -111,15 +135,15 @@ class IntroductionPayload:
         if not isinstance(data, dict):
             return cls(topic_overview=str(data or ""))
         return cls(
-            topic_overview=str(data.get("topic_overview") or data.get("overview") or "").strip(),
-            what_you_will_learn=[str(item).strip() for item in _ensure_list(data.get("what_you_will_learn")) if str(item).strip()],
-            target_audience=[str(item).strip() for item in _ensure_list(data.get("target_audience")) if str(item).strip()],
-            how_to_use=[str(item).strip() for item in _ensure_list(data.get("how_to_use")) if str(item).strip()],
-            prerequisites=[str(item).strip() for item in _ensure_list(data.get("prerequisites")) if str(item).strip()],
+            topic_overview=_text(data.get("topic_overview") or data.get("overview")),
+            what_you_will_learn=_texts(data.get("what_you_will_learn")),
+            target_audience=_texts(data.get("target_audience")),
+            how_to_use=_texts(data.get("how_to_use")),
+            prerequisites=_texts(data.get("prerequisites")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ResourceItem:
     name: str = ""
     description: str = ""
@@ -131,14 +155,14 @@ class ResourceItem:
         if not isinstance(data, dict):
             return cls(name=str(data or ""))
         return cls(
-            name=(data.get("name") or data.get("title") or "").strip(),
-            description=(data.get("description") or data.get("summary") or "").strip(),
-            url=(data.get("url") or data.get("link") or "").strip(),
-            access=(data.get("access") or data.get("notes") or "").strip(),
+            name=_text(data.get("name") or data.get("title")),
+            description=_text(data.get("description") or data.get("summary")),
+            url=_text(data.get("url") or data.get("link")),
+            access=_text(data.get("access") or data.get("notes")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GlossaryEntry:
     term: str = ""
     definition: str = ""
@@ -148,12 +172,12 @@ class GlossaryEntry:
         if not isinstance(data, dict):
             return cls(term=str(data or ""))
         return cls(
-            term=(data.get("term") or data.get("word") or "").strip(),
-            definition=(data.get("definition") or data.get("meaning") or "").strip(),
+            term=_text(data.get("term") or data.get("word")),
+            definition=_text(data.get("definition") or data.get("meaning")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SupplementaryResources:
     recommended_tools: List[ResourceItem] = field(default_factory=list)
     external_resources: List[ResourceItem] = field(default_factory=list)
@@ -168,11 +192,11 @@ class SupplementaryResources:
             recommended_tools=[ResourceItem.from_dict(item) for item in _ensure_list(data.get("recommended_tools"))],
             external_resources=[ResourceItem.from_dict(item) for item in _ensure_list(data.get("external_resources"))],
             glossary=[GlossaryEntry.from_dict(item) for item in _ensure_list(data.get("glossary"))],
-            references=[str(item).strip() for item in _ensure_list(data.get("references")) if str(item).strip()],
+            references=_texts(data.get("references")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ChapterPayload:
     chapter_number: int
     title: str
@@ -192,35 +216,25 @@ class ChapterPayload:
     def from_dict(cls, data: Any) -> "ChapterPayload":
         if not isinstance(data, dict):
             raise ValueError("Chapter payload must be a dictionary")
-        chapter_number_raw = data.get("chapter_number") or data.get("number") or data.get("index") or 0
-        try:
-            chapter_number = int(chapter_number_raw)
-        except (TypeError, ValueError):
-            chapter_number = 0
-        estimated_time = data.get("estimated_time_minutes") or data.get("estimated_minutes")
-        try:
-            estimated_time_minutes = int(estimated_time) if estimated_time is not None else None
-        except (TypeError, ValueError):
-            estimated_time_minutes = None
-
+        get = data.get
         return cls(
-            chapter_number=chapter_number,
-            title=(data.get("title") or data.get("name") or "").strip(),
-            estimated_time_minutes=estimated_time_minutes,
-            learning_objectives=[str(item).strip() for item in _ensure_list(data.get("learning_objectives")) if str(item).strip()],
-            overview=(data.get("overview") or data.get("introduction") or "").strip(),
-            theoretical_concepts=[SectionBlock.from_dict(item) for item in _ensure_list(data.get("theoretical_concepts"))],
-            procedures=[SectionBlock.from_dict(item) for item in _ensure_list(data.get("procedures"))],
-            examples=[SectionBlock.from_dict(item) for item in _ensure_list(data.get("examples"))],
-            hands_on_exercises=[HandsOnExercise.from_dict(item) for item in _ensure_list(data.get("hands_on_exercises"))],
-            troubleshooting=[TroubleshootingItem.from_dict(item) for item in _ensure_list(data.get("troubleshooting"))],
-            best_practices=[str(item).strip() for item in _ensure_list(data.get("best_practices")) if str(item).strip()],
-            summary=(data.get("summary") or data.get("recap") or "").strip(),
-            quiz=[QuizQuestion.from_dict(item) for item in _ensure_list(data.get("quiz"))],
+            chapter_number=_int_or_none(get("chapter_number") or get("number") or get("index")) or 0,
+            title=_text(get("title") or get("name")),
+            estimated_time_minutes=_int_or_none(get("estimated_time_minutes") or get("estimated_minutes")),
+            learning_objectives=_texts(get("learning_objectives")),
+            overview=_text(get("overview") or get("introduction")),
+            theoretical_concepts=[SectionBlock.from_dict(item) for item in _ensure_list(get("theoretical_concepts"))],
+            procedures=[SectionBlock.from_dict(item) for item in _ensure_list(get("procedures"))],
+            examples=[SectionBlock.from_dict(item) for item in _ensure_list(get("examples"))],
+            hands_on_exercises=[HandsOnExercise.from_dict(item) for item in _ensure_list(get("hands_on_exercises"))],
+            troubleshooting=[TroubleshootingItem.from_dict(item) for item in _ensure_list(get("troubleshooting"))],
+            best_practices=_texts(get("best_practices")),
+            summary=_text(get("summary") or get("recap")),
+            quiz=[QuizQuestion.from_dict(item) for item in _ensure_list(get("quiz"))],
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BookPayload:
     title: str
     introduction: IntroductionPayload
@@ -236,33 +250,105 @@ class BookPayload:
         if "book" in data and isinstance(data["book"], dict):
             data = data["book"]
 
-        title = (data.get("title") or data.get("book_title") or data.get("name") or "").strip()
-        introduction = IntroductionPayload.from_dict(data.get("introduction") or {})
         chapters = [ChapterPayload.from_dict(item) for item in _ensure_list(data.get("chapters"))]
-        supplementary = SupplementaryResources.from_dict(data.get("supplementary") or data.get("resources") or {})
-        summary = (data.get("summary") or data.get("conclusion") or data.get("next_steps") or "").strip()
-
         if not chapters:
             raise ValueError("Book payload must contain at least one chapter")
+        return cls.from_parts(data, chapters)
 
+    @classmethod
+    def from_parts(cls, data: Dict[str, Any], chapters: List[ChapterPayload]) -> "BookPayload":
+        """Build a book from its non-chapter fields and already parsed chapters."""
         return cls(
-            title=title,
-            introduction=introduction,
+            title=_text(data.get("title") or data.get("book_title") or data.get("name")),
+            introduction=IntroductionPayload.from_dict(data.get("introduction") or {}),
             chapters=chapters,
-            supplementary=supplementary,
-            summary=summary,
+            supplementary=SupplementaryResources.from_dict(data.get("supplementary") or data.get("resources") or {}),
+            summary=_text(data.get("summary") or data.get("conclusion") or data.get("next_steps")),
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form that ``from_dict`` reads back unchanged."""
+        return asdict(self)
 
-def parse_book_payload(raw_text: str) -> BookPayload:
-    """Parse a raw string (possibly fenced) into a BookPayload."""
 
-    cleaned = _strip_code_fence(raw_text)
+# Canonical book fields and the keys ``BookPayload.from_dict`` accepts for them.
+_BOOK_FIELD_KEYS = {
+    "title": ("title", "book_title", "name"),
+    "introduction": ("introduction",),
+    "chapters": ("chapters",),
+    "supplementary": ("supplementary", "resources"),
+    "summary": ("summary", "conclusion", "next_steps"),
+}
+
+
+@dataclass
+class RecoveredBook:
+    """A book parsed from possibly truncated JSON, with what could not be recovered."""
+
+    book: BookPayload
+    # JSON paths such as ``$.chapters[4]`` or ``$.summary`` that need regenerating.
+    missing: List[str] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing
+
+
+def recover_book_payload(raw_text: str) -> RecoveredBook:
+    """Parse a book, keeping every fully-formed chapter and field of a cut-off document.
+
+    A chapter or top-level field that was cut off is left out of the book and
+    reported in ``missing`` rather than rendered half-written; when the text
+    was truncated, book fields that never started are reported too. Raises
+    ``ValueError`` when no complete chapter can be recovered.
+    """
     try:
-        data = json.loads(cleaned)
-    except json.JSONDecodeError as exc:
+        parsed = parse_partial_json(raw_text or "")
+    except ValueError as exc:
         raise ValueError("Provided text is not valid JSON") from exc
-    return BookPayload.from_dict(data)
+    data, prefix = parsed.value, "$"
+    if isinstance(data, dict) and isinstance(data.get("book"), dict):
+        data, prefix = data["book"], "$.book"
+    if not isinstance(data, dict):
+        raise ValueError("Book payload must be a dictionary")
+    if parsed.complete:
+        return RecoveredBook(book=BookPayload.from_dict(data))
+
+    cut = set(parsed.missing)
+    missing: List[str] = []
+    kept: Dict[str, Any] = {}
+    for key, value in data.items():
+        path = f"{prefix}.{key}"
+        if key == "chapters" and isinstance(value, list):
+            chapters = []
+            for index, chapter in enumerate(value):
+                if f"{path}[{index}]" in cut:
+                    missing.append(f"{path}[{index}]")
+                else:
+                    chapters.append(chapter)
+            kept[key] = chapters
+        elif path in cut:
+            missing.append(path)
+        else:
+            kept[key] = value
+    for name, keys in _BOOK_FIELD_KEYS.items():
+        if not any(key in kept for key in keys) and not any(f"{prefix}.{key}" in missing for key in keys):
+            missing.append(f"{prefix}.{name}")
+
+    try:
+        book = BookPayload.from_dict(kept)
+    except ValueError as exc:
+        raise ValueError(f"No complete chapter could be recovered ({', '.join(missing)} missing)") from exc
+    return RecoveredBook(book=book, missing=missing)
+
+
+def parse_book_payload(raw_text: str) -> BookPayload:
+    """Parse a raw string (possibly fenced or truncated) into a BookPayload.
+
+    Use ``recover_book_payload`` to also learn which parts were cut off.
+    """
+
+    return recover_book_payload(raw_text).book
 
 
 __all__ = [
@@ -273,5 +359,7 @@ __all__ = [
     "TroubleshootingItem",
     "QuizQuestion",
     "SupplementaryResources",
+    "RecoveredBook",
     "parse_book_payload",
+    "recover_book_payload",
 ]
@@ -0,0 +1,162 @@
+"""Read a compiled book JSON document one chapter at a time.
+
+``BookPayload.from_dict`` needs the whole document decoded first, so a large
+book is held twice (raw dicts plus dataclasses). The readers here pull the
+text in fixed-size chunks from a path, file object, or socket and decode each
+chapter on its own, so peak memory is bounded by the largest chapter rather
+than the whole book.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import os
+from contextlib import contextmanager
+from typing import IO, Any, Iterator, Tuple, Union
+
+from learn_anything.book_schema import ChapterPayload
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+BookSource = Union[str, "os.PathLike[str]", IO[Any], Any]
+
+
+@contextmanager
+def _open_source(source: BookSource) -> Iterator[IO[Any]]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as stream:
+            yield stream
+    elif hasattr(source, "recv"):
+        # Sockets are read through a buffered file; the socket stays open.
+        with source.makefile("rb") as stream:
+            yield stream
+    elif hasattr(source, "read"):
+        yield source
+    else:
+        raise TypeError(f"Cannot read a book from {type(source).__name__}")
+
+
+class _ChunkReader:
+    """Sliding text window over a stream with just enough lookahead to decode one value."""
+
+    def __init__(self, stream: IO[Any], chunk_size: int) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.stream.read(self.chunk_size)
+        if isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            self.eof = True
+            return False
+        if self.pos >= self.chunk_size:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        self.buffer += chunk
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def advance(self, expected: str) -> None:
+        char = self.peek()
+        if char != expected:
+            raise ValueError(f"Expected {expected!r} in book JSON, found {char or 'end of input'!r}")
+        self.pos += 1
+
+    def seek_document(self) -> None:
+        # Skip a code fence or prose before the document.
+        while True:
+            start = self.buffer.find("{", self.pos)
+            if start != -1:
+                self.pos = start
+                return
+            self.pos = len(self.buffer)
+            if not self.fill():
+                raise ValueError("Book JSON does not contain an object")
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as exc:
+                if not self.fill():
+                    raise ValueError(f"Book JSON is malformed or truncated: {exc}") from exc
+                continue
+            # A number at the end of the window may continue in the next chunk.
+            if end == len(self.buffer) and not isinstance(value, (dict, list, str)) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def _iter_members(reader: _ChunkReader, allow_book: bool) -> Iterator[Tuple[str, Any]]:
+    reader.advance("{")
+    while True:
+        char = reader.peek()
+        if char == "}":
+            reader.pos += 1
+            return
+        if char == ",":
+            reader.pos += 1
+            continue
+        key = reader.value()
+        if not isinstance(key, str):
+            raise ValueError("Book JSON object keys must be strings")
+        reader.advance(":")
+        if key == "chapters" and reader.peek() == "[":
+            reader.pos += 1
+            while True:
+                char = reader.peek()
+                if char == "]":
+                    reader.pos += 1
+                    break
+                if char == ",":
+                    reader.pos += 1
+                    continue
+                yield "chapters", ChapterPayload.from_dict(reader.value())
+        elif key == "book" and allow_book and reader.peek() == "{":
+            yield from _iter_members(reader, allow_book=False)
+        else:
+            yield key, reader.value()
+
+
+def iter_book_parts(source: BookSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """Yield ``(key, value)`` for each top-level book field in document order.
+
+    Each chapter is yielded on its own as ``("chapters", ChapterPayload)``;
+    other fields keep their decoded JSON value. A ``{"book": {...}}`` wrapper
+    is unwrapped.
+    """
+    with _open_source(source) as stream:
+        reader = _ChunkReader(stream, chunk_size)
+        reader.seek_document()
+        yield from _iter_members(reader, allow_book=True)
+
+
+def iter_chapters(source: BookSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[ChapterPayload]:
+    """Yield the book's chapters one at a time from a path, file object, or socket."""
+    for key, value in iter_book_parts(source, chunk_size):
+        if key == "chapters":
+            yield value
+
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "iter_book_parts", "iter_chapters"]
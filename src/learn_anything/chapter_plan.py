@@ -0,0 +1,95 @@
+"""Helpers for turning the chapter structure plan into chapter work items."""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, List
+
+from learn_anything.book_schema import _strip_code_fence
+
+_CHAPTER_LINE = re.compile(
+    r"^[\s#>*_\-|]*(?:chapter|ch\.)\s*(\d{1,3})\s*(?:[:.)\-–—|]|\*\*)+\s*(.+?)\s*$",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+@dataclass
+class ChapterPlanItem:
+    chapter_number: int
+    title: str
+
+    @property
+    def label(self) -> str:
+        return f"Chapter {self.chapter_number}: {self.title}"
+
+
+def _clean_title(title: str) -> str:
+    # Braces would be treated as crewAI input placeholders once the title is
+    # embedded in a task description.
+    cleaned = re.sub(r"[*_`{}]", "", title).strip(" \t:-|")
+    return re.sub(r"\s+", " ", cleaned)
+
+
+def _plan_from_json(text: str) -> List[ChapterPlanItem]:
+    try:
+        data: Any = json.loads(_strip_code_fence(text))
+    except (TypeError, ValueError):
+        return []
+    if isinstance(data, dict):
+        data = data.get("chapters") or data.get("chapter_plan") or []
+    if not isinstance(data, list):
+        return []
+
+    items: List[ChapterPlanItem] = []
+    for position, entry in enumerate(data, start=1):
+        if not isinstance(entry, dict):
+            continue
+        number_raw = entry.get("chapter_number") or entry.get("number") or position
+        try:
+            number = int(number_raw)
+        except (TypeError, ValueError):
+            number = position
+        title = _clean_title(str(entry.get("title") or entry.get("name") or ""))
+        if title:
+            items.append(ChapterPlanItem(chapter_number=number, title=title))
+    return items
+
+
+def parse_chapter_plan(text: str) -> List[ChapterPlanItem]:
+    """Extract the planned chapters from the structure analyzer output.
+
+    Accepts either a JSON document with a ``chapters`` list or free text with
+    ``Chapter <n>: <title>`` lines. The first mention of each chapter number
+    wins, so later references in assignment or dependency sections are ignored.
+    """
+
+    if not text:
+        return []
+
+    items = _plan_from_json(text)
+    if not items:
+        for match in _CHAPTER_LINE.finditer(text):
+            title = _clean_title(match.group(2))
+            if title:
+                items.append(ChapterPlanItem(chapter_number=int(match.group(1)), title=title))
+
+    seen = set()
+    unique: List[ChapterPlanItem] = []
+    for item in items:
+        if item.chapter_number in seen:
+            continue
+        seen.add(item.chapter_number)
+        unique.append(item)
+    return sorted(unique, key=lambda item: item.chapter_number)
+
+
+def batch_chapters(items: List[ChapterPlanItem], chapters_per_task: int) -> List[List[ChapterPlanItem]]:
+    """Split planned chapters into consecutive batches of ``chapters_per_task``."""
+
+    size = max(1, chapters_per_task)
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+__all__ = ["ChapterPlanItem", "batch_chapters", "parse_chapter_plan"]
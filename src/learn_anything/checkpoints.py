@@ -0,0 +1,111 @@
+"""Per-task checkpoints so failed runs can be resumed without redoing finished tasks."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from crewai.tasks.task_output import TaskOutput
+
+RUNS_DIRNAME = "runs"
+MANIFEST_FILENAME = "run.json"
+
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, indent=2)
+    os.replace(tmp_path, path)
+
+
+class RunCheckpoint:
+    """A run directory holding the run inputs and every completed task output.
+
+    Layout::
+
+        <output_dir>/runs/<run_id>/run.json          inputs, settings, status
+        <output_dir>/runs/<run_id>/tasks/<name>.json one TaskOutput per task
+        <output_dir>/runs/<run_id>/telemetry.json    metrics, see ``telemetry``
+    """
+
+    def __init__(self, run_dir: Path):
+        self.run_dir = Path(run_dir)
+        self.tasks_dir = self.run_dir / "tasks"
+        self._lock = threading.Lock()
+
+    @classmethod
+    def create(cls, output_dir: str, inputs: Dict[str, Any], settings: Dict[str, Any]) -> "RunCheckpoint":
+        run_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        checkpoint = cls(Path(output_dir) / RUNS_DIRNAME / run_id)
+        checkpoint.tasks_dir.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(
+            checkpoint.manifest_path,
+            {
+                "run_id": run_id,
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "status": "running",
+                "inputs": inputs,
+                "settings": settings,
+            },
+        )
+        return checkpoint
+
+    @classmethod
+    def load(cls, output_dir: str, run_id: str) -> "RunCheckpoint":
+        checkpoint = cls(Path(output_dir) / RUNS_DIRNAME / run_id)
+        if not checkpoint.manifest_path.exists():
+            raise ValueError(f"No run '{run_id}' found in {checkpoint.run_dir.parent}")
+        return checkpoint
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.run_dir / MANIFEST_FILENAME
+
+    @property
+    def manifest(self) -> Dict[str, Any]:
+        with open(self.manifest_path, encoding="utf-8") as handle:
+            return json.load(handle)
+
+    @property
+    def run_id(self) -> str:
+        return self.run_dir.name
+
+    def set_status(self, status: str) -> None:
+        with self._lock:
+            manifest = self.manifest
+            manifest["status"] = status
+            manifest["updated_at"] = datetime.now().isoformat(timespec="seconds")
+            _write_json_atomic(self.manifest_path, manifest)
+
+    def save_task_output(self, output: TaskOutput) -> None:
+        if not output.name:
+            return
+        data = output.model_dump(mode="json", exclude={"pydantic"})
+        with self._lock:
+            self.tasks_dir.mkdir(parents=True, exist_ok=True)
+            _write_json_atomic(self.tasks_dir / f"{output.name}.json", data)
+
+    def load_task_output(self, task_name: Optional[str]) -> Optional[TaskOutput]:
+        if not task_name:
+            return None
+        path = self.tasks_dir / f"{task_name}.json"
+        if not path.exists():
+            return None
+        from crewai.tasks.task_output import TaskOutput
+
+        with open(path, encoding="utf-8") as handle:
+            return TaskOutput(**json.load(handle))
+
+    def completed_task_names(self) -> List[str]:
+        if not self.tasks_dir.exists():
+            return []
+        return sorted(path.stem for path in self.tasks_dir.glob("*.json"))
+
+
+__all__ = ["RunCheckpoint"]
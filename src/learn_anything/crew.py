@@ -1,15 +1,20 @@
+import asyncio
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional, Tuple
+
 from crewai import LLM
-from crewai import Agent, Crew, Process, Task
+from crewai import Agent, Crew, CrewOutput, Process, Task
 from crewai.project import CrewBase, agent, crew, task
+from crewai.tasks.conditional_task import ConditionalTask
+from crewai.tasks.task_output import TaskOutput
+from crewai.utilities.constants import NOT_SPECIFIED
+from crewai.types.usage_metrics import UsageMetrics
 # Removed SerperDevTool integration per request
 
 
-
-from pydantic import BaseModel
-from jambo import SchemaConverter
-
 # Use Python agent & task factories instead of YAML configs
 from .agents import (
     get_topic_analysis_specialist,
@@ -18,6 +23,7 @@ from .agents import (
     get_tutorial_compiler,
     get_chapter_creator_1,
     get_chapter_creator_2,
+    get_chapter_creator,
     get_structure_analyzer,
     get_html_document_generator,
 )
@@ -26,21 +32,173 @@ from .tasks import (
     get_analyze_chapter_structure_task,
     get_create_assigned_chapters_1_task,
     get_create_assigned_chapters_2_task,
+    get_create_planned_chapters_task,
     get_curate_and_verify_resources_task,
     get_create_assessments_and_exercises_task,
     get_compile_comprehensive_tutorial_task,
     get_convert_tutorial_to_html_format_task,
+    get_write_book_front_matter_task,
 )
+from .book_assembly import assemble_book
+from .book_schema import parse_book_payload
+from .checkpoints import RunCheckpoint
+from .chapter_plan import ChapterPlanItem, batch_chapters, parse_chapter_plan
+from .run_modes import DEFAULT_EXECUTION_MODE, DEFAULT_RENDER_MODE, EXECUTION_MODES, RENDER_MODES
+from .telemetry import RunTelemetry
 
 # Bridge GOOGLE_API_KEY -> GEMINI_API_KEY for LiteLLM/Gemini
 if "GOOGLE_API_KEY" in os.environ and not os.environ.get("GEMINI_API_KEY"):
     os.environ["GEMINI_API_KEY"] = os.environ["GOOGLE_API_KEY"]
 
+# Real upstream tasks for each task, keyed by task method name.
+TASK_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    "analyze_topic_and_requirements": (),
+    "analyze_chapter_structure": ("analyze_topic_and_requirements",),
+    "create_assigned_chapters_1": ("analyze_topic_and_requirements", "analyze_chapter_structure"),
+    "create_assigned_chapters_2": ("analyze_topic_and_requirements", "analyze_chapter_structure"),
+    "curate_and_verify_resources": ("analyze_topic_and_requirements", "analyze_chapter_structure"),
+    "create_assessments_and_exercises": ("analyze_topic_and_requirements", "analyze_chapter_structure"),
+    "compile_comprehensive_tutorial_book": (
+        "analyze_topic_and_requirements",
+        "analyze_chapter_structure",
+        "create_assigned_chapters_1",
+        "create_assigned_chapters_2",
+        "curate_and_verify_resources",
+        "create_assessments_and_exercises",
+    ),
+    "convert_tutorial_to_html_format": ("compile_comprehensive_tutorial_book",),
+}
+
+# Chapter fan-out defaults: one task per planned chapter, four chapter tasks in flight.
+DEFAULT_MAX_CHAPTER_WORKERS = 4
+DEFAULT_CHAPTERS_PER_TASK = 1
+
+
+def _resolve_execution_mode(execution_mode: Optional[str]) -> str:
+    mode = (execution_mode or os.environ.get("CREW_EXECUTION_MODE") or DEFAULT_EXECUTION_MODE).strip().lower()
+    if mode not in EXECUTION_MODES:
+        raise ValueError(f"Unknown execution mode '{mode}'; expected one of {', '.join(EXECUTION_MODES)}")
+    return mode
+
+
+def _resolve_render_mode(render_mode: Optional[str]) -> str:
+    mode = (render_mode or os.environ.get("HTML_RENDER_MODE") or DEFAULT_RENDER_MODE).strip().lower()
+    if mode not in RENDER_MODES:
+        raise ValueError(f"Unknown render mode '{mode}'; expected one of {', '.join(RENDER_MODES)}")
+    return mode
+
+
+def _compiled_book_needs_llm_html(output: TaskOutput) -> bool:
+    """Run the LLM HTML task only when the local renderer cannot use structured data."""
+    try:
+        parse_book_payload(output.raw or "")
+    except ValueError:
+        return True
+    return False
+
+
+def _resolve_positive_int(value: Optional[int], env_key: str, default: int) -> int:
+    if value is None:
+        try:
+            value = int(os.environ.get(env_key, "") or default)
+        except ValueError:
+            value = default
+    if value < 1:
+        raise ValueError(f"{env_key.lower()} must be at least 1, got {value}")
+    return value
+
+
+def _merge_crew_outputs(outputs: List[CrewOutput]) -> CrewOutput:
+    """Combine the outputs of several stage crews into one run-level output."""
+
+    token_usage = UsageMetrics()
+    tasks_output = []
+    for output in outputs:
+        tasks_output.extend(output.tasks_output)
+        if output.token_usage:
+            token_usage.add_usage_metrics(output.token_usage)
+    final = outputs[-1]
+    return CrewOutput(
+        raw=final.raw,
+        pydantic=final.pydantic,
+        json_dict=final.json_dict,
+        tasks_output=tasks_output,
+        token_usage=token_usage,
+    )
+
+
+def _as_unconditional(task: ConditionalTask) -> Task:
+    """Copy a ConditionalTask into a plain Task so it can lead a crew on resume."""
+    data = task.model_dump(exclude={"id", "agent", "context", "tools", "condition", "output"})
+    data = {key: value for key, value in data.items() if value is not None}
+    return Task(**data, agent=task.agent, context=task.context, tools=task.tools)
+
+
+def _schedule_dag(tasks: List[Task], dependencies: Dict[str, Tuple[str, ...]]) -> List[Task]:
+    """Order tasks by dependency level and mark independent siblings as async.
+
+    Each task gets an explicit ``context`` of its upstream tasks. Tasks sharing a
+    level run as async tasks; crewAI joins them when it reaches the next
+    synchronous task, so a level following another async level starts with a
+    synchronous task to keep the join in place.
+    """
+
+    by_name = {scheduled.name: scheduled for scheduled in tasks}
+    remaining = list(tasks)
+    completed = set()
+    ordered: List[Task] = []
+    previous_level_async = False
+
+    while remaining:
+        level = [
+            scheduled
+            for scheduled in remaining
+            if all(dep in completed or dep not in by_name for dep in dependencies.get(scheduled.name, ()))
+        ]
+        if not level:
+            pending = ", ".join(scheduled.name for scheduled in remaining)
+            raise ValueError(f"Task dependencies contain a cycle among: {pending}")
+
+        level_async = len(level) > 1
+        for scheduled in level:
+            scheduled.context = [by_name[dep] for dep in dependencies.get(scheduled.name, ()) if dep in by_name]
+            scheduled.async_execution = level_async
+        if level_async and previous_level_async:
+            level[0].async_execution = False
+
+        ordered.extend(level)
+        completed.update(scheduled.name for scheduled in level)
+        remaining = [scheduled for scheduled in remaining if scheduled not in level]
+        previous_level_async = level_async
+
+    # crewAI only allows a single trailing async task.
+    if ordered and ordered[-1].async_execution:
+        ordered[-1].async_execution = False
+    return ordered
+
+
 @CrewBase
 class ComprehensiveTutorialGeneratorCrew:
     """ComprehensiveTutorialGenerator crew"""
 
-    
+    def __init__(
+        self,
+        execution_mode: Optional[str] = None,
+        max_chapter_workers: Optional[int] = None,
+        chapters_per_task: Optional[int] = None,
+        render_mode: Optional[str] = None,
+        checkpoint: Optional[RunCheckpoint] = None,
+        telemetry: Optional[RunTelemetry] = None,
+        save_html_file: bool = True,
+    ):
+        self._execution_mode = execution_mode
+        self._save_html_file = save_html_file
+        self._render_mode = render_mode
+        self._checkpoint = checkpoint
+        self._telemetry = telemetry
+        self._max_chapter_workers = max_chapter_workers
+        self._chapters_per_task = chapters_per_task
+
     @agent
     def topic_analysis_specialist(self) -> Agent:
         agent = get_topic_analysis_specialist()
@@ -128,7 +286,13 @@ class ComprehensiveTutorialGeneratorCrew:
     
     @task
     def convert_tutorial_to_html_format(self) -> Task:
-        task = get_convert_tutorial_to_html_format_task()
+        condition = None
+        if _resolve_render_mode(self._render_mode) == "auto":
+            condition = _compiled_book_needs_llm_html
+        task = get_convert_tutorial_to_html_format_task(condition=condition)
+        if not self._save_html_file:
+            # Keep the LLM-rendered HTML in the task output only.
+            task.output_file = None
         task.agent = self.html_document_generator()
         task.markdown = False
         return task
@@ -137,15 +301,185 @@ class ComprehensiveTutorialGeneratorCrew:
     @crew
     def crew(self) -> Crew:
         """Creates the ComprehensiveTutorialBookGenerator crew"""
+        tasks = self.tasks  # Automatically created by the @task decorator
+        if _resolve_render_mode(self._render_mode) == "local":
+            tasks = [t for t in tasks if t.name != "convert_tutorial_to_html_format"]
+        if _resolve_execution_mode(self._execution_mode) == "dag":
+            tasks = _schedule_dag(tasks, TASK_DEPENDENCIES)
         return Crew(
             agents=self.agents,  # Automatically created by the @agent decorator
-            tasks=self.tasks,  # Automatically created by the @task decorator
+            tasks=tasks,
             process=Process.sequential,
             verbose=True,
         )
 
-    def _load_response_format(self, name):
-        with open(os.path.join(self.base_directory, "config", f"{name}.json")) as f:
-            json_schema = json.loads(f.read())
+    def kickoff(self, inputs: Optional[Dict[str, Any]] = None) -> CrewOutput:
+        """Run the full pipeline and return one output covering every task.
+
+        In dag mode the chapter structure is planned first, then one chapter task
+        per planned chapter (or per ``chapters_per_task`` batch) runs on a pool of
+        ``max_chapter_workers`` threads while resources, assessments, and the
+        book's front matter are produced alongside. The compiled book is then
+        assembled locally from those outputs (see ``book_assembly``) instead of
+        by the LLM compile task, and, depending on the render mode, the HTML
+        conversion runs last. Other modes kick off the static crew returned by
+        ``crew()``, which keeps the LLM compile task.
+
+        With a ``checkpoint`` every completed task output is saved to the run
+        directory, and tasks whose output is already saved there are restored
+        instead of executed, so a failed run can be resumed.
+
+        With ``telemetry`` the timing, token usage, retries, cache hits and
+        cost of every task and LLM call are recorded in it.
+        """
+        if _resolve_execution_mode(self._execution_mode) != "dag":
+            return self._kickoff_tasks(self.crew().tasks, inputs)
+
+        max_workers = _resolve_positive_int(self._max_chapter_workers, "MAX_CHAPTER_WORKERS", DEFAULT_MAX_CHAPTER_WORKERS)
+        chapters_per_task = _resolve_positive_int(self._chapters_per_task, "CHAPTERS_PER_TASK", DEFAULT_CHAPTERS_PER_TASK)
+
+        topic_task = self.analyze_topic_and_requirements()
+        structure_task = self.analyze_chapter_structure()
+        structure_task.context = [topic_task]
+        planning_output = self._kickoff_tasks([topic_task, structure_task], inputs)
+
+        plan = parse_chapter_plan(structure_task.output.raw if structure_task.output else "")
+        # An unparseable plan falls back to a single task that writes every chapter.
+        batches = batch_chapters(plan, chapters_per_task) or [[]]
+        chapter_tasks = [self._planned_chapters_task(index, batch) for index, batch in enumerate(batches, start=1)]
+        resources_task = self.curate_and_verify_resources()
+        assessments_task = self.create_assessments_and_exercises()
+        support_tasks = [resources_task, assessments_task, self._front_matter_task()]
+        for fanout_task in chapter_tasks + support_tasks:
+            fanout_task.context = [topic_task, structure_task]
+            fanout_task.async_execution = False
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="chapter-creator") as chapter_pool, \
+                ThreadPoolExecutor(max_workers=len(support_tasks), thread_name_prefix="support") as support_pool:
+            futures = [chapter_pool.submit(self._kickoff_tasks, [t], inputs) for t in chapter_tasks]
+            futures += [support_pool.submit(self._kickoff_tasks, [t], inputs) for t in support_tasks]
+            fanout_outputs = [future.result() for future in futures]
+
+        compile_task = self.compile_comprehensive_tutorial_book()
+        if not self._restore_task_output(compile_task):
+            with self._local_task_telemetry(compile_task.name, "local book assembly"):
+                book = assemble_book(
+                    (inputs or {}).get("topic", ""),
+                    support_tasks[-1].output.raw,
+                    [(t.output.raw, batch) for t, batch in zip(chapter_tasks, batches)],
+                    resources_task.output.raw,
+                    assessments_task.output.raw,
+                )
+            compile_task.output = TaskOutput(
+                name=compile_task.name,
+                description=compile_task.description,
+                expected_output=compile_task.expected_output,
+                raw=json.dumps(book.to_dict(), ensure_ascii=False),
+                agent="local book assembly",
+            )
+            if self._checkpoint is not None:
+                self._checkpoint.save_task_output(compile_task.output)
+        stage_outputs = [
+            planning_output,
+            *fanout_outputs,
+            CrewOutput(raw=compile_task.output.raw, tasks_output=[compile_task.output], token_usage=UsageMetrics()),
+        ]
+
+        render_mode = _resolve_render_mode(self._render_mode)
+        if render_mode == "llm" or (render_mode == "auto" and _compiled_book_needs_llm_html(compile_task.output)):
+            html_task = self.convert_tutorial_to_html_format()
+            html_task.context = [compile_task]
+            stage_outputs.append(self._kickoff_tasks([html_task], inputs))
+
+        return _merge_crew_outputs(stage_outputs)
+
+    async def kickoff_async(self, inputs: Optional[Dict[str, Any]] = None) -> CrewOutput:
+        """Run ``kickoff`` off the event loop, like crewAI's ``Crew.kickoff_async``."""
+        return await asyncio.to_thread(self.kickoff, inputs)
+
+    def _front_matter_task(self) -> Task:
+        task = get_write_book_front_matter_task()
+        task.name = "write_book_front_matter"
+        task.agent = self.tutorial_compiler()
+        task.markdown = False
+        return task
+
+    def _planned_chapters_task(self, index: int, chapters: List[ChapterPlanItem]) -> Task:
+        task = get_create_planned_chapters_task(chapters)
+        task.name = f"create_planned_chapters_{index}"
+        task.agent = get_chapter_creator()
+        task.markdown = False
+        return task
+
+    def _kickoff_tasks(self, tasks: List[Task], inputs: Optional[Dict[str, Any]]) -> CrewOutput:
+        """Kick off a crew for ``tasks``, skipping any restored from the checkpoint."""
+        restored: List[TaskOutput] = []
+        pending: List[Task] = []
+        first_pending_position = None
+        for position, stage_task in enumerate(tasks):
+            if self._restore_task_output(stage_task):
+                restored.append(stage_task.output)
+                continue
+            if restored and stage_task.context is NOT_SPECIFIED:
+                # Restored tasks are no longer part of the crew, so make the
+                # implicit "everything before me" context explicit.
+                stage_task.context = list(tasks[:position])
+            if first_pending_position is None:
+                first_pending_position = position
+            pending.append(stage_task)
+
+        if pending and isinstance(pending[0], ConditionalTask):
+            # crewAI refuses a conditional first task, so decide it here from
+            # the restored output it would have been given.
+            previous = tasks[first_pending_position - 1].output if first_pending_position else None
+            if previous is not None and not pending[0].should_execute(previous):
+                pending = pending[1:]
+            else:
+                pending[0] = _as_unconditional(pending[0])
+
+        if not pending:
+            return CrewOutput(
+                raw=restored[-1].raw,
+                json_dict=restored[-1].json_dict,
+                tasks_output=restored,
+                token_usage=UsageMetrics(),
+            )
+
+        agents = []
+        for stage_task in pending:
+            if stage_task.agent not in agents:
+                agents.append(stage_task.agent)
+        if self._telemetry is not None:
+            self._telemetry.watch(pending)
+        crew_output = Crew(
+            agents=agents,
+            tasks=pending,
+            process=Process.sequential,
+            verbose=True,
+            task_callback=self._on_task_completed if self._checkpoint or self._telemetry else None,
+        ).kickoff(inputs=inputs)
+        if restored:
+            crew_output.tasks_output = restored + crew_output.tasks_output
+        return crew_output
+
+    def _restore_task_output(self, task: Task) -> bool:
+        if self._checkpoint is None:
+            return False
+        output = self._checkpoint.load_task_output(task.name)
+        if output is None:
+            return False
+        task.output = output
+        if self._telemetry is not None:
+            self._telemetry.task_restored(task.name)
+        return True
+
+    def _local_task_telemetry(self, name: str, agent: str):
+        if self._telemetry is None:
+            return nullcontext()
+        return self._telemetry.local_task(name, agent)
 
-        return SchemaConverter.build(json_schema)
+    def _on_task_completed(self, output: TaskOutput) -> None:
+        if self._checkpoint is not None:
+            self._checkpoint.save_task_output(output)
+        if self._telemetry is not None:
+            self._telemetry.task_completed(output)
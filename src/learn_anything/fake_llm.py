@@ -0,0 +1,356 @@
+"""Offline stand-in LLM (``LLM_MODE=fake``) and record/replay cassettes.
+
+``FakeLLM`` answers every task with schema-valid JSON, so a whole run
+(guardrails, chapter fan-out, book assembly, rendering) works without a
+network or an API key. An answer is, in order of preference:
+
+1. the next response recorded for the prompt (or, failing that, for the task)
+   in a replay cassette (``FAKE_CASSETTE``),
+2. a canned file from ``FAKE_FIXTURES_DIR`` named after the task or agent
+   (``<task_name>.json``/``.txt`` or ``<agent_name>.json``/``.txt``),
+3. an instance generated from the task's schema in ``task_schemas``, seeded by
+   ``FAKE_SEED`` and the prompt so the same prompt gets the same answer.
+
+Each call sleeps for a latency drawn from a distribution spec (see
+``parse_latency``) plus the output tokens divided by a token rate, and reports
+token usage to LLM callbacks like a real provider. A fraction of calls can
+fail with a rate-limit error to exercise the limiter.
+
+A ``Cassette`` is a JSONL file of recorded calls. ``llm_wrappers.RecordingLLM``
+appends real responses to one (``LLM_RECORD_CASSETTE``) and ``FakeLLM``
+replays them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
+
+from crewai.llms.base_llm import BaseLLM
+
+from learn_anything.rate_limit import estimate_tokens
+from learn_anything.task_schemas import TASK_SCHEMAS
+
+DEFAULT_FAKE_MODEL = "fake/tutorial-writer"
+DEFAULT_ITEMS = 2
+DEFAULT_WORDS = 12
+DEFAULT_CHAPTERS = 6
+# ``FAKE_LATENCY=recorded`` replays the latency stored with cassette entries.
+RECORDED_LATENCY = "recorded"
+
+_PLANNED_CHAPTER = re.compile(r"^\s*-\s*Chapter\s+(\d+):\s*(.+?)\s*$", re.MULTILINE)
+_TASK_SUFFIX = re.compile(r"_\d+$")
+_WORDS = (
+    "cluster configure deploy service pipeline module practice concept example exercise pattern "
+    "workflow debug monitor scale secure test review design build release observe measure tune"
+).split()
+
+Messages = Union[str, List[Dict[str, Any]]]
+
+
+@dataclass
+class FakeUsage:
+    """Token usage in the shape crewAI's ``TokenCalcHandler`` reads from LiteLLM."""
+
+    prompt_tokens: int
+    completion_tokens: int
+    prompt_tokens_details: Any = None
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+def parse_latency(spec: Optional[str]) -> Callable[[random.Random], float]:
+    """Return a sampler (seconds) for a latency spec.
+
+    ``"0.8"`` is a fixed latency; ``"uniform:0.2:1.5"``, ``"normal:1.0:0.3"``,
+    ``"lognormal:0.0:0.5"`` (mu and sigma of the underlying normal) and
+    ``"exponential:1.0"`` (mean) draw from a distribution. Samples are never
+    negative.
+    """
+    spec = (spec or "0").strip().lower()
+    name, _, params = spec.partition(":")
+    try:
+        if not params:
+            value = float(name)
+            return lambda rnd: value
+        args = [float(part) for part in params.split(":")]
+        if name == "uniform":
+            low, high = args
+            return lambda rnd: rnd.uniform(low, high)
+        if name == "normal":
+            mean, stddev = args
+            return lambda rnd: max(0.0, rnd.gauss(mean, stddev))
+        if name == "lognormal":
+            mu, sigma = args
+            return lambda rnd: rnd.lognormvariate(mu, sigma)
+        if name == "exponential":
+            (mean,) = args
+            return lambda rnd: rnd.expovariate(1.0 / mean) if mean > 0 else 0.0
+    except ValueError:
+        pass
+    raise ValueError(f"Invalid latency spec '{spec}'; use e.g. 0.5, uniform:0.2:1.5, normal:1:0.3, lognormal:0:0.5 or exponential:1")
+
+
+def prompt_key(messages: Messages) -> str:
+    """Hash of the prompt alone, so recordings replay under any model name."""
+    return hashlib.sha256(json.dumps(messages, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _base_task_name(name: str) -> str:
+    return name if name in TASK_SCHEMAS else _TASK_SUFFIX.sub("", name)
+
+
+class Cassette:
+    """Recorded LLM calls in a JSONL file, one ``{"key", "task", "response", ...}`` per line.
+
+    Entries are replayed in recorded order, first by prompt and then, for
+    prompts that changed since recording, by task name. Appends are
+    thread-safe.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._by_key: Dict[str, Deque[Dict[str, Any]]] = {}
+        self._by_task: Dict[str, Deque[Dict[str, Any]]] = {}
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as handle:
+                for line in handle:
+                    if line.strip():
+                        self._index(json.loads(line))
+
+    def _index(self, entry: Dict[str, Any]) -> None:
+        self._by_key.setdefault(entry.get("key", ""), deque()).append(entry)
+        self._by_task.setdefault(entry.get("task") or "", deque()).append(entry)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._by_key.values())
+
+    def next_response(self, key: str, task: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            for index, name in ((self._by_key, key), (self._by_task, task)):
+                entries = index.get(name)
+                while entries:
+                    entry = entries.popleft()
+                    if not entry.get("_used"):
+                        entry["_used"] = True
+                        return entry
+        return None
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(line + "\n")
+
+
+@lru_cache(maxsize=None)
+def get_cassette(path: str) -> Cassette:
+    """Return the process-wide cassette for ``path`` so every LLM shares one replay order."""
+    return Cassette(Path(path))
+
+
+class _Generator:
+    """Builds schema instances from a seeded ``random.Random``."""
+
+    def __init__(self, rnd: random.Random, items: int, words: int):
+        self.rnd = rnd
+        self.items = max(1, items)
+        self.words = max(1, words)
+
+    def phrase(self, count: int) -> str:
+        return " ".join(self.rnd.choice(_WORDS) for _ in range(count))
+
+    def text(self, label: str) -> str:
+        return f"{label.replace('_', ' ').capitalize()}: {self.phrase(self.words)}."
+
+    def value(self, schema: Dict[str, Any], label: str = "text") -> Any:
+        if "enum" in schema:
+            return self.rnd.choice(schema["enum"])
+        kind = schema.get("type")
+        if kind == "object":
+            return {key: self.value(sub, key) for key, sub in schema.get("properties", {}).items()}
+        if kind == "array":
+            count = max(self.items, schema.get("minItems", 0))
+            return [self.value(schema.get("items", {}), label.rstrip("s") or label) for _ in range(count)]
+        if kind == "integer":
+            return max(schema.get("minimum", 1), self.rnd.randint(1, 90))
+        if kind == "number":
+            return round(self.rnd.uniform(1, 90), 2)
+        if kind == "boolean":
+            return self.rnd.random() < 0.5
+        return self.text(label)
+
+    def chapters(self, chapter_schema: Dict[str, Any], planned: List[tuple]) -> List[Dict[str, Any]]:
+        chapters = []
+        for number, title in planned:
+            chapter = self.value(chapter_schema, "chapter")
+            chapter["chapter_number"] = number
+            chapter["title"] = title
+            if "focus" in chapter:
+                chapter["focus"] = self.text("focus")
+            chapters.append(chapter)
+        return chapters
+
+
+def _prompt_text(messages: Messages) -> str:
+    if isinstance(messages, str):
+        return messages
+    return "\n".join(str(message.get("content", "")) for message in messages)
+
+
+class FakeLLM(BaseLLM):
+    """crewAI LLM that answers locally; see the module docstring."""
+
+    def __init__(
+        self,
+        model: str = DEFAULT_FAKE_MODEL,
+        temperature: Optional[float] = 0.0,
+        agent_name: Optional[str] = None,
+        latency: Optional[str] = None,
+        tokens_per_second: float = 0.0,
+        rate_limit_error_rate: float = 0.0,
+        seed: str = "0",
+        items: int = DEFAULT_ITEMS,
+        words: int = DEFAULT_WORDS,
+        chapters: int = DEFAULT_CHAPTERS,
+        fixtures_dir: Optional[str] = None,
+        cassette: Optional[Cassette] = None,
+    ):
+        super().__init__(model=model, temperature=temperature)
+        self.agent_name = agent_name or ""
+        self._latency_spec = (latency or "0").strip().lower()
+        self._latency = None if self._latency_spec == RECORDED_LATENCY else parse_latency(self._latency_spec)
+        self._tokens_per_second = max(0.0, tokens_per_second)
+        self._rate_limit_error_rate = min(1.0, max(0.0, rate_limit_error_rate))
+        self._seed = seed
+        self._items = items
+        self._words = words
+        self._chapters = max(1, chapters)
+        self._fixtures_dir = Path(fixtures_dir) if fixtures_dir else None
+        self._cassette = cassette
+        self._attempts: Dict[str, int] = {}
+        self._attempts_lock = threading.Lock()
+
+    def call(
+        self,
+        messages: Messages,
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        task_name = str(getattr(from_task, "name", "") or "")
+        key = prompt_key(messages)
+        rnd = random.Random(f"{self._seed}:{task_name}:{key}")
+        if self._rate_limit_error_rate and self._fails(task_name, key):
+            raise RuntimeError("429 Too Many Requests: rate limit exceeded (fake provider)")
+
+        recorded = self._cassette.next_response(key, task_name) if self._cassette is not None else None
+        if recorded is not None:
+            response = recorded["response"]
+        else:
+            response = self._fixture(task_name) or self._generate(task_name, messages, from_task, rnd)
+
+        usage = (recorded or {}).get("usage") or {}
+        prompt_tokens = int(usage.get("prompt_tokens") or estimate_tokens(messages))
+        completion_tokens = int(usage.get("completion_tokens") or estimate_tokens(response))
+
+        if self._latency is not None:
+            delay = self._latency(rnd)
+        else:
+            delay = float((recorded or {}).get("latency_seconds") or 0.0)
+        if self._tokens_per_second:
+            delay += completion_tokens / self._tokens_per_second
+        if delay > 0:
+            time.sleep(delay)
+
+        for callback in callbacks or []:
+            if hasattr(callback, "log_success_event"):
+                callback.log_success_event(
+                    kwargs={"model": self.model},
+                    response_obj={"usage": FakeUsage(prompt_tokens, completion_tokens)},
+                    start_time=0,
+                    end_time=0,
+                )
+        return response
+
+    def _fails(self, task_name: str, key: str) -> bool:
+        """Draw an injected rate-limit error, independently for each attempt at a prompt."""
+        with self._attempts_lock:
+            attempt = self._attempts.get(key, 0)
+            self._attempts[key] = attempt + 1
+        return random.Random(f"{self._seed}:{task_name}:{key}:{attempt}").random() < self._rate_limit_error_rate
+
+    def _fixture(self, task_name: str) -> Optional[str]:
+        if self._fixtures_dir is None:
+            return None
+        for stem in (task_name, _base_task_name(task_name), self.agent_name):
+            for suffix in (".json", ".txt"):
+                path = self._fixtures_dir / f"{stem}{suffix}"
+                if stem and path.is_file():
+                    return _final_answer(path.read_text(encoding="utf-8"))
+        return None
+
+    def _generate(self, task_name: str, messages: Messages, task: Any, rnd: random.Random) -> str:
+        prompt = _prompt_text(messages)
+        generator = _Generator(rnd, self._items, self._words)
+        schema = TASK_SCHEMAS.get(_base_task_name(task_name))
+        if schema is None:
+            if "html" in task_name:
+                title = generator.text("tutorial")
+                return _final_answer(f"<!DOCTYPE html><html><head><title>{title}</title></head><body><h1>{title}</h1></body></html>")
+            # Untracked calls (e.g. schema repair prompts) get a bare JSON object.
+            return "{}" if task is None else _final_answer(generator.text("answer"))
+
+        data = generator.value(schema, "book")
+        chapter_schema = schema.get("properties", {}).get("chapters", {}).get("items")
+        if chapter_schema is not None:
+            planned = [(int(number), title) for number, title in _PLANNED_CHAPTER.findall(prompt)]
+            if not planned:
+                planned = [(number, f"Part {number}: {generator.phrase(3).title()}") for number in range(1, self._chapters + 1)]
+            data["chapters"] = generator.chapters(chapter_schema, planned)
+        if "chapter_quizzes" in data:
+            for number, quiz in enumerate(data["chapter_quizzes"], start=1):
+                quiz["chapter_number"] = number
+        return _final_answer(json.dumps(data, ensure_ascii=False))
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+    def supports_stop_words(self) -> bool:
+        return False
+
+    def get_context_window_size(self) -> int:
+        return 1_000_000
+
+
+def _final_answer(text: str) -> str:
+    # crewAI's agent executor (without tools) expects the ReAct final-answer form.
+    if "Final Answer:" in text:
+        return text
+    return f"Thought: I now know the final answer\nFinal Answer: {text}"
+
+
+__all__ = [
+    "Cassette",
+    "DEFAULT_FAKE_MODEL",
+    "FakeLLM",
+    "FakeUsage",
+    "get_cassette",
+    "parse_latency",
+    "prompt_key",
+]
@@ -2,9 +2,13 @@ import os
 import re
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
-from crewai import LLM
+from learn_anything.llm_cache import get_response_cache
+from learn_anything.rate_limit import get_rate_limiter
+
+if TYPE_CHECKING:
+    from crewai import LLM
 
 _ENV_LOADED = False
 
@@ -59,6 +63,20 @@ def _mode_defaults(mode: str) -> Dict[str, str]:
             "provider": os.environ.get("BEDROCK_PROVIDER", "bedrock"),
             "model": os.environ.get("BEDROCK_MODEL", "anthropic.claude-3-haiku-20240307-v1:0"),
             "temperature": os.environ.get("BEDROCK_TEMPERATURE", "0.5"),
+            "requests_per_minute": os.environ.get("BEDROCK_REQUESTS_PER_MINUTE", "60"),
+            "tokens_per_minute": os.environ.get("BEDROCK_TOKENS_PER_MINUTE", "400000"),
+            "max_in_flight": os.environ.get("BEDROCK_MAX_IN_FLIGHT", "8"),
+        }
+
+    if mode == "fake":
+        # Offline stand-in (see fake_llm); unlimited unless FAKE_* limits are set.
+        return {
+            "provider": "fake",
+            "model": os.environ.get("FAKE_MODEL", "fake/tutorial-writer"),
+            "temperature": "0",
+            "requests_per_minute": os.environ.get("FAKE_REQUESTS_PER_MINUTE", "0"),
+            "tokens_per_minute": os.environ.get("FAKE_TOKENS_PER_MINUTE", "0"),
+            "max_in_flight": os.environ.get("FAKE_MAX_IN_FLIGHT", "0"),
         }
 
     # Local Gemini mode (default)
@@ -66,6 +84,9 @@ def _mode_defaults(mode: str) -> Dict[str, str]:
         "provider": os.environ.get("LOCAL_LLM_PROVIDER", "gemini"),
         "model": os.environ.get("GEMINI_MODEL", "gemini/gemini-2.0-flash"),
         "temperature": os.environ.get("LLM_TEMPERATURE", "0.7"),
+        "requests_per_minute": os.environ.get("GEMINI_REQUESTS_PER_MINUTE", "60"),
+        "tokens_per_minute": os.environ.get("GEMINI_TOKENS_PER_MINUTE", "1000000"),
+        "max_in_flight": os.environ.get("GEMINI_MAX_IN_FLIGHT", "8"),
     }
 
 
@@ -90,9 +111,49 @@ def _coerce_float(value: str, default: float) -> float:
         return default
 
 
+def _fake_llm(agent_key: Optional[str], model: str) -> "LLM":
+    """Build the offline LLM; every FAKE_* setting can be overridden per agent."""
+    from learn_anything.fake_llm import DEFAULT_CHAPTERS, DEFAULT_ITEMS, DEFAULT_WORDS, FakeLLM, get_cassette
+
+    def setting(suffix: str, default: str) -> str:
+        return _get_agent_setting(agent_key, f"FAKE_{suffix}", os.environ.get(f"FAKE_{suffix}", default))
+
+    cassette_path = setting("CASSETTE", "").strip()
+    return FakeLLM(
+        model=model,
+        agent_name=(agent_key or "").lower(),
+        latency=setting("LATENCY", "0"),
+        tokens_per_second=_coerce_float(setting("TOKENS_PER_SECOND", "0"), 0.0),
+        rate_limit_error_rate=_coerce_float(setting("RATE_LIMIT_ERROR_RATE", "0"), 0.0),
+        seed=setting("SEED", "0"),
+        items=int(_coerce_float(setting("ITEMS", str(DEFAULT_ITEMS)), DEFAULT_ITEMS)),
+        words=int(_coerce_float(setting("WORDS", str(DEFAULT_WORDS)), DEFAULT_WORDS)),
+        chapters=int(_coerce_float(setting("CHAPTERS", str(DEFAULT_CHAPTERS)), DEFAULT_CHAPTERS)),
+        fixtures_dir=setting("FIXTURES_DIR", "") or None,
+        cassette=get_cassette(cassette_path) if cassette_path else None,
+    )
+
+
 @lru_cache(maxsize=None)
-def get_llm(agent_name: Optional[str] = None) -> LLM:
-    """Construct an LLM instance, allowing per-agent overrides and multiple modes."""
+def get_llm(agent_name: Optional[str] = None) -> "LLM":
+    """Construct an LLM instance, allowing per-agent overrides and multiple modes.
+
+    ``LLM_MODE=fake`` answers locally with a ``fake_llm.FakeLLM`` (no network
+    or API key); ``LLM_RECORD_CASSETTE`` records the provider's responses for
+    it to replay.
+
+    Calls are paced by a rate limiter shared by every LLM of the same mode and
+    provider (disable with ``LLM_RATE_LIMIT=off``). When ``LLM_CACHE`` is
+    enabled the LLM is also wrapped so identical prompts are answered from the
+    on-disk response cache without touching the limiter. Outermost, calls made
+    for a task a ``RunTelemetry`` watches are metered (disable with
+    ``LLM_TELEMETRY=off``).
+    """
+    # crewAI and LiteLLM take seconds to import; load them with the first LLM.
+    from crewai import LLM
+
+    from learn_anything.llm_wrappers import CachedLLM, MeteredLLM, RateLimitedLLM, RecordingLLM
+
     _load_env_file()
     mode = os.environ.get("LLM_MODE", "local").strip().lower() or "local"
     defaults = _mode_defaults(mode)
@@ -121,4 +182,31 @@ def get_llm(agent_name: Optional[str] = None) -> LLM:
         if region:
             llm_kwargs["region_name"] = region
 
-    return LLM(**llm_kwargs)
\ No newline at end of file
+    if mode == "fake":
+        llm = _fake_llm(agent_key, model)
+    else:
+        llm = LLM(**llm_kwargs)
+
+    cassette_path = os.environ.get("LLM_RECORD_CASSETTE", "").strip()
+    if cassette_path and mode != "fake":
+        from learn_anything.fake_llm import get_cassette
+
+        llm = RecordingLLM(llm, get_cassette(cassette_path))
+
+    if os.environ.get("LLM_RATE_LIMIT", "on").strip().lower() not in {"0", "false", "no", "off"}:
+        limiter = get_rate_limiter(
+            f"{mode}:{provider_normalized or 'default'}",
+            requests_per_minute=_coerce_float(defaults["requests_per_minute"], 0),
+            tokens_per_minute=_coerce_float(defaults["tokens_per_minute"], 0),
+            max_in_flight=int(_coerce_float(defaults["max_in_flight"], 0)),
+        )
+        if limiter is not None:
+            llm = RateLimitedLLM(llm, limiter)
+
+    cache = get_response_cache()
+    if cache is not None:
+        llm = CachedLLM(llm, cache, provider=provider_normalized or mode)
+
+    if os.environ.get("LLM_TELEMETRY", "on").strip().lower() not in {"0", "false", "no", "off"}:
+        llm = MeteredLLM(llm)
+    return llm
\ No newline at end of file
@@ -0,0 +1,273 @@
+"""LLM wrappers layered around the crewAI ``LLM`` returned by ``get_llm``."""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from crewai.llms.base_llm import BaseLLM
+
+from learn_anything import telemetry
+from learn_anything.llm_cache import ResponseCache, make_cache_key
+from learn_anything.rate_limit import ProviderRateLimiter, estimate_tokens, is_rate_limit_error
+
+
+class DelegatingLLM(BaseLLM):
+    """Base wrapper that forwards everything it does not override to ``inner``.
+
+    ``stop`` is proxied so stop words added by crewAI's agent executor reach the
+    wrapped LLM.
+    """
+
+    def __init__(self, inner: BaseLLM):
+        self._inner = inner
+        super().__init__(model=inner.model, temperature=inner.temperature, stop=inner.stop)
+
+    @property
+    def inner(self) -> BaseLLM:
+        return self._inner
+
+    @property
+    def stop(self) -> List[str]:
+        return self._inner.stop
+
+    @stop.setter
+    def stop(self, value: List[str]) -> None:
+        self._inner.stop = value
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        return self._inner.call(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+        )
+
+    def supports_function_calling(self) -> bool:
+        return self._inner.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self._inner.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self._inner.get_context_window_size()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes missing on the wrapper itself.
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
+
+
+class CachedLLM(DelegatingLLM):
+    """Serve repeated prompts from a ``ResponseCache`` instead of the provider.
+
+    Calls that pass tools or callable functions are never cached because their
+    result depends on side effects rather than the prompt alone.
+    """
+
+    def __init__(self, inner: BaseLLM, cache: ResponseCache, provider: str = ""):
+        super().__init__(inner)
+        self._cache = cache
+        self._provider = provider
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        if tools or available_functions:
+            return super().call(messages, tools, callbacks, available_functions, from_task, from_agent)
+
+        key = make_cache_key(self.model, self._provider, self.temperature, messages, self.stop)
+        cached = self._cache.get(key)
+        if cached is not None:
+            telemetry.note_cache_hit()
+            return cached
+
+        response = super().call(messages, tools, callbacks, available_functions, from_task, from_agent)
+        if isinstance(response, str) and response.strip():
+            self._cache.put(key, response)
+        return response
+
+
+class RateLimitedLLM(DelegatingLLM):
+    """Pace calls through a shared ``ProviderRateLimiter``.
+
+    Rate-limit errors are reported to the limiter (which lowers the rate) and
+    retried here up to ``max_retries`` times, so crewAI's own retries are only
+    spent on other failures.
+    """
+
+    def __init__(self, inner: BaseLLM, limiter: ProviderRateLimiter, max_retries: int = 3):
+        super().__init__(inner)
+        self._limiter = limiter
+        self._max_retries = max(0, max_retries)
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        estimated_tokens = estimate_tokens(messages)
+        attempt = 0
+        while True:
+            try:
+                queued = time.perf_counter()
+                with self._limiter.slot(estimated_tokens):
+                    telemetry.note_rate_limit_wait(time.perf_counter() - queued)
+                    response = super().call(messages, tools, callbacks, available_functions, from_task, from_agent)
+            except Exception as e:
+                if not is_rate_limit_error(e):
+                    raise
+                self._limiter.on_rate_limited()
+                if attempt >= self._max_retries:
+                    raise
+                attempt += 1
+                delay = self._limiter.retry_delay()
+                telemetry.note_retry(delay)
+                time.sleep(delay)
+                continue
+            self._limiter.on_success()
+            if isinstance(response, str):
+                self._limiter.record_tokens(estimate_tokens(response))
+            return response
+
+
+class _UsageCollector:
+    """LLM callback receiving the provider's token usage, like crewAI's ``TokenCalcHandler``."""
+
+    def __init__(self) -> None:
+        self.usage: Any = None
+
+    def log_success_event(self, kwargs: Any, response_obj: Any, start_time: Any, end_time: Any) -> None:
+        if isinstance(response_obj, dict) and response_obj.get("usage"):
+            self.usage = response_obj["usage"]
+
+
+def _usage_field(usage: Any, name: str) -> Any:
+    return usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+
+
+class MeteredLLM(DelegatingLLM):
+    """Record every call in the ``RunTelemetry`` watching the calling task.
+
+    Token counts come from the usage the provider reports to LLM callbacks,
+    falling back to estimates (cache hits, providers without usage). Calls
+    from tasks no run is watching pass straight through.
+    """
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        run = telemetry.telemetry_for_task(from_task)
+        if run is None:
+            return super().call(messages, tools, callbacks, available_functions, from_task, from_agent)
+
+        collector = _UsageCollector()
+        record = telemetry.LLMCallRecord(
+            task=getattr(from_task, "name", None) or telemetry.UNATTRIBUTED_TASK,
+            agent=str(getattr(from_agent or getattr(from_task, "agent", None), "role", "") or "").strip(),
+            model=self.model,
+        )
+        token = telemetry.begin_call(record)
+        started = time.perf_counter()
+        response: Any = None
+        try:
+            response = super().call(
+                messages, tools, [*(callbacks or []), collector], available_functions, from_task, from_agent
+            )
+            return response
+        except Exception as e:
+            record.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            record.duration_seconds = round(time.perf_counter() - started, 3)
+            telemetry.end_call(token)
+            usage = collector.usage
+            if usage is not None:
+                record.input_tokens = int(_usage_field(usage, "prompt_tokens") or 0)
+                record.output_tokens = int(_usage_field(usage, "completion_tokens") or 0)
+                details = _usage_field(usage, "prompt_tokens_details")
+                record.cached_input_tokens = int(_usage_field(details, "cached_tokens") or 0)
+            else:
+                record.tokens_estimated = True
+                record.input_tokens = estimate_tokens(messages)
+                record.output_tokens = estimate_tokens(response) if isinstance(response, str) else 0
+            if not record.cache_hit:
+                record.cost_usd = telemetry.estimate_cost(self.model, record.input_tokens, record.output_tokens)
+            run.record_call(record)
+
+
+class RecordingLLM(DelegatingLLM):
+    """Append every successful provider call to a ``fake_llm.Cassette`` for later replay.
+
+    It wraps the provider LLM directly, so the recorded latency excludes rate
+    limiting and cache hits are not recorded again.
+    """
+
+    def __init__(self, inner: BaseLLM, cassette: Any):
+        super().__init__(inner)
+        self._cassette = cassette
+
+    def call(
+        self,
+        messages: Union[str, List[Dict[str, str]]],
+        tools: Optional[List[dict]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Optional[Any] = None,
+        from_agent: Optional[Any] = None,
+    ) -> Union[str, Any]:
+        from learn_anything.fake_llm import prompt_key
+
+        collector = _UsageCollector()
+        started = time.perf_counter()
+        response = super().call(
+            messages, tools, [*(callbacks or []), collector], available_functions, from_task, from_agent
+        )
+        if isinstance(response, str):
+            usage = collector.usage
+            self._cassette.record(
+                {
+                    "key": prompt_key(messages),
+                    "task": getattr(from_task, "name", None) or "",
+                    "model": self.model,
+                    "latency_seconds": round(time.perf_counter() - started, 3),
+                    "usage": {
+                        "prompt_tokens": int(_usage_field(usage, "prompt_tokens") or 0),
+                        "completion_tokens": int(_usage_field(usage, "completion_tokens") or 0),
+                    }
+                    if usage is not None
+                    else None,
+                    "response": response,
+                }
+            )
+        return response
+
+
+__all__ = ["CachedLLM", "DelegatingLLM", "MeteredLLM", "RateLimitedLLM", "RecordingLLM"]
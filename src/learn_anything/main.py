@@ -3,9 +3,22 @@ import argparse
 import sys
 import os
 import json
+from contextlib import nullcontext
 from datetime import datetime
-from learn_anything.crew import ComprehensiveTutorialGeneratorCrew
-from learn_anything.tools import build_html_document
+from learn_anything.batch import DEFAULT_BATCH_WORKERS, load_batch_jobs, run_batch
+from learn_anything.checkpoints import RunCheckpoint
+from learn_anything.profiling import PROFILE_DIRNAME, profile_stage, profiling
+from learn_anything.render import RenderJob, find_artifacts, render_artifacts, safe_filename, write_html_output
+from learn_anything.run_modes import EXECUTION_MODES, HTML_FORMATS, RENDER_MODES
+from learn_anything.telemetry import (
+    REPORT_GROUPS,
+    TELEMETRY_FILENAME,
+    RunTelemetry,
+    aggregate_runs,
+    find_telemetry_files,
+    format_report,
+    telemetry_path_for,
+)
 
 # Input fields expected by tasks/agents
 INPUT_FIELDS = [
@@ -14,6 +27,23 @@ INPUT_FIELDS = [
     "time_commitment",
 ]
 
+# Run options persisted with each checkpointed run so `resume` reproduces them
+RUN_SETTING_FIELDS = [
+    "execution_mode",
+    "render_mode",
+    "max_chapter_workers",
+    "chapters_per_task",
+    "output_basename",
+]
+
+
+def _crew(**kwargs):
+    # crewAI, LiteLLM and every agent and task factory load here rather than at
+    # CLI start-up, so `render` and `--help` never import them.
+    from learn_anything.crew import ComprehensiveTutorialGeneratorCrew
+
+    return ComprehensiveTutorialGeneratorCrew(**kwargs)
+
 
 def _prompt_for_inputs(defaults=None):
     """Prompt for all inputs via CLI (interactive)."""
@@ -48,7 +78,7 @@ def _build_inputs_from_args(args, interactive=False):
 def run():
     """Run the crew, prompting for inputs interactively when invoked via console script."""
     inputs = _prompt_for_inputs()
-    result = ComprehensiveTutorialGeneratorCrew().crew().kickoff(inputs=inputs)
+    result = _crew().kickoff(inputs=inputs)
     try:
         _rebuild_html_output(result, inputs)
     except Exception as e:
@@ -57,13 +87,136 @@ def run():
 
 def cmd_run(args):
     inputs = _build_inputs_from_args(args, interactive=args.interactive)
-    result = ComprehensiveTutorialGeneratorCrew().crew().kickoff(inputs=inputs)
+    settings = {field: getattr(args, field, None) for field in RUN_SETTING_FIELDS}
+    checkpoint = RunCheckpoint.create(_output_dir(args), inputs, settings)
+    print(f"Run id: {checkpoint.run_id} (resume with: resume --run-id {checkpoint.run_id})")
+    with _profiling(args, checkpoint):
+        result, telemetry = _kickoff_checkpointed(inputs, settings, checkpoint)
+        _finish_run(result, inputs, args, telemetry)
+
+
+def cmd_resume(args):
+    checkpoint = RunCheckpoint.load(_output_dir(args), args.run_id)
+    manifest = checkpoint.manifest
+    inputs = manifest.get("inputs", {})
+    settings = manifest.get("settings", {})
+    completed = checkpoint.completed_task_names()
+    print(f"Resuming run {checkpoint.run_id}; {len(completed)} completed task(s) restored: {', '.join(completed) or 'none'}")
+
+    args.topic = inputs.get("topic", "")
+    args.output_basename = args.output_basename or settings.get("output_basename")
+    with _profiling(args, checkpoint):
+        result, telemetry = _kickoff_checkpointed(inputs, settings, checkpoint)
+        _finish_run(result, inputs, args, telemetry)
+
+
+def cmd_batch(args):
+    defaults = {field: getattr(args, field, None) for field in INPUT_FIELDS + RUN_SETTING_FIELDS}
+    jobs = load_batch_jobs(args.inputs, INPUT_FIELDS, RUN_SETTING_FIELDS, defaults=defaults)
+    if not jobs:
+        print(f"No jobs found in {args.inputs}")
+        return
+    workers = args.workers or DEFAULT_BATCH_WORKERS
+    print(f"Running {len(jobs)} job(s) with {workers} worker(s)")
+    batch = run_batch(jobs, _run_batch_job, _output_dir(args), workers=workers)
+
+    manifest = batch.manifest
+    for job in manifest["jobs"].values():
+        detail = job.get("error") or job.get("output_dir", "")
+        print(f"  [{job['status']}] {job['job_id']} ({job.get('duration_seconds', 0)}s) {detail}")
+    print(f"Batch summary saved to: {batch.manifest_path}")
+    if manifest["status"] != "completed":
+        sys.exit(1)
+
+
+def cmd_render(args):
+    sources = find_artifacts(args.inputs)
+    if not sources:
+        print(f"No saved outputs found in {', '.join(args.inputs)}")
+        return
+    jobs = [RenderJob(source, args.output_dir, args.topic, args.html_format) for source in sources]
+    failed = 0
+    for job, output_path, error in render_artifacts(jobs, workers=args.workers):
+        if error:
+            failed += 1
+            print(f"  [failed] {job.source}: {error}")
+        else:
+            print(f"  [rendered] {job.source} -> {output_path}")
+    print(f"Rendered {len(jobs) - failed} of {len(jobs)} book(s)")
+    if failed:
+        sys.exit(1)
+
+
+def cmd_report(args):
+    paths = find_telemetry_files(args.inputs)
+    if not paths:
+        print(f"No telemetry found in {', '.join(args.inputs)}")
+        return
+    report = aggregate_runs(paths, group_by=args.group_by)
+    print(format_report(report))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved report to: {args.json}")
+
+
+def _run_batch_job(job, job_dir):
+    """Run one batch job into its own directory, checkpointed like a regular run."""
+    checkpoint = RunCheckpoint.create(str(job_dir), job.inputs, job.settings)
+    result, telemetry = _kickoff_checkpointed(job.inputs, job.settings, checkpoint)
+    basename = safe_filename(job.settings.get("output_basename") or job.inputs.get("topic", ""))
+    return {
+        "run_id": checkpoint.run_id,
+        "html_path": _rebuild_html_output(result, job.inputs, output_dir=str(job_dir)),
+        "json_path": _save_json_output(result, str(job_dir), basename, telemetry),
+    }
+
+
+def _profiling(args, checkpoint):
+    """Profile the stages of this run into its run directory when --profile is given."""
+    if not getattr(args, "profile", False):
+        return nullcontext()
+    return profiling(str(checkpoint.run_dir / PROFILE_DIRNAME))
+
+
+def _kickoff_checkpointed(inputs, settings, checkpoint):
+    """Kick off the crew, saving each task output to (and restoring from) the run checkpoint.
+
+    Returns the crew output and the run's telemetry, which is also saved in
+    the run directory, including for failed runs.
+    """
+    telemetry = RunTelemetry.for_run_dir(checkpoint.run_dir, checkpoint.run_id, inputs.get("topic", ""))
+    with profile_stage("crew_construction"):
+        crew_base = _crew(
+            execution_mode=settings.get("execution_mode"),
+            max_chapter_workers=settings.get("max_chapter_workers"),
+            chapters_per_task=settings.get("chapters_per_task"),
+            render_mode=settings.get("render_mode"),
+            checkpoint=checkpoint,
+            telemetry=telemetry,
+        )
     try:
-        _rebuild_html_output(result, inputs)
+        with profile_stage("kickoff"):
+            result = crew_base.kickoff(inputs=inputs)
+    except BaseException:
+        checkpoint.set_status("failed")
+        telemetry.finish("failed")
+        telemetry.save(checkpoint.run_dir / TELEMETRY_FILENAME)
+        print(f"Run {checkpoint.run_id} failed; completed tasks are saved in {checkpoint.run_dir}")
+        raise
+    checkpoint.set_status("completed")
+    telemetry.finish("completed", getattr(result, "token_usage", None))
+    telemetry.save(checkpoint.run_dir / TELEMETRY_FILENAME)
+    return result, telemetry
+
+
+def _finish_run(result, inputs, args, telemetry=None):
+    try:
+        _rebuild_html_output(result, inputs, html_format=getattr(args, "html_format", None))
     except Exception as e:
         print(f"Warning: could not rebuild HTML output: {e}")
     try:
-        _save_outputs_after_run(result, args)
+        _save_outputs_after_run(result, args, telemetry)
     except Exception as e:
         print(f"Warning: could not save outputs: {e}")
 
@@ -71,13 +224,14 @@ def cmd_run(args):
 def train():
     """Train via console script with interactive inputs and defaults (iterations=1, filename='train.json')."""
     inputs = _prompt_for_inputs()
-    ComprehensiveTutorialGeneratorCrew().crew().train(n_iterations=1, filename="train.json", inputs=inputs)
+    _crew().crew().train(n_iterations=1, filename="train.json", inputs=inputs)
 
 
 def cmd_train(args):
     inputs = _build_inputs_from_args(args, interactive=args.interactive)
     try:
-        ComprehensiveTutorialGeneratorCrew().crew().train(
+        crew_base = _crew(execution_mode=args.execution_mode, render_mode=args.render_mode)
+        crew_base.crew().train(
             n_iterations=args.iterations,
             filename=args.filename,
             inputs=inputs,
@@ -88,12 +242,13 @@ def cmd_train(args):
 
 def replay():
     """Replay via console script is not interactive; provide task_id='1'."""
-    ComprehensiveTutorialGeneratorCrew().crew().replay(task_id="1")
+    _crew().crew().replay(task_id="1")
 
 
 def cmd_replay(args):
     try:
-        ComprehensiveTutorialGeneratorCrew().crew().replay(task_id=args.task_id)
+        crew_base = _crew(execution_mode=args.execution_mode, render_mode=args.render_mode)
+        crew_base.crew().replay(task_id=args.task_id)
     except Exception as e:
         raise Exception(f"An error occurred while replaying the crew: {e}")
 
@@ -101,13 +256,14 @@ def cmd_replay(args):
 def test():
     """Test via console script with interactive inputs and defaults (iterations=1, model='gpt-4o-mini')."""
     inputs = _prompt_for_inputs()
-    ComprehensiveTutorialGeneratorCrew().crew().test(n_iterations=1, openai_model_name="gpt-4o-mini", inputs=inputs)
+    _crew().crew().test(n_iterations=1, openai_model_name="gpt-4o-mini", inputs=inputs)
 
 
 def cmd_test(args):
     inputs = _build_inputs_from_args(args, interactive=args.interactive)
     try:
-        ComprehensiveTutorialGeneratorCrew().crew().test(
+        crew_base = _crew(execution_mode=args.execution_mode, render_mode=args.render_mode)
+        crew_base.crew().test(
             n_iterations=args.iterations,
             openai_model_name=args.model,
             inputs=inputs,
@@ -141,24 +297,17 @@ def _get_task_raw_output(result, task_name):
     return ""
 
 
-def _rebuild_html_output(result, inputs):
+def _rebuild_html_output(result, inputs, output_dir=None, html_format=None):
     topic = (inputs or {}).get("topic", "tutorial").strip() or "tutorial"
-    output_dir = os.path.join(os.getcwd(), "outputs")
-    _ensure_dir(output_dir)
-    safe_topic = _safe_filename(topic)
-    output_path = os.path.join(output_dir, f"{safe_topic}_tutorial.html")
+    output_dir = output_dir or os.path.join(os.getcwd(), "outputs")
 
     compiled_book = _get_task_raw_output(result, "compile_comprehensive_tutorial_book")
     if not compiled_book:
-        return
+        return None
 
     curated_resources = _get_task_raw_output(result, "curate_and_verify_resources")
     assessments = _get_task_raw_output(result, "create_assessments_and_exercises")
-
-    html = build_html_document(topic, compiled_book, curated_resources, assessments)
-    with open(output_path, "w", encoding="utf-8") as html_file:
-        html_file.write(html)
-
+    return write_html_output(output_dir, topic, compiled_book, curated_resources, assessments, html_format=html_format)
 
 
 def _extract_text_result(result):
@@ -217,38 +366,44 @@ def _extract_text_result(result):
         return ""
 
 
-def _safe_filename(basename):
-    base = basename or "tutorial_book"
-    base = base.strip().replace(" ", "_")
-    # remove unsafe chars
-    return "".join(c for c in base if c.isalnum() or c in ("_", "-")) or "tutorial_book"
-
-
 def _ensure_dir(path):
     os.makedirs(path, exist_ok=True)
 
 
-def _save_outputs_after_run(result, args):
+def _output_dir(args):
+    return getattr(args, "output_dir", None) or os.path.join(os.getcwd(), "outputs")
+
+
+def _save_outputs_after_run(result, args, telemetry=None):
     """Save final outputs to JSON for testing purposes."""
-    output_dir = getattr(args, "output_dir", None) or os.path.join(os.getcwd(), "outputs")
+    output_dir = _output_dir(args)
     topic = getattr(args, "topic", "") or ""
     basename = getattr(args, "output_basename", None) or (topic.strip() or "tutorial_book")
-    basename = _safe_filename(basename)
+    basename = safe_filename(basename)
+    _save_json_output(result, output_dir, basename, telemetry)
 
+
+def _save_json_output(result, output_dir, basename, telemetry=None):
     _ensure_dir(output_dir)
 
-    text = _extract_text_result(result)
+    with profile_stage("extract_text"):
+        text = _extract_text_result(result)
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
     # Always save JSON (only output format supported)
     json_path = os.path.join(output_dir, f"{basename}-{timestamp}.json")
-    # If text looks like JSON, try to parse; else wrap in object
-    try:
-        data = json.loads(text)
-    except Exception:
-        data = {"content": text}
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
-    print(f"Saved JSON to: {json_path}")
+    with profile_stage("write_json"):
+        # If text looks like JSON, try to parse; else wrap in object
+        try:
+            data = json.loads(text)
+        except Exception:
+            data = {"content": text}
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        print(f"Saved JSON to: {json_path}")
+        if telemetry is not None:
+            telemetry_path = telemetry.save(telemetry_path_for(json_path))
+            print(f"Saved telemetry to: {telemetry_path}")
+    return json_path
 
 
 def _build_parser():
@@ -261,13 +416,81 @@ def _build_parser():
         sp.add_argument("--topic")
         sp.add_argument("--skill-level")
         sp.add_argument("--time-commitment")
+        sp.add_argument(
+            "--execution-mode",
+            choices=EXECUTION_MODES,
+            help="Run independent tasks concurrently (dag) or one after another (default: CREW_EXECUTION_MODE or dag)",
+        )
+        sp.add_argument(
+            "--render-mode",
+            choices=RENDER_MODES,
+            help="Skip the LLM HTML task when the book is structured (auto), never run it (local), or always run it (llm)",
+        )
         # output control
         sp.add_argument("--output-dir", help="Directory to save outputs (default: ./outputs)")
+        sp.add_argument(
+            "--html-format",
+            choices=HTML_FORMATS,
+            help="Write one self-contained HTML file (single) or a multi-page site (site) (default: HTML_OUTPUT_FORMAT or single)",
+        )
         sp.add_argument("--output-basename", help="Base filename for outputs (default: topic)")
 
     # run
     sp_run = subparsers.add_parser("run", help="Kick off the crew with provided inputs")
     add_common_inputs(sp_run)
+    sp_run.add_argument(
+        "--max-chapter-workers",
+        type=int,
+        help="Maximum chapter tasks generated concurrently in dag mode (default: MAX_CHAPTER_WORKERS or 4)",
+    )
+    sp_run.add_argument(
+        "--chapters-per-task",
+        type=int,
+        help="Planned chapters written by each chapter task in dag mode (default: CHAPTERS_PER_TASK or 1)",
+    )
+    sp_run.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile CPU and memory of each stage; writes a report and .pstats files to the run's profile/ directory",
+    )
+
+    # resume
+    sp_resume = subparsers.add_parser("resume", help="Resume a failed run, re-executing only unfinished tasks")
+    sp_resume.add_argument("--run-id", required=True, help="Run id printed when the run started")
+    sp_resume.add_argument("--output-dir", help="Directory the run was saved under (default: ./outputs)")
+    sp_resume.add_argument("--output-basename", help="Base filename for outputs (default: the run's setting)")
+    sp_resume.add_argument("--html-format", choices=HTML_FORMATS, help="Write a single HTML file or a multi-page site")
+    sp_resume.add_argument("--profile", action="store_true", help="Profile CPU and memory of each stage (see run --profile)")
+
+    # batch
+    sp_batch = subparsers.add_parser("batch", help="Generate many tutorials from a JSONL file of jobs")
+    sp_batch.add_argument("--inputs", required=True, help="JSONL file with one {topic, skill_level, time_commitment} job per line")
+    sp_batch.add_argument(
+        "--workers",
+        type=int,
+        help=f"Jobs run concurrently in this process (default: {DEFAULT_BATCH_WORKERS})",
+    )
+    sp_batch.add_argument("--skill-level", help="Default skill level for jobs that omit it")
+    sp_batch.add_argument("--time-commitment", help="Default time commitment for jobs that omit it")
+    sp_batch.add_argument("--execution-mode", choices=EXECUTION_MODES)
+    sp_batch.add_argument("--render-mode", choices=RENDER_MODES)
+    sp_batch.add_argument("--max-chapter-workers", type=int, help="Chapter workers per job in dag mode")
+    sp_batch.add_argument("--chapters-per-task", type=int)
+    sp_batch.add_argument("--output-dir", help="Directory to save the batch under (default: ./outputs)")
+
+    # render
+    sp_render = subparsers.add_parser("render", help="Rebuild HTML from saved JSON outputs or run directories, without the crew")
+    sp_render.add_argument("inputs", nargs="+", help="Saved JSON outputs, run directories, directories of either, or glob patterns")
+    sp_render.add_argument("--output-dir", help="Directory to write HTML to (default: next to each input)")
+    sp_render.add_argument("--topic", help="Topic for the page heading (default: the run's topic or the file name)")
+    sp_render.add_argument("--html-format", choices=HTML_FORMATS, help="Write a single HTML file or a multi-page site")
+    sp_render.add_argument("--workers", type=int, help="Books rendered in parallel processes (default: one per CPU)")
+
+    # report
+    sp_report = subparsers.add_parser("report", help="Aggregate per-task time, tokens, retries and cost across saved runs")
+    sp_report.add_argument("inputs", nargs="+", help="Telemetry files, directories searched recursively (e.g. outputs), or glob patterns")
+    sp_report.add_argument("--group-by", choices=REPORT_GROUPS, default="task", help="Row grouping (default: task)")
+    sp_report.add_argument("--json", help="Also write the report as JSON to this path")
 
     # train
     sp_train = subparsers.add_parser("train", help="Train the crew")
@@ -278,6 +501,8 @@ def _build_parser():
     # replay
     sp_replay = subparsers.add_parser("replay", help="Replay the crew from a task id")
     sp_replay.add_argument("--task-id", required=True)
+    sp_replay.add_argument("--execution-mode", choices=EXECUTION_MODES)
+    sp_replay.add_argument("--render-mode", choices=RENDER_MODES)
 
     # test
     sp_test = subparsers.add_parser("test", help="Test the crew")
@@ -300,6 +525,14 @@ if __name__ == "__main__":
 
     if args.command == "run":
         cmd_run(args)
+    elif args.command == "resume":
+        cmd_resume(args)
+    elif args.command == "batch":
+        cmd_batch(args)
+    elif args.command == "render":
+        cmd_render(args)
+    elif args.command == "report":
+        cmd_report(args)
     elif args.command == "train":
         cmd_train(args)
     elif args.command == "replay":
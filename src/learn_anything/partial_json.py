@@ -0,0 +1,187 @@
+"""Recover as much as possible from truncated or slightly malformed JSON.
+
+Long LLM generations are often cut off mid-document. ``parse_partial_json``
+keeps every member and element that was fully parsed, keeps containers that
+were cut off (with whatever they contained so far), and reports the paths of
+both, so callers can tell exactly which parts must be regenerated.
+
+Tolerated besides truncation: code fences and prose around the document,
+trailing commas, missing commas between members, and raw control characters
+inside strings. Anything else ends the parse as if the text had been cut off
+at that point.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass, field
+from json.decoder import scanstring
+from typing import Any, List, Sequence, Tuple, Union
+
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?")
+_WHITESPACE = re.compile(r"\s*")
+_LITERALS = (("true", True), ("false", False), ("null", None))
+
+Path = Tuple[Union[str, int], ...]
+
+
+def json_path(path: Sequence[Union[str, int]]) -> str:
+    """Render a path as ``$.chapters[2].quiz``."""
+    return "$" + "".join(f"[{key}]" if isinstance(key, int) else f".{key}" for key in path)
+
+
+@dataclass
+class PartialJSON:
+    value: Any
+    complete: bool
+    # Containers that were cut off; they hold only their complete members.
+    incomplete: List[str] = field(default_factory=list)
+    # Values that were cut off and could not be kept at all.
+    dropped: List[str] = field(default_factory=list)
+
+    @property
+    def missing(self) -> List[str]:
+        return self.dropped + self.incomplete
+
+
+class _Stop(Exception):
+    """Raised when the text ends (or stops making sense) inside a value."""
+
+
+class _Parser:
+    def __init__(self, text: str, start: int) -> None:
+        self.text = text
+        self.pos = start
+        self.incomplete: List[Path] = []
+        self.dropped: List[Path] = []
+
+    def _skip(self) -> str:
+        self.pos = _WHITESPACE.match(self.text, self.pos).end()
+        return self.text[self.pos] if self.pos < len(self.text) else ""
+
+    def value(self, path: Path) -> Any:
+        char = self._skip()
+        if char == "{":
+            return self._object(path)
+        if char == "[":
+            return self._array(path)
+        if char == '"':
+            return self._string()
+        match = _NUMBER.match(self.text, self.pos)
+        if match:
+            if match.end() == len(self.text):
+                raise _Stop  # more digits may have followed
+            self.pos = match.end()
+            number = match.group()
+            return float(number) if any(c in number for c in ".eE") else int(number)
+        for literal, result in _LITERALS:
+            if self.text.startswith(literal, self.pos):
+                self.pos += len(literal)
+                return result
+        raise _Stop
+
+    def _string(self) -> str:
+        try:
+            result, self.pos = scanstring(self.text, self.pos + 1, False)
+        except ValueError:
+            raise _Stop from None
+        return result
+
+    def _object(self, path: Path) -> dict:
+        self.pos += 1
+        result: dict = {}
+        while True:
+            char = self._skip()
+            if char == "}":
+                self.pos += 1
+                return result
+            if char == ",":
+                self.pos += 1
+                continue
+            if char != '"':
+                return self._cut(path, result)
+            try:
+                key = self._string()
+            except _Stop:
+                return self._cut(path, result)
+            if self._skip() != ":":
+                return self._cut(path, result)
+            self.pos += 1
+            try:
+                result[key] = self.value(path + (key,))
+            except _Stop:
+                self.dropped.append(path + (key,))
+                return self._cut(path, result)
+
+    def _array(self, path: Path) -> list:
+        self.pos += 1
+        result: list = []
+        while True:
+            char = self._skip()
+            if char == "]":
+                self.pos += 1
+                return result
+            if char == ",":
+                self.pos += 1
+                continue
+            if not char:
+                return self._cut(path, result)
+            index = len(result)
+            try:
+                result.append(self.value(path + (index,)))
+            except _Stop:
+                self.dropped.append(path + (index,))
+                return self._cut(path, result)
+
+    def _cut(self, path: Path, result: Any) -> Any:
+        # Once something is cut off nothing after it is read, so every
+        # enclosing container is incomplete too.
+        self.pos = len(self.text)
+        self.incomplete.append(path)
+        return result
+
+
+def _document_start(text: str) -> int:
+    stripped = text.lstrip()
+    if stripped.startswith("```"):
+        # A truncated fenced block has no closing fence to strip.
+        newline = text.find("\n")
+        offset = newline + 1 if newline != -1 else len(text)
+    else:
+        offset = 0
+    first = _WHITESPACE.match(text, offset).end()
+    if text[first:first + 1] in ("{", "["):
+        return first
+    # Skip leading prose; the documents we parse are objects.
+    for opener in ("{", "["):
+        index = text.find(opener, offset)
+        if index != -1:
+            return index
+    raise ValueError("Text does not contain a JSON object or array")
+
+
+def parse_partial_json(text: str) -> PartialJSON:
+    """Parse ``text`` as JSON, recovering what was complete when it is cut off.
+
+    Valid JSON takes the fast path through ``json.loads``. Raises
+    ``ValueError`` only when no object or array can be found at all.
+    """
+    text = text or ""
+    try:
+        return PartialJSON(value=json.loads(text), complete=True)
+    except ValueError:
+        pass
+
+    parser = _Parser(text, _document_start(text))
+    value = parser.value(())
+    # Paths are recorded innermost first.
+    return PartialJSON(
+        value=value,
+        complete=not parser.incomplete and not parser.dropped,
+        incomplete=[json_path(path) for path in parser.incomplete],
+        dropped=[json_path(path) for path in parser.dropped],
+    )
+
+
+__all__ = ["PartialJSON", "json_path", "parse_partial_json"]
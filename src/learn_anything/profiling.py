@@ -0,0 +1,211 @@
+"""CPU and memory profiles of the local stages of a run (``run --profile``).
+
+Pipeline code marks its stages with ``profile_stage(name)``. Unless a
+``StageProfiler`` is active that returns one shared no-op context manager, so
+the stages cost nothing in normal runs and neither cProfile nor tracemalloc is
+imported. While one is active each stage runs under its own ``cProfile``
+profile, saved as a ``.pstats`` file, between tracemalloc snapshots, and the
+profiler reports wall and CPU time, allocated and peak memory, and the
+functions and source lines that account for most of each.
+
+cProfile only sees the thread that enters the stage, so the time spent in
+crewAI's worker threads during the kickoff shows up as waiting; tracemalloc
+counts allocations from every thread.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+PROFILE_DIRNAME = "profile"
+REPORT_FILENAME = "profile.json"
+DEFAULT_TOP = 8
+# Frames kept per allocation; more frames attribute memory better but cost more.
+DEFAULT_TRACEMALLOC_FRAMES = 1
+
+_NULL_STAGE = nullcontext()
+_ACTIVE: Optional["StageProfiler"] = None
+
+
+def profile_stage(name: str):
+    """Context manager profiling ``name`` when a profiler is active, else a no-op."""
+    profiler = _ACTIVE
+    if profiler is None:
+        return _NULL_STAGE
+    return profiler.stage(name)
+
+
+def _top_functions(profile: Any, limit: int) -> List[Dict[str, Any]]:
+    import pstats
+
+    stats = pstats.Stats(profile).stats
+    rows = []
+    for (filename, line, function), (_, calls, own_time, cumulative_time, _) in stats.items():
+        if filename == "~" or filename.endswith(("cProfile.py", "profiling.py")):
+            continue
+        rows.append(
+            {
+                "function": f"{function} ({os.path.basename(filename)}:{line})",
+                "calls": calls,
+                "own_seconds": round(own_time, 4),
+                "cumulative_seconds": round(cumulative_time, 4),
+            }
+        )
+    rows.sort(key=lambda row: row["cumulative_seconds"], reverse=True)
+    return rows[:limit]
+
+
+def _top_allocations(before: Any, after: Any, limit: int) -> List[Dict[str, Any]]:
+    rows = []
+    for diff in after.compare_to(before, "lineno")[:limit]:
+        frame = diff.traceback[0]
+        rows.append(
+            {
+                "line": f"{frame.filename}:{frame.lineno}",
+                "size_diff_bytes": diff.size_diff,
+                "count_diff": diff.count_diff,
+            }
+        )
+    return rows
+
+
+class StageProfiler:
+    """Profile each stage into ``directory`` and collect a per-stage report.
+
+    Stages run one at a time: a stage entered while another is running (nested,
+    or from another thread) is accounted to the running one.
+    """
+
+    def __init__(self, directory: str, top: int = DEFAULT_TOP, tracemalloc_frames: int = DEFAULT_TRACEMALLOC_FRAMES):
+        self.directory = Path(directory)
+        self.top = top
+        self.tracemalloc_frames = tracemalloc_frames
+        self.stages: List[Dict[str, Any]] = []
+        self._running = threading.Lock()
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        import tracemalloc
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.tracemalloc_frames)
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        import tracemalloc
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not self._running.acquire(blocking=False):
+            yield
+            return
+        import cProfile
+        import tracemalloc
+
+        try:
+            before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+            profile = cProfile.Profile()
+            error = None
+            wall_started = time.perf_counter()
+            cpu_started = time.process_time()
+            profile.enable()
+            try:
+                yield
+            except BaseException as e:
+                error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                profile.disable()
+                wall = time.perf_counter() - wall_started
+                cpu = time.process_time() - cpu_started
+                end_memory, peak_memory = tracemalloc.get_traced_memory()
+                after = tracemalloc.take_snapshot()
+                self._record(name, profile, wall, cpu, end_memory - start_memory, peak_memory - start_memory, before, after, error)
+        finally:
+            self._running.release()
+
+    def _record(
+        self,
+        name: str,
+        profile: Any,
+        wall: float,
+        cpu: float,
+        allocated: int,
+        peak: int,
+        before: Any,
+        after: Any,
+        error: Optional[str],
+    ) -> None:
+        pstats_path = self.directory / f"{len(self.stages) + 1:02d}-{name}.pstats"
+        profile.dump_stats(str(pstats_path))
+        self.stages.append(
+            {
+                "stage": name,
+                "wall_seconds": round(wall, 4),
+                "cpu_seconds": round(cpu, 4),
+                "allocated_bytes": allocated,
+                "peak_bytes": peak,
+                "pstats": pstats_path.name,
+                "error": error,
+                "top_functions": _top_functions(profile, self.top),
+                "top_allocations": _top_allocations(before, after, self.top),
+            }
+        )
+
+    def save(self) -> Path:
+        path = self.directory / REPORT_FILENAME
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump({"stages": self.stages}, handle, indent=2)
+        return path
+
+    def format_report(self) -> str:
+        """Per-stage summary table, then the slowest functions of each stage."""
+        header = f"{'stage':<24} {'wall s':>9} {'cpu s':>9} {'alloc MB':>9} {'peak MB':>9}"
+        lines = [header, "-" * len(header)]
+        for stage in self.stages:
+            lines.append(
+                f"{stage['stage'][:24]:<24} {stage['wall_seconds']:>9.3f} {stage['cpu_seconds']:>9.3f} "
+                f"{stage['allocated_bytes'] / 2**20:>9.2f} {stage['peak_bytes'] / 2**20:>9.2f}"
+                + (f"  ({stage['error']})" if stage["error"] else "")
+            )
+        for stage in self.stages:
+            lines.append("")
+            lines.append(f"{stage['stage']} ({stage['pstats']}), top functions by cumulative time:")
+            for row in stage["top_functions"][:5]:
+                lines.append(f"  {row['cumulative_seconds']:>8.3f}s {row['calls']:>8}x  {row['function']}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def profiling(directory: str, top: int = DEFAULT_TOP) -> Iterator[StageProfiler]:
+    """Activate a ``StageProfiler`` for the block; the report is saved and printed at exit."""
+    global _ACTIVE
+    frames = int(os.environ.get("PROFILE_TRACEMALLOC_FRAMES", "") or DEFAULT_TRACEMALLOC_FRAMES)
+    profiler = StageProfiler(directory, top=top, tracemalloc_frames=max(1, frames))
+    profiler.start()
+    _ACTIVE = profiler
+    try:
+        yield profiler
+    finally:
+        _ACTIVE = None
+        profiler.stop()
+        if profiler.stages:
+            report_path = profiler.save()
+            print(profiler.format_report())
+            print(f"Saved profile to: {report_path} (open a stage with: python -m pstats {profiler.directory}/<stage>.pstats)")
+
+
+__all__ = ["PROFILE_DIRNAME", "StageProfiler", "profile_stage", "profiling"]
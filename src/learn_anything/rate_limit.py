@@ -0,0 +1,216 @@
+"""Process-wide rate limiting for LLM providers.
+
+Every ``LLM`` returned by ``get_llm`` for the same provider shares one
+``ProviderRateLimiter``: a requests/min and a tokens/min token bucket plus a
+cap on in-flight calls. Rate-limit errors halve the allowed rate and each
+successful call adds a little back (AIMD), so parallel agents settle just
+under the provider's real quota instead of hammering it with retries.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+# AIMD tuning: halve on a rate-limit error, recover 5% of the configured rate
+# per successful call, and never drop below 10% of it.
+DECREASE_FACTOR = 0.5
+INCREASE_STEP = 0.05
+MIN_RATE_FACTOR = 0.1
+# Errors from calls that were already in flight when the rate was cut describe
+# the old rate, so further cuts are ignored for this long.
+DECREASE_COOLDOWN_SECONDS = 5.0
+
+_RATE_LIMIT_MARKERS = (
+    "rate limit",
+    "ratelimit",
+    "rate_limit",
+    "too many requests",
+    "resource_exhausted",
+    "resource exhausted",
+    "throttl",
+)
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``per_minute`` tokens per minute.
+
+    The bucket holds at most one minute of tokens. ``consume`` may push it
+    into debt so usage that is only known after a call still slows later ones.
+    """
+
+    def __init__(self, per_minute: float):
+        self._lock = threading.Lock()
+        self._per_minute = float(per_minute)
+        self._tokens = float(per_minute)
+        self._updated = time.monotonic()
+
+    @property
+    def per_minute(self) -> float:
+        return self._per_minute
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self._per_minute, self._tokens + elapsed * self._per_minute / 60.0)
+
+    def set_rate(self, per_minute: float) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self._per_minute = float(per_minute)
+            self._tokens = min(self._tokens, self._per_minute)
+
+    def acquire(self, amount: float = 1.0) -> None:
+        """Block until ``amount`` tokens (capped at the bucket size) are available, then take them."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                needed = min(amount, self._per_minute)
+                if self._tokens >= needed:
+                    self._tokens -= amount
+                    return
+                wait = (needed - self._tokens) * 60.0 / self._per_minute
+            time.sleep(min(wait, 60.0))
+
+    def consume(self, amount: float) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= amount
+
+    def drain(self) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0)
+
+
+class ProviderRateLimiter:
+    """Shared limiter for one provider; a limit of 0 disables that dimension."""
+
+    def __init__(self, requests_per_minute: float = 0, tokens_per_minute: float = 0, max_in_flight: int = 0):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_in_flight = max_in_flight
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self._in_flight = threading.BoundedSemaphore(max_in_flight) if max_in_flight > 0 else None
+        self._lock = threading.Lock()
+        self._factor = 1.0
+        self._last_decrease = float("-inf")
+
+    @property
+    def rate_factor(self) -> float:
+        """Fraction of the configured rates currently allowed."""
+        return self._factor
+
+    @contextmanager
+    def slot(self, estimated_tokens: int = 0) -> Iterator[None]:
+        """Wait for request/token budget and an in-flight slot for one call."""
+        if self._requests is not None:
+            self._requests.acquire(1)
+        if self._tokens is not None and estimated_tokens > 0:
+            self._tokens.acquire(estimated_tokens)
+        if self._in_flight is not None:
+            self._in_flight.acquire()
+        try:
+            yield
+        finally:
+            if self._in_flight is not None:
+                self._in_flight.release()
+
+    def record_tokens(self, tokens: int) -> None:
+        """Charge tokens that were only known after the call (the response)."""
+        if self._tokens is not None and tokens > 0:
+            self._tokens.consume(tokens)
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self._factor >= 1.0:
+                return
+            self._factor = min(1.0, self._factor + INCREASE_STEP)
+            self._apply_factor()
+
+    def on_rate_limited(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < DECREASE_COOLDOWN_SECONDS:
+                return
+            self._last_decrease = now
+            self._factor = max(MIN_RATE_FACTOR, self._factor * DECREASE_FACTOR)
+            self._apply_factor()
+        # Start the reduced rate from an empty bucket so the burst that
+        # triggered the error is not immediately repeated.
+        if self._requests is not None:
+            self._requests.drain()
+
+    def retry_delay(self) -> float:
+        """Seconds to pause before retrying a rate-limited call."""
+        if self._requests is not None:
+            return 60.0 / self._requests.per_minute
+        return 1.0 / self._factor
+
+    def _apply_factor(self) -> None:
+        if self._requests is not None:
+            self._requests.set_rate(self.requests_per_minute * self._factor)
+        if self._tokens is not None:
+            self._tokens.set_rate(self.tokens_per_minute * self._factor)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Recognise provider rate-limit errors (HTTP 429, litellm RateLimitError, Bedrock throttling)."""
+    seen = set()
+    current: Optional[BaseException] = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        if getattr(current, "status_code", None) == 429 or "RateLimit" in type(current).__name__:
+            return True
+        message = str(current).lower()
+        if "429" in message or any(marker in message for marker in _RATE_LIMIT_MARKERS):
+            return True
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def estimate_tokens(messages: Union[str, List[Dict[str, Any]], None]) -> int:
+    """Rough token count (~4 characters per token) used for the tokens/min budget."""
+    if not messages:
+        return 0
+    if isinstance(messages, str):
+        return len(messages) // 4 + 1
+    return sum(len(str(message.get("content", ""))) for message in messages) // 4 + 1
+
+
+_LIMITERS: Dict[str, ProviderRateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(
+    key: str,
+    requests_per_minute: float = 0,
+    tokens_per_minute: float = 0,
+    max_in_flight: int = 0,
+) -> Optional[ProviderRateLimiter]:
+    """Return the process-wide limiter for ``key``, creating it on first use.
+
+    The limits passed by the first caller for a key win. Returns None when
+    every limit is disabled.
+    """
+    if requests_per_minute <= 0 and tokens_per_minute <= 0 and max_in_flight <= 0:
+        return None
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(key)
+        if limiter is None:
+            limiter = ProviderRateLimiter(requests_per_minute, tokens_per_minute, max_in_flight)
+            _LIMITERS[key] = limiter
+        return limiter
+
+
+__all__ = [
+    "ProviderRateLimiter",
+    "TokenBucket",
+    "estimate_tokens",
+    "get_rate_limiter",
+    "is_rate_limit_error",
+]
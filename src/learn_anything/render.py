@@ -0,0 +1,243 @@
+"""Re-render HTML from saved run artifacts without a crew run.
+
+Only the book schema and the renderers are imported here, never crewAI, so
+shipping a stylesheet or renderer fix across an archive of books is a matter
+of re-running the renderer. An artifact is either a saved JSON output (the
+compiled book, or ``{"content": ...}`` wrapping it) or a checkpointed run
+directory, which also provides the topic and the curated resources.
+
+A run directory renders to ``<topic>-<run_id>_tutorial.html`` and a saved
+output to ``<file name>_tutorial.html``. Each output name has its own fragment
+cache, so jobs rendered in parallel into one ``--output-dir`` neither overwrite
+each other's HTML nor prune each other's cached fragments.
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from learn_anything.book_schema import recover_book_payload
+from learn_anything.profiling import profile_stage
+from learn_anything.run_modes import HTML_FORMATS
+from learn_anything.telemetry import TELEMETRY_FILENAME, TELEMETRY_SUFFIX
+
+# Layout of a checkpointed run directory; see checkpoints.RunCheckpoint.
+_RUN_MANIFEST = "run.json"
+_COMPILED_BOOK_TASK = "compile_comprehensive_tutorial_book"
+_CURATED_RESOURCES_TASK = "curate_and_verify_resources"
+_ASSESSMENTS_TASK = "create_assessments_and_exercises"
+
+_TIMESTAMP_SUFFIX = re.compile(r"-\d{8}-\d{6}$")
+
+
+def resolve_html_format(html_format: Optional[str]) -> str:
+    html_format = (html_format or os.environ.get("HTML_OUTPUT_FORMAT") or "single").strip().lower()
+    if html_format not in HTML_FORMATS:
+        raise ValueError(f"Unknown HTML format '{html_format}'; expected one of {', '.join(HTML_FORMATS)}")
+    return html_format
+
+
+def safe_filename(basename: Optional[str]) -> str:
+    base = basename or "tutorial_book"
+    base = base.strip().replace(" ", "_")
+    # remove unsafe chars
+    return "".join(c for c in base if c.isalnum() or c in ("_", "-")) or "tutorial_book"
+
+
+def write_html_output(
+    output_dir: str,
+    topic: str,
+    compiled_book: str,
+    curated_resources: str = "",
+    assessments: str = "",
+    html_format: Optional[str] = None,
+    basename: Optional[str] = None,
+) -> str:
+    """Render a compiled book into ``output_dir`` and return the HTML (or site index) path.
+
+    Structured books are written as they render and reuse the fragment cache
+    under ``output_dir``; anything else goes through ``build_html_document``.
+    """
+    # The renderers (and markdown) load on first use so the CLI starts quickly.
+    from learn_anything.tools import RenderCache, build_html_document, render_to, write_site
+    from learn_anything.tools.render_cache import DEFAULT_CACHE_DIRNAME
+
+    html_format = resolve_html_format(html_format)
+    os.makedirs(output_dir, exist_ok=True)
+    safe_topic = safe_filename(basename or topic)
+    output_path = os.path.join(output_dir, f"{safe_topic}_tutorial.html")
+
+    with profile_stage("parse_book"):
+        try:
+            recovered = recover_book_payload(compiled_book)
+        except ValueError:
+            recovered = None
+    if recovered and recovered.missing:
+        print(f"Warning: the compiled book was cut off; rendering without {', '.join(recovered.missing)}")
+
+    if recovered is None:
+        if html_format == "site":
+            print("Warning: the compiled book is not structured JSON; writing a single HTML file instead of a site")
+        with profile_stage("render_html"), open(output_path, "w", encoding="utf-8") as html_file:
+            html_file.write(build_html_document(topic, compiled_book, curated_resources, assessments))
+        return output_path
+
+    # Fragments of unchanged chapters are reused on the next render of this book.
+    cache = RenderCache(os.path.join(output_dir, DEFAULT_CACHE_DIRNAME, safe_topic))
+    with profile_stage("render_html"):
+        if html_format == "site":
+            output_path = write_site(os.path.join(output_dir, f"{safe_topic}_site"), recovered.book, topic, curated_resources, cache=cache)
+        else:
+            with open(output_path, "w", encoding="utf-8") as html_file:
+                render_to(html_file, recovered.book, topic, curated_resources, cache=cache)
+        cache.prune()
+    return output_path
+
+
+@dataclass
+class RenderJob:
+    source: str
+    output_dir: Optional[str] = None
+    topic: Optional[str] = None
+    html_format: Optional[str] = None
+
+
+def _read_text(path: str) -> str:
+    with open(path, encoding="utf-8") as handle:
+        return handle.read()
+
+
+def _task_raw(run_dir: str, task_name: str) -> str:
+    path = os.path.join(run_dir, "tasks", f"{task_name}.json")
+    if not os.path.exists(path):
+        return ""
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle).get("raw") or ""
+
+
+def _unwrap_saved_output(text: str) -> str:
+    """Return the book text from a saved JSON output, a wrapped one, or a task output.
+
+    Raises ``ValueError`` for JSON of any other shape (e.g. run telemetry).
+    """
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return text
+    if isinstance(data, dict):
+        if "chapters" in data or isinstance(data.get("book"), dict):
+            return text
+        for key in ("raw", "content"):
+            if isinstance(data.get(key), str):
+                return data[key]
+    raise ValueError("not a saved tutorial output (expected a book, or an object with 'raw' or 'content')")
+
+
+def _topic_from_filename(path: str) -> str:
+    stem = _TIMESTAMP_SUFFIX.sub("", os.path.splitext(os.path.basename(path))[0])
+    return stem.replace("_", " ").strip() or "tutorial"
+
+
+def render_artifact(job: RenderJob) -> str:
+    """Render one saved output file or run directory and return the output path."""
+    source = job.source
+    if os.path.isdir(source):
+        with open(os.path.join(source, _RUN_MANIFEST), encoding="utf-8") as handle:
+            manifest = json.load(handle)
+        inputs = manifest.get("inputs") or {}
+        run_id = manifest.get("run_id") or os.path.basename(os.path.normpath(source))
+        compiled_book = _task_raw(source, _COMPILED_BOOK_TASK)
+        if not compiled_book:
+            raise ValueError(f"{source} has no saved {_COMPILED_BOOK_TASK} output")
+        topic = job.topic or (inputs.get("topic") or "").strip() or "tutorial"
+        return write_html_output(
+            job.output_dir or source,
+            topic,
+            compiled_book,
+            _task_raw(source, _CURATED_RESOURCES_TASK),
+            _task_raw(source, _ASSESSMENTS_TASK),
+            html_format=job.html_format,
+            basename=f"{topic}-{run_id}",
+        )
+
+    compiled_book = _unwrap_saved_output(_read_text(source))
+    basename = os.path.splitext(os.path.basename(source))[0]
+    return write_html_output(
+        job.output_dir or os.path.dirname(os.path.abspath(source)),
+        job.topic or _topic_from_filename(source),
+        compiled_book,
+        html_format=job.html_format,
+        basename=basename,
+    )
+
+
+def _is_run_dir(path: str) -> bool:
+    return os.path.isfile(os.path.join(path, _RUN_MANIFEST))
+
+
+def _is_telemetry_file(path: str) -> bool:
+    name = os.path.basename(path)
+    return name == TELEMETRY_FILENAME or name.endswith(TELEMETRY_SUFFIX)
+
+
+def find_artifacts(patterns: Iterable[str]) -> List[str]:
+    """Expand files, run directories, directories of either, and glob patterns.
+
+    Telemetry files saved next to the outputs are skipped unless named directly.
+    """
+    found: List[str] = []
+    for pattern in patterns:
+        matches = [path for path in sorted(glob.glob(pattern)) if not _is_telemetry_file(path)] if glob.has_magic(pattern) else [pattern]
+        for path in matches:
+            if os.path.isdir(path) and not _is_run_dir(path):
+                for name in sorted(os.listdir(path)):
+                    child = os.path.join(path, name)
+                    if _is_run_dir(child) or (name.endswith(".json") and os.path.isfile(child) and not _is_telemetry_file(child)):
+                        found.append(child)
+            elif os.path.exists(path):
+                found.append(path)
+            else:
+                raise FileNotFoundError(f"No such file or directory: {path}")
+    return list(dict.fromkeys(found))
+
+
+def render_artifacts(jobs: List[RenderJob], workers: Optional[int] = None) -> Iterator[Tuple[RenderJob, Optional[str], Optional[str]]]:
+    """Render every job, yielding ``(job, output_path, error)`` as each finishes.
+
+    More than one job runs on a process pool of ``workers`` (default: one per
+    CPU); a failed job is reported and does not stop the others.
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    if len(jobs) == 1 or workers == 1:
+        for job in jobs:
+            try:
+                yield job, render_artifact(job), None
+            except Exception as exc:
+                yield job, None, f"{type(exc).__name__}: {exc}"
+        return
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        futures = {pool.submit(render_artifact, job): job for job in jobs}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result(), None
+            except Exception as exc:
+                yield futures[future], None, f"{type(exc).__name__}: {exc}"
+
+
+__all__ = [
+    "HTML_FORMATS",
+    "RenderJob",
+    "find_artifacts",
+    "render_artifact",
+    "render_artifacts",
+    "resolve_html_format",
+    "safe_filename",
+    "write_html_output",
+]
@@ -0,0 +1,17 @@
+"""Run mode names shared by the crew, the renderer and the CLI, importable without either."""
+
+# "dag" wires every task to its declared upstream tasks and runs independent
+# tasks concurrently; "sequential" keeps the original one-after-another order.
+EXECUTION_MODES = ("dag", "sequential")
+DEFAULT_EXECUTION_MODE = "dag"
+
+# How the final HTML is produced. "local" drops the LLM HTML task and relies on the
+# local renderer; "llm" always runs it; "auto" only runs it when the compiled book
+# does not parse as a structured BookPayload the local renderer can use.
+RENDER_MODES = ("auto", "local", "llm")
+DEFAULT_RENDER_MODE = "auto"
+
+# HTML layouts: one self-contained file, or a linked multi-page site
+HTML_FORMATS = ("single", "site")
+
+__all__ = ["DEFAULT_EXECUTION_MODE", "DEFAULT_RENDER_MODE", "EXECUTION_MODES", "HTML_FORMATS", "RENDER_MODES"]
@@ -0,0 +1,241 @@
+"""Validate task output against its JSON schema and repair only what is broken.
+
+``make_schema_guardrail`` returns a crewAI task guardrail. A result that fails
+validation is first coerced locally (numbers to strings, scalars to lists,
+enum spelling) and then, for whatever is still invalid, only the smallest
+failing object is sent to the LLM in a short repair prompt and spliced back.
+Output that was cut off is parsed with ``partial_json`` so a truncated last
+item is repaired like any other invalid fragment. The whole task is
+regenerated (crewAI's guardrail retry) only when the output is not JSON at all
+or a repair does not validate.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from crewai.tasks.output_format import OutputFormat
+from crewai.tasks.task_output import TaskOutput
+from jsonschema import Draft7Validator
+
+from learn_anything.partial_json import json_path, parse_partial_json
+from learn_anything.task_schemas import get_task_schema
+
+# Fragments larger than this are not worth a targeted repair; the guardrail
+# asks for the task to be regenerated instead.
+MAX_FRAGMENT_CHARS = 12000
+MAX_REPAIRS_PER_OUTPUT = 8
+# Full regenerations allowed after local coercion and targeted repair fail.
+SCHEMA_GUARDRAIL_RETRIES = 1
+
+_ENUM_ALIASES = {
+    "mcq": "multiple_choice",
+    "single_choice": "multiple_choice",
+    "multiple_select": "multi_select",
+    "checkbox": "multi_select",
+    "boolean": "true_false",
+    "true_or_false": "true_false",
+    "open": "short_answer",
+    "open_ended": "short_answer",
+    "essay": "short_answer",
+}
+
+Path = List[Union[str, int]]
+RepairFn = Callable[[Any, Dict[str, Any], List[str], str], Any]
+
+
+def load_json_output(text: str) -> Any:
+    """Parse a task result as JSON, tolerating code fences, surrounding prose, and truncation."""
+    return parse_partial_json(text).value
+
+
+def _types(schema: Dict[str, Any]) -> Sequence[str]:
+    declared = schema.get("type")
+    if isinstance(declared, list):
+        return declared
+    return [declared] if declared else []
+
+
+def coerce_to_schema(value: Any, schema: Dict[str, Any]) -> Any:
+    """Apply cheap, lossless fixes for common LLM type slips."""
+    types = _types(schema)
+    if "object" in types and isinstance(value, dict):
+        properties = schema.get("properties", {})
+        for key, item in list(value.items()):
+            if key in properties:
+                value[key] = coerce_to_schema(item, properties[key])
+        for key in schema.get("required", []):
+            if key not in value and "array" in _types(properties.get(key, {})):
+                value[key] = []
+        return value
+    if "array" in types:
+        if value is None:
+            return []
+        if not isinstance(value, list):
+            value = [value]
+        item_schema = schema.get("items", {})
+        return [coerce_to_schema(item, item_schema) for item in value]
+    if "string" in types:
+        if isinstance(value, (int, float, bool)):
+            value = str(value).lower() if isinstance(value, bool) else str(value)
+        elif isinstance(value, list) and all(isinstance(item, str) for item in value):
+            value = "\n\n".join(value)
+        if isinstance(value, str) and "enum" in schema and value not in schema["enum"]:
+            normalized = re.sub(r"[\s/\-]+", "_", value.strip().lower())
+            normalized = _ENUM_ALIASES.get(normalized, normalized)
+            if normalized in schema["enum"]:
+                value = normalized
+        return value
+    if "integer" in types:
+        if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+            return int(value.strip())
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+    return value
+
+
+def _get(data: Any, path: Path) -> Any:
+    for key in path:
+        data = data[key]
+    return data
+
+
+def _set(data: Any, path: Path, value: Any) -> Any:
+    if not path:
+        return value
+    _get(data, path[:-1])[path[-1]] = value
+    return data
+
+
+def _schema_at(schema: Dict[str, Any], path: Path) -> Dict[str, Any]:
+    for key in path:
+        if isinstance(key, int):
+            schema = schema.get("items", {})
+        else:
+            schema = schema.get("properties", {}).get(key) or schema.get("additionalProperties") or {}
+    return schema
+
+
+def _fragment_path(data: Any, path: Path) -> Path:
+    """Nearest enclosing object of a failing value: the unit sent for repair."""
+    path = list(path)
+    while path and not isinstance(_get(data, path), dict):
+        path.pop()
+    return path
+
+
+def _failing_fragments(data: Any, validator: Draft7Validator) -> Dict[Tuple, List[str]]:
+    fragments: Dict[Tuple, List[str]] = {}
+    for error in validator.iter_errors(data):
+        path = tuple(_fragment_path(data, list(error.absolute_path)))
+        fragments.setdefault(path, []).append(f"{json_path(list(error.absolute_path))}: {error.message}")
+    # Repairing an object also repairs everything inside it.
+    return {
+        path: messages
+        for path, messages in fragments.items()
+        if not any(other != path and path[:len(other)] == other for other in fragments)
+    }
+
+
+def validate_and_repair(
+    data: Any,
+    schema: Dict[str, Any],
+    repair: Optional[RepairFn] = None,
+) -> Tuple[Any, List[str]]:
+    """Return ``(data, errors)``; ``errors`` is empty when ``data`` now validates."""
+    validator = Draft7Validator(schema)
+    if validator.is_valid(data):
+        return data, []
+
+    data = coerce_to_schema(data, schema)
+    fragments = _failing_fragments(data, validator)
+    if repair is not None:
+        for path, messages in list(fragments.items())[:MAX_REPAIRS_PER_OUTPUT]:
+            fragment = _get(data, list(path))
+            if len(json.dumps(fragment)) > MAX_FRAGMENT_CHARS:
+                continue
+            fragment_schema = _schema_at(schema, list(path))
+            try:
+                repaired = repair(fragment, fragment_schema, messages, json_path(list(path)))
+            except Exception:
+                continue
+            if repaired is None:
+                continue
+            repaired = coerce_to_schema(repaired, fragment_schema)
+            if Draft7Validator(fragment_schema).is_valid(repaired):
+                data = _set(data, list(path), repaired)
+
+    errors = [messages[0] for messages in _failing_fragments(data, validator).values()]
+    return data, errors
+
+
+def _repair_prompt(task_name: str, fragment: Any, schema: Dict[str, Any], messages: List[str], pointer: str) -> str:
+    problems = "\n".join(f"- {message}" for message in messages[:10])
+    return (
+        f"One fragment of a larger JSON document produced for the task '{task_name}' is invalid.\n"
+        f"Location: {pointer}\n"
+        f"Problems:\n{problems}\n\n"
+        f"JSON schema for this fragment:\n{json.dumps(schema, separators=(',', ':'))}\n\n"
+        f"Current fragment:\n{json.dumps(fragment, ensure_ascii=False)}\n\n"
+        "Return ONLY the corrected fragment as JSON (no markdown fences, no commentary). "
+        "Keep all existing content and change only what is needed to satisfy the schema."
+    )
+
+
+def llm_fragment_repair(task_name: str) -> RepairFn:
+    """Repair callback that sends one failing fragment to the ``schema_repair`` LLM."""
+
+    def _repair(fragment: Any, schema: Dict[str, Any], messages: List[str], pointer: str) -> Any:
+        # Imported lazily so schemas can be validated without configuring an LLM.
+        from learn_anything.llm_config import get_llm
+
+        response = get_llm("schema_repair").call(_repair_prompt(task_name, fragment, schema, messages, pointer))
+        return load_json_output(response) if isinstance(response, str) else None
+
+    return _repair
+
+
+def make_schema_guardrail(task_name: str, schema_name: Optional[str] = None) -> Callable[[TaskOutput], Tuple[bool, Any]]:
+    """Guardrail enforcing the ``schema_name`` (default ``task_name``) output schema.
+
+    On success the task output is replaced by the validated, compact JSON with
+    ``json_dict`` populated.
+    """
+    schema = get_task_schema(schema_name or task_name)
+    repair = llm_fragment_repair(task_name)
+
+    # Left unannotated: crewAI inspects guardrail annotations at runtime and
+    # would reject the string form produced by postponed evaluation.
+    def schema_guardrail(output):
+        try:
+            parsed = parse_partial_json(output.raw)
+        except ValueError as exc:
+            return False, f"{exc}. Answer with a single JSON object that matches the schema in the task."
+        if not parsed.complete:
+            # What survived may still validate, but content after the cut is
+            # lost (e.g. trailing chapters), so a truncated answer never passes.
+            return False, f"The answer was cut off at {parsed.missing[0]}; keep it shorter so it fits."
+        data, errors = validate_and_repair(parsed.value, schema, repair)
+        if errors:
+            return False, "The JSON does not match the schema: " + "; ".join(errors[:5])
+        return True, output.model_copy(
+            update={
+                "raw": json.dumps(data, ensure_ascii=False),
+                "json_dict": data if isinstance(data, dict) else None,
+                "output_format": OutputFormat.JSON,
+            }
+        )
+
+    return schema_guardrail
+
+
+__all__ = [
+    "SCHEMA_GUARDRAIL_RETRIES",
+    "coerce_to_schema",
+    "llm_fragment_repair",
+    "load_json_output",
+    "make_schema_guardrail",
+    "validate_and_repair",
+]
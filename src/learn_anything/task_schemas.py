@@ -0,0 +1,228 @@
+"""JSON schemas for the structured output of every content-producing task.
+
+Task prompts embed the schema via ``schema_instructions`` and the schema
+guardrail in ``structured_output`` validates (and repairs) each result against
+it. Chapter, introduction, and resource shapes mirror the dataclasses in
+``book_schema`` so validated output converts to a ``BookPayload`` losslessly.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict
+
+_STRING = {"type": "string"}
+_STRING_LIST = {"type": "array", "items": _STRING}
+_INTEGER = {"type": "integer"}
+
+
+def _object(properties: Dict[str, Any], required=()) -> Dict[str, Any]:
+    return {"type": "object", "properties": properties, "required": list(required)}
+
+
+def _array(items: Dict[str, Any], min_items: int = 0) -> Dict[str, Any]:
+    schema: Dict[str, Any] = {"type": "array", "items": items}
+    if min_items:
+        schema["minItems"] = min_items
+    return schema
+
+
+SECTION_BLOCK = _object({"title": _STRING, "content": _STRING}, required=("title", "content"))
+
+HANDS_ON_EXERCISE = _object(
+    {"title": _STRING, "objective": _STRING, "steps": _STRING_LIST, "solution": _STRING},
+    required=("title", "steps", "solution"),
+)
+
+TROUBLESHOOTING_ITEM = _object(
+    {"problem": _STRING, "solution": _STRING, "notes": _STRING},
+    required=("problem", "solution"),
+)
+
+QUIZ_QUESTION = _object(
+    {
+        "question": _STRING,
+        "question_type": {"type": "string", "enum": ["multiple_choice", "multi_select", "true_false", "short_answer"]},
+        "options": _STRING_LIST,
+        "answer": _STRING,
+        "explanation": _STRING,
+    },
+    required=("question", "question_type", "answer"),
+)
+
+CHAPTER = _object(
+    {
+        "chapter_number": {"type": "integer", "minimum": 1},
+        "title": _STRING,
+        "estimated_time_minutes": _INTEGER,
+        "learning_objectives": _STRING_LIST,
+        "overview": _STRING,
+        "theoretical_concepts": _array(SECTION_BLOCK),
+        "procedures": _array(SECTION_BLOCK),
+        "examples": _array(SECTION_BLOCK),
+        "hands_on_exercises": _array(HANDS_ON_EXERCISE),
+        "troubleshooting": _array(TROUBLESHOOTING_ITEM),
+        "best_practices": _STRING_LIST,
+        "summary": _STRING,
+        "quiz": _array(QUIZ_QUESTION),
+    },
+    required=("chapter_number", "title", "learning_objectives", "overview", "summary", "quiz"),
+)
+
+INTRODUCTION = _object(
+    {
+        "topic_overview": _STRING,
+        "what_you_will_learn": _STRING_LIST,
+        "target_audience": _STRING_LIST,
+        "how_to_use": _STRING_LIST,
+        "prerequisites": _STRING_LIST,
+    },
+    required=("topic_overview", "what_you_will_learn"),
+)
+
+RESOURCE_ITEM = _object(
+    {"name": _STRING, "description": _STRING, "url": _STRING, "access": _STRING},
+    required=("name", "description"),
+)
+
+GLOSSARY_ENTRY = _object({"term": _STRING, "definition": _STRING}, required=("term", "definition"))
+
+SUPPLEMENTARY = _object(
+    {
+        "recommended_tools": _array(RESOURCE_ITEM),
+        "external_resources": _array(RESOURCE_ITEM),
+        "glossary": _array(GLOSSARY_ENTRY),
+        "references": _STRING_LIST,
+    },
+    required=("recommended_tools", "external_resources"),
+)
+
+TOPIC_ANALYSIS = _object(
+    {
+        "competency_model": _array(_object({"level": _STRING, "skills": _STRING_LIST}, required=("level", "skills")), 1),
+        "critical_prerequisites": _array(
+            _object(
+                {"skill": _STRING, "why": _STRING, "validation": _STRING, "risk_if_missing": _STRING},
+                required=("skill", "why"),
+            )
+        ),
+        "helpful_prerequisites": _array(
+            _object({"skill": _STRING, "why": _STRING, "workaround": _STRING}, required=("skill", "why"))
+        ),
+        "knowledge_gaps": _array(
+            _object({"gap": _STRING, "why_it_matters": _STRING, "time_to_cover": _STRING}, required=("gap",))
+        ),
+        "misconceptions": _array(
+            _object(
+                {"misconception": _STRING, "reality": _STRING, "fix": _STRING, "when_to_address": _STRING},
+                required=("misconception", "reality"),
+            )
+        ),
+        "learning_objectives": _array(_STRING, 1),
+        "scope": _object(
+            {
+                "time_breakdown": _STRING,
+                "cover": _STRING_LIST,
+                "touch_on": _STRING_LIST,
+                "exclude": _STRING_LIST,
+                "risks_and_assumptions": _STRING_LIST,
+            },
+            required=("time_breakdown", "cover"),
+        ),
+        "industry_insights": _STRING_LIST,
+    },
+    required=("competency_model", "critical_prerequisites", "learning_objectives", "scope"),
+)
+
+STRUCTURE_PLAN = _object(
+    {
+        "book_title": _STRING,
+        "progression": _STRING,
+        "chapters": _array(
+            _object(
+                {
+                    "chapter_number": {"type": "integer", "minimum": 1},
+                    "title": _STRING,
+                    "focus": _STRING,
+                    "learning_objectives": _STRING_LIST,
+                    "prerequisites": _STRING_LIST,
+                    "depends_on": {"type": "array", "items": _INTEGER},
+                    "complexity": _STRING,
+                    "estimated_time_minutes": _INTEGER,
+                    # Content creator (1 or 2) writing the chapter in sequential mode.
+                    "assigned_to": {"type": "integer", "enum": [1, 2]},
+                },
+                required=("chapter_number", "title", "focus"),
+            ),
+            1,
+        ),
+    },
+    required=("chapters",),
+)
+
+CHAPTERS = _object({"chapters": _array(CHAPTER, 1)}, required=("chapters",))
+
+ASSESSMENTS = _object(
+    {
+        "chapter_quizzes": _array(
+            _object(
+                {"chapter_number": _INTEGER, "title": _STRING, "questions": _array(QUIZ_QUESTION, 1)},
+                required=("chapter_number", "questions"),
+            )
+        ),
+        "practice_exercises": _array(HANDS_ON_EXERCISE),
+        "checkpoints": _STRING_LIST,
+        "capstone_projects": _array(HANDS_ON_EXERCISE),
+        "final_assessment": _array(QUIZ_QUESTION),
+        "mastery_criteria": _STRING_LIST,
+    },
+    required=("chapter_quizzes", "practice_exercises", "final_assessment"),
+)
+
+FRONT_MATTER = _object(
+    {"title": _STRING, "introduction": INTRODUCTION, "summary": _STRING},
+    required=("title", "introduction", "summary"),
+)
+
+BOOK = _object(
+    {
+        "title": _STRING,
+        "introduction": INTRODUCTION,
+        "chapters": _array(CHAPTER, 1),
+        "supplementary": SUPPLEMENTARY,
+        "summary": _STRING,
+    },
+    required=("title", "introduction", "chapters", "supplementary", "summary"),
+)
+
+# Keyed by task name (the crew's @task method name).
+TASK_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "analyze_topic_and_requirements": TOPIC_ANALYSIS,
+    "analyze_chapter_structure": STRUCTURE_PLAN,
+    "create_assigned_chapters_1": CHAPTERS,
+    "create_assigned_chapters_2": CHAPTERS,
+    "create_planned_chapters": CHAPTERS,
+    "curate_and_verify_resources": SUPPLEMENTARY,
+    "create_assessments_and_exercises": ASSESSMENTS,
+    "write_book_front_matter": FRONT_MATTER,
+    "compile_comprehensive_tutorial_book": BOOK,
+}
+
+
+def get_task_schema(task_name: str) -> Dict[str, Any]:
+    try:
+        return TASK_SCHEMAS[task_name]
+    except KeyError:
+        raise ValueError(f"No output schema defined for task '{task_name}'") from None
+
+
+def schema_instructions(task_name: str) -> str:
+    """Prompt text asking for a bare JSON object that validates against the task schema."""
+    return (
+        "Return your final answer as ONE JSON object (no markdown fences, no commentary) that "
+        "validates against this JSON schema. Put markdown formatting inside string values only.\n"
+        + json.dumps(get_task_schema(task_name), separators=(",", ":"))
+    )
+
+
+__all__ = ["TASK_SCHEMAS", "get_task_schema", "schema_instructions"]
@@ -10,10 +10,12 @@ from .tasks_srp import (
     get_analyze_chapter_structure_task,
     get_create_assigned_chapters_1_task,
     get_create_assigned_chapters_2_task,
+    get_create_planned_chapters_task,
     get_curate_and_verify_resources_task,
     get_create_assessments_and_exercises_task,
     get_compile_comprehensive_tutorial_task,
     get_convert_tutorial_to_html_format_task,
+    get_write_book_front_matter_task,
 )
 
 __all__ = [
@@ -21,8 +23,10 @@ __all__ = [
     "get_analyze_chapter_structure_task",
     "get_create_assigned_chapters_1_task",
     "get_create_assigned_chapters_2_task",
+    "get_create_planned_chapters_task",
     "get_curate_and_verify_resources_task",
     "get_create_assessments_and_exercises_task",
     "get_compile_comprehensive_tutorial_task",
     "get_convert_tutorial_to_html_format_task",
+    "get_write_book_front_matter_task",
 ]
\ No newline at end of file
@@ -9,18 +9,22 @@ from .analyze_topic_and_requirements import get_analyze_topic_and_requirements_t
 from .analyze_chapter_structure import get_analyze_chapter_structure_task
 from .create_assigned_chapters_1 import get_create_assigned_chapters_1_task
 from .create_assigned_chapters_2 import get_create_assigned_chapters_2_task
+from .create_planned_chapters import get_create_planned_chapters_task
 from .curate_and_verify_resources import get_curate_and_verify_resources_task
 from .create_assessments_and_exercises import get_create_assessments_and_exercises_task
 from .compile_comprehensive_tutorial import get_compile_comprehensive_tutorial_task
 from .convert_tutorial_to_html_format import get_convert_tutorial_to_html_format_task
+from .write_book_front_matter import get_write_book_front_matter_task
 
 __all__ = [
     "get_analyze_topic_and_requirements_task",
     "get_analyze_chapter_structure_task",
     "get_create_assigned_chapters_1_task",
     "get_create_assigned_chapters_2_task",
+    "get_create_planned_chapters_task",
     "get_curate_and_verify_resources_task",
     "get_create_assessments_and_exercises_task",
     "get_compile_comprehensive_tutorial_task",
     "get_convert_tutorial_to_html_format_task",
+    "get_write_book_front_matter_task",
 ]
\ No newline at end of file
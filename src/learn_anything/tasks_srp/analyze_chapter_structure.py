@@ -1,5 +1,8 @@
 from crewai import Task
 
+from learn_anything.structured_output import SCHEMA_GUARDRAIL_RETRIES, make_schema_guardrail
+from learn_anything.task_schemas import schema_instructions
+
 
 def get_analyze_chapter_structure_task() -> Task:
     """Task for analyzing book chapter structure to determine optimal organization."""
@@ -19,16 +22,20 @@ def get_analyze_chapter_structure_task() -> Task:
    - Estimated effort required for learners
 
 3. **Book Flow and Progression**: Create a logical sequence that builds knowledge progressively
-4. **Parallel Content Creation Plan**: Assign chapters to available content creators while
-   respecting the time budget for the learner
+4. **Parallel Content Creation Plan**: Assign each chapter to content creator 1 or 2 in
+   `assigned_to`, balancing the work between them while respecting the time budget for the
+   learner
 5. **Chapter Dependencies**: Identify which chapters must be sequential vs. which can be
    created independently
 
-Output a clear book structure plan with specific chapter assignments for each content
-creator agent.""",
-      expected_output="""Detailed book chapter structure including: exact number of chapters
-   needed, specific chapter titles and objectives, content creator assignments for parallel
-   processing, and chapter dependency mapping. Format as a structured book outline with
-   clear assignments.""",
+Number the chapters from 1 in reading order; each chapter is handed to an author
+individually, so list chapter dependencies in `depends_on`.
+
+"""
+      + schema_instructions("analyze_chapter_structure"),
+      expected_output="""A JSON book structure plan including: the chapters needed, in order, with
+   numbers, titles, focus, objectives, creator assignments, and chapter dependency mapping.""",
       agent=None,
+      guardrail=make_schema_guardrail("analyze_chapter_structure"),
+      guardrail_max_retries=SCHEMA_GUARDRAIL_RETRIES,
     )
\ No newline at end of file
@@ -1,5 +1,8 @@
 from crewai import Task
 
+from learn_anything.structured_output import SCHEMA_GUARDRAIL_RETRIES, make_schema_guardrail
+from learn_anything.task_schemas import schema_instructions
+
 
 def get_analyze_topic_and_requirements_task() -> Task:
     """Task for analyzing topic and requirements to create a validated foundation for curriculum design."""
@@ -114,90 +117,15 @@ Research current standards for {topic}:
 - Focus areas in reputable courses or bootcamps
 - Recent changes or trends learners should know
 
-Use this to recommend which skills and terminology to prioritise during curriculum design.""",
-        expected_output="""Return your analysis in this structure:
-TOPIC ANALYSIS: {topic}
-═══════════════════════════════════════════════════════════════
-
-COMPETENCY MODEL
-───────────────────────────────────────────────────────────────
-Level 1 - AWARENESS:
-
-
-[Skill 1]
-[Skill 2]
-...
-
-Level 2 - COMPREHENSION:
-
-[Skill 1]
-...
-
-Level 3 - APPLICATION:
-
-[Skill 1]
-...
-
-
-PREREQUISITE ANALYSIS
-───────────────────────────────────────────────────────────────
-CRITICAL PREREQUISITES:
-
-
-[Prerequisite 1]
-
-Why: [Explanation]
-Validation: [How to check]
-Risk if missing: [Impact]
-
-
-
-HELPFUL PREREQUISITES:
-
-[Prerequisite 1]
-
-Why: [Benefit]
-Workaround: [Alternative]
-
-
-
-KNOWLEDGE GAPS TO ADDRESS:
-
-[Gap 1]
-Why it matters: [Reason]
-Time to cover: [Estimate]
-
-
-COMMON MISCONCEPTIONS
-───────────────────────────────────────────────────────────────
-[Misconception]
-Reality: [Correction]
-Fix: [Strategy]
-When to address: [Module/lesson]
-
-
-MEASURABLE LEARNING OBJECTIVES
-───────────────────────────────────────────────────────────────
-1. [Objective]
-...
-
-
-SCOPE VALIDATION
-───────────────────────────────────────────────────────────────
-Time breakdown: [Minutes/session * sessions/week * weeks]
-Coverage plan:
-- Cover: [...]
-- Touch on: [...]
-- Exclude: [...]
-Risks & assumptions: [...]
-
-
-INDUSTRY INSIGHTS
-───────────────────────────────────────────────────────────────
-- [Insight 1]
-- [Insight 2]
+Use this to recommend which skills and terminology to prioritise during curriculum design.
 
-""",
+"""
+        + schema_instructions("analyze_topic_and_requirements"),
+        expected_output="""A JSON topic analysis for {topic}: the competency model by Bloom level,
+critical and helpful prerequisites, knowledge gaps, common misconceptions, measurable learning
+objectives, a scope validation for {time_commitment}, and industry insights.""",
+                guardrail=make_schema_guardrail("analyze_topic_and_requirements"),
+                guardrail_max_retries=SCHEMA_GUARDRAIL_RETRIES,
                 agent=None,
                 context=[],
         )
\ No newline at end of file
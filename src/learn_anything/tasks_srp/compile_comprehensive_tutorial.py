@@ -1,5 +1,8 @@
 from crewai import Task
 
+from learn_anything.structured_output import SCHEMA_GUARDRAIL_RETRIES, make_schema_guardrail
+from learn_anything.task_schemas import schema_instructions
+
 
 def get_compile_comprehensive_tutorial_task() -> Task:
     """Task for compiling all components into a comprehensive tutorial book."""
@@ -40,12 +43,19 @@ For each chapter/section (excluding the final summary chapter):
 - Provide next-step challenges, further learning quests, and encouragement for continued growth
 - Include a reflection checklist and optional journaling prompts
 
-Format as a complete tutorial book that readers can use independently to master {topic}.""",
-        expected_output="""A comprehensive tutorial book with complete chapters covering 
+Format as a complete tutorial book that readers can use independently to master {topic}. Fold the
+gamified assessments into each chapter's `quiz`, the supplementary resources into `supplementary`, and
+the summary and next steps into `summary`.
+
+"""
+        + schema_instructions("compile_comprehensive_tutorial_book"),
+        expected_output="""A JSON tutorial book with complete chapters covering 
     all aspects of {topic}. Include: (1) Book introduction and usage guide, (2) Detailed 
     tutorial content with explanations, procedures, examples, and exercises, (3) Supplementary 
     resources and references, (4) Assessment materials that extend the per-chapter gamified 
     experiences into cumulative challenges, and (5) A closing summary chapter with next-step 
     guidance. The content should be self-contained, gamefully engaging, and book-like in structure.""",
         agent=None,
+        guardrail=make_schema_guardrail("compile_comprehensive_tutorial_book"),
+        guardrail_max_retries=SCHEMA_GUARDRAIL_RETRIES,
     )
\ No newline at end of file
@@ -1,9 +1,19 @@
+from typing import Callable, Optional
+
 from crewai import Task
+from crewai.tasks.conditional_task import ConditionalTask
+from crewai.tasks.task_output import TaskOutput
+
 
+def get_convert_tutorial_to_html_format_task(
+    condition: Optional[Callable[[TaskOutput], bool]] = None,
+) -> Task:
+    """Task for converting the tutorial book to HTML-ready format.
 
-def get_convert_tutorial_to_html_format_task() -> Task:
-    """Task for converting the tutorial book to HTML-ready format."""
-    return Task(
+    With a ``condition`` the task becomes a ``ConditionalTask`` that only runs
+    when the condition holds for the compiled book output.
+    """
+    task_kwargs = dict(
         description="""Convert the compiled tutorial book into a professionally structured HTML 
     document for {topic}. Deliver a complete `<html>` document (including `<head>` and `<body>`) that:
 
@@ -26,3 +36,6 @@ Include all book components: introduction, chapters, resources, glossary, append
         output_file="outputs/{topic}_tutorial.html",
         agent=None,
     )
+    if condition is not None:
+        return ConditionalTask(condition=condition, **task_kwargs)
+    return Task(**task_kwargs)
@@ -1,5 +1,8 @@
 from crewai import Task
 
+from learn_anything.structured_output import SCHEMA_GUARDRAIL_RETRIES, make_schema_guardrail
+from learn_anything.task_schemas import schema_instructions
+
 
 def get_create_assessments_and_exercises_task() -> Task:
     """Task for creating comprehensive assessments and exercises."""
@@ -30,12 +33,16 @@ def get_create_assessments_and_exercises_task() -> Task:
 - Mastery criteria and certification requirements
 - Performance analytics and improvement suggestions
 
-Create assessments that truly measure understanding and provide actionable feedback to learners.""",
-        expected_output="""Complete assessment framework including: detailed module quizzes 
-    with questions, answers, and explanations; practice exercises with solutions; 
-    checkpoint assessments with feedback mechanisms; and comprehensive evaluation 
-    tools. All assessments must include clear rubrics, mastery thresholds, and detailed 
-    answer keys.""",
+Create assessments that truly measure understanding and provide actionable feedback to learners.
+Key each quiz in `chapter_quizzes` by the chapter number from the book structure plan.
+
+"""
+        + schema_instructions("create_assessments_and_exercises"),
+        expected_output="""A JSON assessment framework including: per-chapter quizzes with
+    questions, answers, and explanations; practice exercises and capstone projects with
+    solutions; checkpoints; a final assessment; and mastery criteria.""",
         agent=None,
+        guardrail=make_schema_guardrail("create_assessments_and_exercises"),
+        guardrail_max_retries=SCHEMA_GUARDRAIL_RETRIES,
         async_execution=True,
     )
\ No newline at end of file
@@ -1,5 +1,8 @@
 from crewai import Task
 
+from learn_anything.structured_output import SCHEMA_GUARDRAIL_RETRIES, make_schema_guardrail
+from learn_anything.task_schemas import schema_instructions
+
 
 def get_create_assigned_chapters_2_task() -> Task:
     """Task for creating assigned book chapters by Content Creator 2."""
@@ -22,11 +25,17 @@ def get_create_assigned_chapters_2_task() -> Task:
 9. **Chapter Quiz**: 5-10 questions with detailed answers and explanations
 
 Research current information using available tools to ensure content accuracy and relevance. 
-Work only on chapters specifically assigned to Creator 2 in the book structure plan.""",
-        expected_output="""Complete comprehensive book chapters for specifically assigned 
+Work only on the chapters whose `assigned_to` is 2 in the book structure plan. If the plan
+assigns no chapters, write the even-numbered chapters (2, 4, 6, ...) and leave the others to the other creator.
+
+"""
+        + schema_instructions("create_assigned_chapters_2"),
+        expected_output="""A JSON object whose "chapters" list holds the specifically assigned 
     chapters with appropriate depth based on the learner skill level and available study time. Include detailed theoretical 
     content, step-by-step procedures, practical examples, exercises with solutions, 
     troubleshooting guides, and chapter assessments needed for readers to master the 
     material.""",
         agent=None,
+        guardrail=make_schema_guardrail("create_assigned_chapters_2"),
+        guardrail_max_retries=SCHEMA_GUARDRAIL_RETRIES,
     )
\ No newline at end of file
@@ -0,0 +1,55 @@
+from typing import List
+
+from crewai import Task
+
+from learn_anything.chapter_plan import ChapterPlanItem
+from learn_anything.structured_output import SCHEMA_GUARDRAIL_RETRIES, make_schema_guardrail
+from learn_anything.task_schemas import schema_instructions
+
+
+def get_create_planned_chapters_task(chapters: List[ChapterPlanItem]) -> Task:
+    """Task for writing one batch of chapters from the book structure plan.
+
+    An empty ``chapters`` list assigns every chapter in the plan, which is used
+    when the plan could not be split into individual chapters.
+    """
+    if chapters:
+        assignment = "\n".join(f"- {item.label}" for item in chapters)
+        scope = "Write ONLY the following chapters from the book structure plan:"
+    else:
+        assignment = "- Every chapter listed in the book structure plan"
+        scope = "Write the chapters from the book structure plan:"
+
+    return Task(
+        description=f"""Generate comprehensive tutorial book content for {{topic}} based on the book
+    structure analysis. Tailor the depth of coverage to suit {{skill_level}} learners who have
+    {{time_commitment}} to invest.
+
+{scope}
+{assignment}
+
+**Book Chapter Components (for each assigned chapter):**
+1. **Chapter Introduction**: Overview of what will be covered and learning objectives
+2. **Detailed Theoretical Explanations**: Complete concepts, principles, background knowledge, 
+    and theory
+3. **Step-by-Step Procedures**: Clear, actionable instructions and techniques with screenshots/diagrams where helpful
+4. **Practical Examples and Case Studies**: Real-world applications, scenarios, and worked examples
+5. **Hands-On Exercises**: Practice activities with detailed solutions and explanations
+6. **Troubleshooting Guides**: Common problems, error messages, and solutions
+7. **Best Practices and Expert Tips**: Professional insights, recommendations, and advanced techniques sized appropriately for the learner profile
+8. **Chapter Summary**: Key takeaways and what was learned
+9. **Chapter Quiz**: 5-10 questions with detailed answers and explanations
+
+Keep chapter numbers and titles exactly as given in the plan. Other authors are writing the
+remaining chapters in parallel, so do not write introductions or summaries for the whole book.
+
+"""
+        + schema_instructions("create_planned_chapters"),
+        expected_output="""A JSON object whose "chapters" list holds the assigned chapters only, with 
+    appropriate depth based on the learner skill level and available study time. Include detailed 
+    theoretical content, step-by-step procedures, practical examples, exercises with solutions, 
+    troubleshooting guides, and chapter assessments needed for readers to master the material.""",
+        agent=None,
+        guardrail=make_schema_guardrail("create_planned_chapters"),
+        guardrail_max_retries=SCHEMA_GUARDRAIL_RETRIES,
+    )
@@ -1,5 +1,8 @@
 from crewai import Task
 
+from learn_anything.structured_output import SCHEMA_GUARDRAIL_RETRIES, make_schema_guardrail
+from learn_anything.task_schemas import schema_instructions
+
 
 def get_curate_and_verify_resources_task() -> Task:
     """Task for curating and verifying external learning resources."""
@@ -14,10 +17,18 @@ def get_curate_and_verify_resources_task() -> Task:
 
 Focus on providing resource recommendations and categories rather than extensive link 
 validation. Provide search terms and resource types when specific URLs aren't 
-available.""",
-        expected_output="""A curated resource guide with recommended learning materials organized 
-    by category, including resource descriptions, quality assessments, and alternative 
-    options. Focus on resource recommendations rather than extensive link validation.""",
+available. Put tools and materials learners need to practice in `recommended_tools`, books,
+courses, websites and documentation in `external_resources`, and include a glossary of key
+terms and a list of references. Note the category, quality and access (free/paid) of each
+resource in its `description` and `access` fields.
+
+"""
+        + schema_instructions("curate_and_verify_resources"),
+        expected_output="""A JSON curated resource guide with recommended tools, external learning
+    materials with descriptions, quality and access notes, a glossary, and references. Focus on
+    resource recommendations rather than extensive link validation.""",
         agent=None,
+        guardrail=make_schema_guardrail("curate_and_verify_resources"),
+        guardrail_max_retries=SCHEMA_GUARDRAIL_RETRIES,
         async_execution=True,
     )
\ No newline at end of file
@@ -0,0 +1,39 @@
+from crewai import Task
+
+from learn_anything.structured_output import SCHEMA_GUARDRAIL_RETRIES, make_schema_guardrail
+from learn_anything.task_schemas import schema_instructions
+
+
+def get_write_book_front_matter_task() -> Task:
+    """Task for writing only the book title, introduction, and closing summary.
+
+    The chapters themselves are assembled locally from the chapter creators'
+    output, so this task never re-emits chapter content.
+    """
+    return Task(
+        description="""Write the front and back matter of the tutorial book on {topic} for
+    {skill_level} learners who have {time_commitment} to invest, using the topic analysis and
+    the book structure plan. Other authors are writing the chapters; do NOT write chapter content.
+
+**1. BOOK TITLE**
+
+**2. BOOK INTRODUCTION**
+- Topic overview and what readers will learn
+- Who this book is for (target audience)
+- How to use this book effectively
+- Prerequisites and required knowledge
+
+**3. SUMMARY & NEXT STEPS (FINAL CHAPTER)**
+- Recap the key insight of every planned chapter in one or two sentences each
+- Provide next-step challenges, further learning quests, and encouragement for continued growth
+- Include a reflection checklist
+
+"""
+        + schema_instructions("write_book_front_matter"),
+        expected_output="""A JSON object with the book title, a structured introduction, and a
+    closing summary for {topic}. Keep it concise: the whole response should stay well under
+    1,500 words.""",
+        agent=None,
+        guardrail=make_schema_guardrail("write_book_front_matter"),
+        guardrail_max_retries=SCHEMA_GUARDRAIL_RETRIES,
+    )
@@ -0,0 +1,524 @@
+"""Per-task and per-LLM-call metrics for a run, and reports across many runs.
+
+A ``RunTelemetry`` is handed to the crew, which reports task starts and
+completions through its task callback; ``llm_wrappers.MeteredLLM`` reports
+every LLM call made on behalf of a watched task: timestamps, input and output
+tokens, retries, response-cache hits and an estimated cost. The LLMs returned
+by ``get_llm`` are shared by every run in the process, so calls are attributed
+through the task that made them rather than through the LLM.
+
+Like the checkpoints, this module does not import crewAI.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import glob
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from learn_anything.checkpoints import _write_json_atomic
+
+TELEMETRY_FILENAME = "telemetry.json"
+TELEMETRY_SUFFIX = ".telemetry.json"
+REPORT_GROUPS = ("task", "agent", "model", "topic", "run")
+
+# Tasks without a watched crew task (e.g. the locally assembled book) and LLM
+# calls that crewAI makes without a task are recorded under this name.
+UNATTRIBUTED_TASK = "(unattributed)"
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="milliseconds")
+
+
+def _env_price(key: str) -> Optional[float]:
+    try:
+        return float(os.environ[key])
+    except (KeyError, ValueError):
+        return None
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int) -> Optional[float]:
+    """Estimate the USD cost of a call, or None when the model's price is unknown.
+
+    ``LLM_INPUT_COST_PER_MTOK`` and ``LLM_OUTPUT_COST_PER_MTOK`` (USD per
+    million tokens) override LiteLLM's price table, e.g. for negotiated rates.
+    """
+    input_price = _env_price("LLM_INPUT_COST_PER_MTOK")
+    output_price = _env_price("LLM_OUTPUT_COST_PER_MTOK")
+    if input_price is not None or output_price is not None:
+        return ((input_price or 0.0) * input_tokens + (output_price or 0.0) * output_tokens) / 1_000_000
+    try:
+        from litellm import cost_per_token
+
+        input_cost, output_cost = cost_per_token(
+            model=model, prompt_tokens=input_tokens, completion_tokens=output_tokens
+        )
+    except Exception:
+        return None
+    return input_cost + output_cost
+
+
+@dataclass
+class LLMCallRecord:
+    task: str
+    agent: str
+    model: str
+    started_at: str = field(default_factory=_now)
+    duration_seconds: float = 0.0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    # True when the provider reported no usage and the counts are estimates.
+    tokens_estimated: bool = False
+    cache_hit: bool = False
+    retries: int = 0
+    rate_limit_wait_seconds: float = 0.0
+    cost_usd: Optional[float] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class TaskRecord:
+    name: str
+    agent: str = ""
+    # completed, restored (from a checkpoint), local (no LLM), failed, or not_completed
+    status: str = "not_completed"
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    duration_seconds: Optional[float] = None
+    llm_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    cache_hits: int = 0
+    retries: int = 0
+    errors: int = 0
+    cost_usd: Optional[float] = None
+    _started: Optional[float] = field(default=None, repr=False)
+
+    def add_call(self, call: LLMCallRecord) -> None:
+        self.llm_calls += 1
+        self.input_tokens += call.input_tokens
+        self.output_tokens += call.output_tokens
+        self.cached_input_tokens += call.cached_input_tokens
+        self.cache_hits += int(call.cache_hit)
+        self.retries += call.retries
+        self.errors += int(call.error is not None)
+        if call.cost_usd is not None:
+            self.cost_usd = (self.cost_usd or 0.0) + call.cost_usd
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {item.name: getattr(self, item.name) for item in fields(self) if not item.name.startswith("_")}
+
+
+_CURRENT_CALL: contextvars.ContextVar[Optional[LLMCallRecord]] = contextvars.ContextVar(
+    "learn_anything_llm_call", default=None
+)
+
+
+def note_cache_hit() -> None:
+    """Mark the LLM call in progress as answered from the response cache."""
+    call = _CURRENT_CALL.get()
+    if call is not None:
+        call.cache_hit = True
+
+
+def note_retry(waited_seconds: float = 0.0) -> None:
+    """Count a rate-limit retry of the LLM call in progress."""
+    call = _CURRENT_CALL.get()
+    if call is not None:
+        call.retries += 1
+        call.rate_limit_wait_seconds += waited_seconds
+
+
+def note_rate_limit_wait(seconds: float) -> None:
+    call = _CURRENT_CALL.get()
+    if call is not None:
+        call.rate_limit_wait_seconds += seconds
+
+
+class RunTelemetry:
+    """Thread-safe recorder for the tasks and LLM calls of one run.
+
+    Tasks are registered with ``watch`` before their crew starts; in a
+    sequential crew each task starts when the one before it completes.
+    ``save`` writes everything as JSON. A telemetry file loaded with ``load``
+    keeps recording, so a resumed run is billed for every attempt.
+    """
+
+    def __init__(self, run_id: str = "", topic: str = ""):
+        self._lock = threading.Lock()
+        self.run_id = run_id
+        self.topic = topic
+        self.started_at = _now()
+        self.finished_at: Optional[str] = None
+        self.status = "running"
+        self.attempts = 1
+        self.tasks: Dict[str, TaskRecord] = {}
+        self.calls: List[LLMCallRecord] = []
+        self.crew_token_usage: Dict[str, Any] = {}
+        self._started = time.perf_counter()
+        self._next_task: Dict[str, str] = {}
+
+    @classmethod
+    def load(cls, path: Path) -> "RunTelemetry":
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        telemetry = cls(run_id=data.get("run_id", ""), topic=data.get("topic", ""))
+        telemetry.started_at = data.get("started_at") or telemetry.started_at
+        telemetry.attempts = int(data.get("attempts") or 1) + 1
+        telemetry.tasks = {item["name"]: TaskRecord(**item) for item in data.get("tasks", [])}
+        telemetry.calls = [LLMCallRecord(**item) for item in data.get("llm_calls", [])]
+        return telemetry
+
+    @classmethod
+    def for_run_dir(cls, run_dir: Path, run_id: str = "", topic: str = "") -> "RunTelemetry":
+        """Continue the telemetry saved in ``run_dir`` (on resume) or start a new one."""
+        path = Path(run_dir) / TELEMETRY_FILENAME
+        if path.exists():
+            try:
+                return cls.load(path)
+            except (OSError, ValueError, TypeError, KeyError):
+                pass
+        return cls(run_id=run_id, topic=topic)
+
+    def watch(self, tasks: Sequence[Any]) -> None:
+        """Attribute the LLM calls of ``tasks`` (crewAI tasks run in this order) to this run.
+
+        The first task starts now; each following task starts when the task
+        before it completes.
+        """
+        with self._lock:
+            for position, task in enumerate(tasks):
+                _register_task(task, self)
+                record = self._record(task.name)
+                record.agent = _agent_role(getattr(task, "agent", None))
+                if position == 0:
+                    self._start(record)
+                if position + 1 < len(tasks):
+                    self._next_task[task.name] = tasks[position + 1].name
+
+    def task_completed(self, output: Any) -> None:
+        """Task callback: close the record of ``output.name`` and start the next task."""
+        name = getattr(output, "name", None) or UNATTRIBUTED_TASK
+        with self._lock:
+            record = self._record(name)
+            self._finish(record, "completed")
+            record.agent = record.agent or str(getattr(output, "agent", "") or "")
+            next_name = self._next_task.pop(name, None)
+            if next_name is not None:
+                self._start(self._record(next_name))
+
+    def task_restored(self, name: Optional[str]) -> None:
+        """Note a task restored from a checkpoint; metrics from an earlier attempt are kept."""
+        with self._lock:
+            record = self._record(name or UNATTRIBUTED_TASK)
+            if record.status == "not_completed":
+                record.status = "restored"
+
+    def local_task(self, name: Optional[str], agent: str) -> "_LocalTask":
+        """Context manager timing a task produced locally instead of by an LLM."""
+        return _LocalTask(self, name or UNATTRIBUTED_TASK, agent)
+
+    def record_call(self, call: LLMCallRecord) -> None:
+        with self._lock:
+            self.calls.append(call)
+            self._record(call.task).add_call(call)
+
+    def finish(self, status: str, token_usage: Any = None) -> None:
+        """Close the run; with ``status="failed"`` the tasks still running are marked failed."""
+        with self._lock:
+            self.status = status
+            self.finished_at = _now()
+            if status == "failed":
+                for record in self.tasks.values():
+                    if record.status == "not_completed" and record._started is not None:
+                        self._finish(record, "failed")
+            if token_usage is not None:
+                dump = getattr(token_usage, "model_dump", None)
+                self.crew_token_usage = dump() if callable(dump) else dict(token_usage)
+        _unregister_run(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            tasks = [record.to_dict() for record in self.tasks.values()]
+            calls = [asdict(call) for call in self.calls]
+            totals = _totals(self.tasks.values())
+            return {
+                "run_id": self.run_id,
+                "topic": self.topic,
+                "status": self.status,
+                "attempts": self.attempts,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+                "duration_seconds": round(time.perf_counter() - self._started, 3),
+                "totals": totals,
+                "crew_token_usage": self.crew_token_usage,
+                "tasks": tasks,
+                "llm_calls": calls,
+            }
+
+    def save(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _write_json_atomic(path, self.to_dict())
+        return path
+
+    def _record(self, name: str) -> TaskRecord:
+        record = self.tasks.get(name)
+        if record is None:
+            record = self.tasks[name] = TaskRecord(name=name)
+        return record
+
+    @staticmethod
+    def _start(record: TaskRecord) -> None:
+        record.started_at = _now()
+        record._started = time.perf_counter()
+
+    @staticmethod
+    def _finish(record: TaskRecord, status: str) -> None:
+        record.status = status
+        record.finished_at = _now()
+        if record._started is not None:
+            record.duration_seconds = round(time.perf_counter() - record._started, 3)
+
+
+class _LocalTask:
+    def __init__(self, telemetry: RunTelemetry, name: str, agent: str):
+        self._telemetry = telemetry
+        self._name = name
+        self._agent = agent
+
+    def __enter__(self) -> "_LocalTask":
+        with self._telemetry._lock:
+            record = self._telemetry._record(self._name)
+            record.agent = self._agent
+            self._telemetry._start(record)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None:
+            with self._telemetry._lock:
+                self._telemetry._finish(self._telemetry._record(self._name), "local")
+
+
+def _agent_role(agent: Any) -> str:
+    return str(getattr(agent, "role", "") or "").strip()
+
+
+def _totals(records: Iterable[TaskRecord]) -> Dict[str, Any]:
+    totals: Dict[str, Any] = {
+        "llm_calls": 0,
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "cached_input_tokens": 0,
+        "cache_hits": 0,
+        "retries": 0,
+        "errors": 0,
+        "cost_usd": None,
+    }
+    for record in records:
+        for key in totals:
+            value = getattr(record, key)
+            if key == "cost_usd":
+                if value is not None:
+                    totals[key] = (totals[key] or 0.0) + value
+            else:
+                totals[key] += value
+    return totals
+
+
+# Watched tasks, keyed by id(), so calls from shared LLMs find their run.
+_RUNS_BY_TASK: Dict[int, RunTelemetry] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _register_task(task: Any, telemetry: RunTelemetry) -> None:
+    with _REGISTRY_LOCK:
+        _RUNS_BY_TASK[id(task)] = telemetry
+
+
+def _unregister_run(telemetry: RunTelemetry) -> None:
+    with _REGISTRY_LOCK:
+        for key in [key for key, value in _RUNS_BY_TASK.items() if value is telemetry]:
+            del _RUNS_BY_TASK[key]
+
+
+def telemetry_for_task(task: Any) -> Optional[RunTelemetry]:
+    """Return the run watching ``task``, or the only active run when the call has no task."""
+    with _REGISTRY_LOCK:
+        if task is not None and id(task) in _RUNS_BY_TASK:
+            return _RUNS_BY_TASK[id(task)]
+        runs = {id(run): run for run in _RUNS_BY_TASK.values()}
+    if task is None and len(runs) == 1:
+        return next(iter(runs.values()))
+    return None
+
+
+def begin_call(record: LLMCallRecord) -> contextvars.Token:
+    return _CURRENT_CALL.set(record)
+
+
+def end_call(token: contextvars.Token) -> None:
+    _CURRENT_CALL.reset(token)
+
+
+def telemetry_path_for(json_path: str) -> str:
+    """Path of the telemetry file written alongside a saved JSON output."""
+    root, _ = os.path.splitext(json_path)
+    return root + TELEMETRY_SUFFIX
+
+
+def find_telemetry_files(patterns: Iterable[str]) -> List[str]:
+    """Expand telemetry files, directories searched recursively, and glob patterns."""
+    found: List[str] = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for path in matches:
+            if os.path.isdir(path):
+                for root, _, names in sorted(os.walk(path)):
+                    found.extend(
+                        os.path.join(root, name)
+                        for name in sorted(names)
+                        if name == TELEMETRY_FILENAME or name.endswith(TELEMETRY_SUFFIX)
+                    )
+            elif os.path.exists(path):
+                found.append(path)
+            else:
+                raise FileNotFoundError(f"No such file or directory: {path}")
+    return list(dict.fromkeys(found))
+
+
+def _load_runs(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Yield each run once; the copy in the run directory and the one beside the JSON output match."""
+    seen = set()
+    for path in paths:
+        with open(path, encoding="utf-8") as handle:
+            data = json.load(handle)
+        key = data.get("run_id") or path
+        if key in seen:
+            continue
+        seen.add(key)
+        yield data
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def aggregate_runs(paths: Iterable[str], group_by: str = "task") -> Dict[str, Any]:
+    """Sum the saved telemetry of many runs into rows grouped by ``group_by``.
+
+    Task, agent, topic and run rows are built from the task records; model
+    rows from the LLM calls, which carry the model name.
+    """
+    if group_by not in REPORT_GROUPS:
+        raise ValueError(f"Unknown group '{group_by}'; expected one of {', '.join(REPORT_GROUPS)}")
+    rows: Dict[str, Dict[str, Any]] = {}
+    durations: Dict[str, List[float]] = {}
+    runs = 0
+    for data in _load_runs(paths):
+        runs += 1
+        if group_by == "model":
+            items = [
+                dict(call, name=call["task"], llm_calls=1, cache_hits=int(call["cache_hit"]), errors=int(bool(call["error"])))
+                for call in data.get("llm_calls", [])
+            ]
+        else:
+            items = data.get("tasks", [])
+        for item in items:
+            key = {
+                "task": item["name"],
+                "agent": item.get("agent") or "",
+                "model": item.get("model") or "",
+                "topic": data.get("topic") or "",
+                "run": data.get("run_id") or "",
+            }[group_by] or "(none)"
+            row = rows.setdefault(key, {"group": key, "runs": set(), "count": 0, **_totals([])})
+            row["runs"].add(data.get("run_id"))
+            row["count"] += 1
+            for name in ("llm_calls", "input_tokens", "output_tokens", "cached_input_tokens", "cache_hits", "retries", "errors"):
+                row[name] += item.get(name) or 0
+            if item.get("cost_usd") is not None:
+                row["cost_usd"] = (row["cost_usd"] or 0.0) + item["cost_usd"]
+            if item.get("duration_seconds") is not None:
+                durations.setdefault(key, []).append(item["duration_seconds"])
+
+    for key, row in rows.items():
+        row["runs"] = len(row["runs"])
+        values = durations.get(key, [])
+        row["total_seconds"] = round(sum(values), 3)
+        row["mean_seconds"] = round(sum(values) / len(values), 3) if values else None
+        row["p95_seconds"] = round(_percentile(values, 0.95), 3) if values else None
+    ordered = sorted(rows.values(), key=lambda row: (-(row["cost_usd"] or 0.0), -row["total_seconds"], row["group"]))
+    return {"group_by": group_by, "runs": runs, "rows": ordered, "totals": _totals_of_rows(ordered)}
+
+
+def _totals_of_rows(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    totals = _totals([])
+    totals["total_seconds"] = 0.0
+    for row in rows:
+        for key in totals:
+            if key == "cost_usd":
+                if row[key] is not None:
+                    totals[key] = (totals[key] or 0.0) + row[key]
+            else:
+                totals[key] += row[key]
+    totals["total_seconds"] = round(totals["total_seconds"], 3)
+    return totals
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render an ``aggregate_runs`` report as a plain-text table."""
+
+    def cost(value: Optional[float]) -> str:
+        return "-" if value is None else f"${value:.6f}"
+
+    def seconds(value: Optional[float]) -> str:
+        return "-" if value is None else f"{value:.1f}"
+
+    header = f"{report['group_by']:<40} {'runs':>5} {'calls':>6} {'in tok':>10} {'out tok':>10} {'hits':>5} {'retry':>5} {'total s':>9} {'mean s':>8} {'p95 s':>8} {'cost':>12}"
+    lines = [f"{report['runs']} run(s)", header, "-" * len(header)]
+    for row in report["rows"]:
+        lines.append(
+            f"{row['group'][:40]:<40} {row['runs']:>5} {row['llm_calls']:>6} {row['input_tokens']:>10} "
+            f"{row['output_tokens']:>10} {row['cache_hits']:>5} {row['retries']:>5} {seconds(row['total_seconds']):>9} "
+            f"{seconds(row['mean_seconds']):>8} {seconds(row['p95_seconds']):>8} {cost(row['cost_usd']):>12}"
+        )
+    totals = report["totals"]
+    lines.append("-" * len(header))
+    lines.append(
+        f"{'total':<40} {report['runs']:>5} {totals['llm_calls']:>6} {totals['input_tokens']:>10} "
+        f"{totals['output_tokens']:>10} {totals['cache_hits']:>5} {totals['retries']:>5} "
+        f"{seconds(totals['total_seconds']):>9} {'':>8} {'':>8} {cost(totals['cost_usd']):>12}"
+    )
+    return "\n".join(lines)
+
+
+__all__ = [
+    "LLMCallRecord",
+    "REPORT_GROUPS",
+    "RunTelemetry",
+    "TELEMETRY_FILENAME",
+    "TaskRecord",
+    "aggregate_runs",
+    "begin_call",
+    "end_call",
+    "estimate_cost",
+    "find_telemetry_files",
+    "format_report",
+    "note_cache_hit",
+    "note_rate_limit_wait",
+    "note_retry",
+    "telemetry_for_task",
+    "telemetry_path_for",
+]
@@ -1,5 +1,16 @@
 """Utility helpers exposed by the tools package."""
 
-from learn_anything.tools.html_builder import build_html_document
+from learn_anything.tools.html_builder import build_html_document, iter_html_document, render_to, stream_html_document
+from learn_anything.tools.markdown_renderer import MarkdownRenderer
+from learn_anything.tools.render_cache import RenderCache
+from learn_anything.tools.site_builder import write_site
 
-__all__ = ["build_html_document"]
+__all__ = [
+    "MarkdownRenderer",
+    "RenderCache",
+    "build_html_document",
+    "iter_html_document",
+    "render_to",
+    "stream_html_document",
+    "write_site",
+]
@@ -1,12 +1,12 @@
 import html
+import json
+import os
 import re
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
-
-try:
-    from markdown import Markdown  # type: ignore
-except ImportError:  # pragma: no cover - fallback when markdown isn't installed yet
-    Markdown = None  # type: ignore
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from learn_anything.book_schema import (
     BookPayload,
@@ -17,6 +17,36 @@ from learn_anything.book_schema import (
     SupplementaryResources,
     parse_book_payload,
 )
+from learn_anything.book_stream import BookSource, iter_book_parts
+from learn_anything.tools.lazy_chapters import LAZY_CHAPTERS_SCRIPT, resolve_lazy_chapters, wrap_lazy_chapter
+from learn_anything.tools.markdown_renderer import MarkdownRenderer
+from learn_anything.tools.render_cache import RenderCache
+from learn_anything.tools.search_index import (
+    SEARCH_WIDGET_HTML,
+    appendix_terms,
+    chapter_terms,
+    encode_search_index,
+    render_search_script,
+)
+
+# Stand in for the chapter articles and the search index so the page can be
+# written around them.
+_CHAPTERS_SLOT = "\x00chapter-articles\x00"
+_SEARCH_INDEX_SLOT = "\x00search-index\x00"
+
+# Shared by every render in the process; see MarkdownRenderer for sizing.
+_RENDERER = MarkdownRenderer()
+
+# Chapters are rendered serially unless more workers are requested.
+DEFAULT_RENDER_WORKERS = 1
+# Fewer chapters than this render serially even with more workers: starting the
+# pool and pickling chapters costs more than it saves for typical books (a
+# 200-chapter book renders faster serially than on 3 workers). Measure with
+# benchmarks/bench_render_workers.py; override with HTML_RENDER_MIN_PARALLEL_CHAPTERS.
+DEFAULT_MIN_PARALLEL_CHAPTERS = 400
+# Chunks handed to each worker over a parallel render; fewer, larger chunks
+# amortize pickling while still balancing uneven chapter sizes.
+_CHUNKS_PER_WORKER = 4
 
 
 @dataclass
@@ -40,16 +70,7 @@ def _strip_code_fences(text: Optional[str]) -> str:
 
 
 def _markdown_to_html(text: str) -> str:
-    if not text:
-        return ""
-    if Markdown is None:
-        # Minimal fallback: wrap paragraphs and preserve code blocks verbatim.
-        escaped = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        paragraphs = [p.strip() for p in escaped.split("\n\n") if p.strip()]
-        formatted = (para.replace("\n", "<br>") for para in paragraphs)
-        return "".join(f"<p>{chunk}</p>" for chunk in formatted)
-    md = Markdown(extensions=["fenced_code", "tables", "sane_lists"])
-    return md.convert(text)
+    return _RENDERER.render(text)
 
 
 def _markdown_inline(text: str) -> str:
@@ -167,10 +188,19 @@ def _render_resource_items(items) -> str:
     return f"<ul>{''.join(list_items)}</ul>"
 
 
-def _render_structured_resources(supplementary: SupplementaryResources) -> Tuple[str, str]:
-    tools_html = _render_resource_items(supplementary.recommended_tools)
-    external_html = _render_resource_items(supplementary.external_resources)
-    return tools_html, external_html
+def _render_curated_resources(text: str, supplementary: Optional[SupplementaryResources] = None) -> str:
+    """Render the curator's output, which is schema JSON or (for older runs) markdown."""
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        return _markdown_to_html(text)
+
+    curated = SupplementaryResources.from_dict(data.get("supplementary") or data)
+    if curated == supplementary:
+        return "<p>Every curated resource is listed in the sections above.</p>"
+    return _render_resource_items(curated.recommended_tools + curated.external_resources)
 
 
 def _render_structured_glossary(entries) -> str:
@@ -239,57 +269,40 @@ def _render_structured_quiz(chapter: StructuredChapterPayload, anchor: str) -> s
     )
 
 
-def _prepare_structured_render_data(
-    topic: str,
-    payload: BookPayload,
-    curated_resources_text: str,
-) -> Tuple[
-    str,
-    str,
-    List[str],
-    str,
-    str,
-    str,
-    str,
-    str,
-    str,
-    List[Tuple[str, str]],
-]:
-    book_title = payload.title or f"{topic.title()} Tutorial"
+def _structured_chapter_heading(chapter: StructuredChapterPayload) -> Tuple[str, str]:
+    """Return ``(anchor, toc_label)`` for one chapter without rendering it."""
+    anchor = _safe_anchor(f"chapter-{chapter.chapter_number}-{chapter.title}")
+    chapter_label = (
+        f"Chapter {chapter.chapter_number}: {chapter.title}"
+        if chapter.chapter_number
+        else chapter.title
+    )
+    return anchor, chapter_label
 
-    introduction_html = _render_structured_introduction(payload.introduction)
 
-    chapter_articles: List[str] = []
-    toc_entries: List[Tuple[str, str]] = [("introduction", "Introduction")]
+def _render_structured_chapter(chapter: StructuredChapterPayload) -> Tuple[str, str, str]:
+    """Return ``(anchor, toc_label, article_html)`` for one chapter."""
+    anchor, chapter_label = _structured_chapter_heading(chapter)
 
-    for chapter in sorted(payload.chapters, key=lambda c: c.chapter_number or 0):
-        anchor = _safe_anchor(f"chapter-{chapter.chapter_number}-{chapter.title}")
-        chapter_label = (
-            f"Chapter {chapter.chapter_number}: {chapter.title}"
-            if chapter.chapter_number
-            else chapter.title
+    objectives_html = ""
+    if chapter.learning_objectives:
+        objectives_html = (
+            "<div class=\"learning-objective\"><h4>Learning Objectives</h4>"
+            + _render_list(chapter.learning_objectives, "checklist")
+            + "</div>"
         )
 
-        objectives_html = ""
-        if chapter.learning_objectives:
-            objectives_html = (
-                "<div class=\"learning-objective\"><h4>Learning Objectives</h4>"
-                + _render_list(chapter.learning_objectives, "checklist")
-                + "</div>"
-            )
-
-        overview_html = _markdown_to_html(chapter.overview)
-        theory_html = _render_section_blocks("Detailed Theoretical Explanations", chapter.theoretical_concepts)
-        procedure_html = _render_section_blocks("Step-by-Step Procedures", chapter.procedures)
-        examples_html = _render_section_blocks("Practical Examples and Case Studies", chapter.examples)
-        exercises_html = _render_hands_on_exercises(chapter.hands_on_exercises)
-        troubleshooting_html = _render_troubleshooting_items(chapter.troubleshooting)
-        best_practices_html = _render_best_practices(chapter.best_practices)
-        summary_html = _markdown_to_html(chapter.summary)
-        quiz_html = _render_structured_quiz(chapter, anchor)
-
-        chapter_articles.append(
-            f"""
+    overview_html = _markdown_to_html(chapter.overview)
+    theory_html = _render_section_blocks("Detailed Theoretical Explanations", chapter.theoretical_concepts)
+    procedure_html = _render_section_blocks("Step-by-Step Procedures", chapter.procedures)
+    examples_html = _render_section_blocks("Practical Examples and Case Studies", chapter.examples)
+    exercises_html = _render_hands_on_exercises(chapter.hands_on_exercises)
+    troubleshooting_html = _render_troubleshooting_items(chapter.troubleshooting)
+    best_practices_html = _render_best_practices(chapter.best_practices)
+    summary_html = _markdown_to_html(chapter.summary)
+    quiz_html = _render_structured_quiz(chapter, anchor)
+
+    article_html = f"""
         <article id="{anchor}">
             <h3>{chapter_label}</h3>
             {objectives_html}
@@ -305,21 +318,119 @@ def _prepare_structured_render_data(
             <a href="#" class="back-to-top">Back to Top</a>
         </article>
         """
-        )
+    return anchor, chapter_label, article_html
+
 
-        toc_entries.append((anchor, chapter_label))
+def _render_chapter_article(chapter: StructuredChapterPayload) -> str:
+    return _render_structured_chapter(chapter)[2]
 
-    resources_tools_html, external_resources_html = _render_structured_resources(payload.supplementary)
-    glossary_html = _render_structured_glossary(payload.supplementary.glossary)
-    references_html = _render_structured_references(payload.supplementary.references)
-    curated_resources_html = _markdown_to_html(curated_resources_text)
+
+def _resolve_render_workers(workers: Optional[int]) -> int:
+    if workers is None:
+        try:
+            workers = int(os.environ.get("HTML_RENDER_WORKERS", "") or DEFAULT_RENDER_WORKERS)
+        except ValueError:
+            workers = DEFAULT_RENDER_WORKERS
+    if workers < 1:
+        raise ValueError(f"html_render_workers must be at least 1, got {workers}")
+    return workers
+
+
+def _min_parallel_chapters() -> int:
+    try:
+        return max(0, int(os.environ.get("HTML_RENDER_MIN_PARALLEL_CHAPTERS", "") or DEFAULT_MIN_PARALLEL_CHAPTERS))
+    except ValueError:
+        return DEFAULT_MIN_PARALLEL_CHAPTERS
+
+
+def _cached_fragment(cache: Optional[RenderCache], kind: str, render: Callable[..., str], *parts: Any) -> str:
+    """Return ``render(*parts)``, reading it from and saving it to ``cache`` when given."""
+    if cache is None:
+        return render(*parts)
+    key = cache.key(kind, *parts)
+    fragment = cache.get(key)
+    if fragment is None:
+        fragment = render(*parts)
+        cache.put(key, fragment)
+    return fragment
+
+
+def _render_chapter_articles(
+    chapters: List[StructuredChapterPayload],
+    workers: int,
+    cache: Optional[RenderCache] = None,
+) -> Iterator[str]:
+    """Yield chapter articles in order, fanning them out to processes when ``workers > 1``.
+
+    The pool is only used for at least ``HTML_RENDER_MIN_PARALLEL_CHAPTERS``
+    chapters to render (default ``DEFAULT_MIN_PARALLEL_CHAPTERS``).
+
+    With a ``cache``, only chapters whose payload changed are rendered. Cached
+    fragments are read one at a time as they are yielded, so like a serial
+    render only about one chapter is held in memory.
+    """
+    if cache is not None:
+        keys = [cache.key("chapter", chapter) for chapter in chapters]
+        stale = [not cache.contains(key) for key in keys]
+        rendered = _render_chapter_articles([chapter for chapter, miss in zip(chapters, stale) if miss], workers)
+        for chapter, key, miss in zip(chapters, keys, stale):
+            fragment = None if miss else cache.get(key)
+            if fragment is None:
+                # A fragment removed since the check is rendered here.
+                fragment = next(rendered) if miss else _render_chapter_article(chapter)
+                cache.put(key, fragment)
+            yield fragment
+        return
+    if workers == 1 or len(chapters) < max(2, _min_parallel_chapters()):
+        for chapter in chapters:
+            yield _render_chapter_article(chapter)
+        return
+    workers = min(workers, len(chapters))
+    chunksize = max(1, len(chapters) // (workers * _CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_render_chapter_article, chapters, chunksize=chunksize)
+
+
+def _prepare_structured_render_data(
+    topic: str,
+    payload: BookPayload,
+    curated_resources_text: str,
+    chapter_toc: List[Tuple[str, str]],
+    cache: Optional[RenderCache] = None,
+) -> Tuple[
+    str,
+    str,
+    str,
+    str,
+    str,
+    str,
+    str,
+    str,
+    List[Tuple[str, str]],
+]:
+    """Render everything around the chapters; ``chapter_toc`` lists them in order."""
+    book_title = payload.title or f"{topic.title()} Tutorial"
+
+    supplementary = payload.supplementary
+    introduction_html = _cached_fragment(cache, "introduction", _render_structured_introduction, payload.introduction)
+
+    toc_entries: List[Tuple[str, str]] = [("introduction", "Introduction")]
+    toc_entries.extend(chapter_toc)
+
+    resources_tools_html = _cached_fragment(cache, "resources", _render_resource_items, supplementary.recommended_tools)
+    external_resources_html = _cached_fragment(cache, "resources", _render_resource_items, supplementary.external_resources)
+    glossary_html = _cached_fragment(cache, "glossary", _render_structured_glossary, supplementary.glossary)
+    references_html = _cached_fragment(cache, "references", _render_structured_references, supplementary.references)
+    curated_resources_html = _cached_fragment(
+        cache, "curated", _render_curated_resources, curated_resources_text, supplementary
+    )
 
     toc_entries.append(("resources", "Resources"))
     toc_entries.append(("glossary", "Glossary"))
 
     summary_section_html = ""
     if payload.summary:
-        summary_html = _markdown_to_html(payload.summary)
+        summary_html = _cached_fragment(cache, "summary", _markdown_to_html, payload.summary)
         summary_section_html = (
             "<section id=\"summary\" class=\"container\">"
             "<h2>Summary &amp; Next Steps</h2>"
@@ -332,7 +443,6 @@ def _prepare_structured_render_data(
     return (
         book_title,
         introduction_html,
-        chapter_articles,
         resources_tools_html,
         external_resources_html,
         glossary_html,
@@ -343,6 +453,60 @@ def _prepare_structured_render_data(
     )
 
 
+def _structured_document_frame(
+    topic: str,
+    payload: BookPayload,
+    curated_resources_text: str,
+    chapter_toc: List[Tuple[str, str]],
+    cache: Optional[RenderCache] = None,
+    lazy_chapters: bool = False,
+) -> Tuple[str, str, List[Tuple[str, str]]]:
+    """Return the page text before and after the chapter articles, and the TOC.
+
+    The text after the articles still holds the search index slot; see
+    ``_fill_search_index``.
+    """
+    (
+        book_title,
+        introduction_html,
+        resources_tools_html,
+        external_resources_html,
+        glossary_html,
+        references_html,
+        curated_resources_html,
+        summary_section_html,
+        toc_entries,
+    ) = _prepare_structured_render_data(topic, payload, curated_resources_text, chapter_toc, cache)
+    head, tail = _render_document(
+        topic,
+        book_title,
+        introduction_html,
+        _CHAPTERS_SLOT,
+        resources_tools_html,
+        external_resources_html,
+        glossary_html,
+        references_html,
+        curated_resources_html,
+        summary_section_html,
+        toc_entries,
+        SEARCH_WIDGET_HTML,
+        _SEARCH_INDEX_SLOT + (LAZY_CHAPTERS_SCRIPT if lazy_chapters else ""),
+    ).split(_CHAPTERS_SLOT, 1)
+    return head, tail, toc_entries
+
+
+def _fill_search_index(
+    tail: str,
+    payload: BookPayload,
+    toc_entries: List[Tuple[str, str]],
+    chapter_terms_by_anchor: Dict[str, Counter],
+) -> str:
+    terms_by_anchor = appendix_terms(payload)
+    terms_by_anchor.update(chapter_terms_by_anchor)
+    blob = encode_search_index(toc_entries, terms_by_anchor)
+    return tail.replace(_SEARCH_INDEX_SLOT, render_search_script(blob), 1)
+
+
 def _safe_anchor(text: str) -> str:
     slug = re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
     return slug or "section"
@@ -369,117 +533,16 @@ def _extract_chapters(content: str) -> List[Chapter]:
     return chapters
 
 
-def build_html_document(
-    topic: str,
-    compiled_book_text: str,
-    curated_resources_text: str,
-    assessments_text: str,
-) -> str:
-    """Render a complete HTML document from the generated markdown artefacts."""
-
-    compiled_book_text = _strip_code_fences(compiled_book_text)
-    curated_resources_text = _strip_code_fences(curated_resources_text)
-    _ = _strip_code_fences(assessments_text)
-
-    structured_payload: Optional[BookPayload] = None
-    try:
-        structured_payload = parse_book_payload(compiled_book_text)
-    except ValueError:
-        structured_payload = None
-
-    if structured_payload:
-        (
-            book_title,
-            introduction_html,
-            chapter_articles,
-            resources_tools_html,
-            external_resources_html,
-            glossary_html,
-            references_html,
-            curated_resources_html,
-            summary_section_html,
-            toc_entries,
-        ) = _prepare_structured_render_data(topic, structured_payload, curated_resources_text)
-    else:
-        title_match = re.search(r"^#\s+(.+)$", compiled_book_text, flags=re.MULTILINE)
-        book_title = title_match.group(1).strip() if title_match else topic.title()
-
-        body_after_title = compiled_book_text
-        if title_match:
-            title_line_end = title_match.end()
-            body_after_title = compiled_book_text[title_line_end:].strip()
-
-        top_sections = _split_sections(body_after_title, "##")
-
-        introduction_md = top_sections.get("1. BOOK INTRODUCTION", "")
-        tutorial_content_md = top_sections.get("2. COMPREHENSIVE TUTORIAL CONTENT", "")
-        supplementary_md = top_sections.get("3. SUPPLEMENTARY RESOURCES", "")
-
-        introduction_html = _markdown_to_html(introduction_md)
-
-        chapters = _extract_chapters(tutorial_content_md)
-
-        supplementary_sections = _split_sections(supplementary_md, "###")
-        resources_tools_html = _markdown_to_html(supplementary_sections.get("3.1. Recommended Tools and Materials", ""))
-        external_resources_html = _markdown_to_html(supplementary_sections.get("3.2. External Resources", ""))
-        glossary_html = _markdown_to_html(supplementary_sections.get("3.3. Glossary", ""))
-        references_html = _markdown_to_html(supplementary_sections.get("3.4. References", ""))
-
-        curated_resources_html = _markdown_to_html(curated_resources_text)
-
-        summary_section_html = ""
-
-        toc_entries = [("introduction", "Introduction")]
-        for chapter in chapters:
-            toc_entries.append((chapter.anchor, chapter.title))
-        toc_entries.append(("resources", "Resources"))
-        toc_entries.append(("glossary", "Glossary"))
-
-        chapter_articles = []
-        for chapter in chapters:
-            quiz_html = _render_default_quiz(chapter)
-            chapter_html = f"""
-        <article id="{chapter.anchor}">
-            <h3>{chapter.title}</h3>
-            {chapter.html}
-            {quiz_html}
-            <a href="#" class="back-to-top">Back to Top</a>
-        </article>
-        """
-            chapter_articles.append(chapter_html)
-
-    chapter_articles_html = "".join(chapter_articles)
-    toc_list = "\n".join(
-        f'<li><a href="#{anchor}">{label}</a></li>' for anchor, label in toc_entries
-    )
-
-    nav_entries = [
-        ("introduction", "Introduction"),
-        ("chapters", "Chapters"),
-        ("resources", "Resources"),
-        ("glossary", "Glossary"),
-    ]
-    if "summary" in {anchor for anchor, _ in toc_entries}:
-        nav_entries.append(("summary", "Summary"))
-
-    nav_links = "\n                ".join(
-        f'<li><a href="#{anchor}">{label}</a></li>' for anchor, label in nav_entries
-    )
-
-    html = f"""<!DOCTYPE html>
-<html lang=\"en\">
-<head>
-    <meta charset=\"UTF-8\">
-    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">
-    <title>{book_title}</title>
-    <style>
-        *, *::before, *::after {{
+# Page stylesheet; inlined by the single-file renderers and written once as a
+# hashed asset by the multi-page site writer.
+_PAGE_CSS = """\
+        *, *::before, *::after {
             box-sizing: border-box;
             margin: 0;
             padding: 0;
-        }}
+        }
 
-        :root {{
+        :root {
             --color-bg: #f9f9f9;
             --color-text: #333;
             --color-primary: #007bff;
@@ -502,18 +565,18 @@ def build_html_document(
             --spacing-lg: 1.5rem;
             --spacing-xl: 3rem;
             --transition-duration: 0.2s;
-        }}
+        }
 
-        @media (prefers-color-scheme: dark) {{
-            :root {{
+        @media (prefers-color-scheme: dark) {
+            :root {
                 --color-bg: #121212;
                 --color-text: #eee;
                 --color-border: #444;
                 --color-light: #1e1e1e;
-            }}
-        }}
+            }
+        }
 
-        body {{
+        body {
             font-family: var(--font-family);
             font-size: var(--font-size-base);
             line-height: var(--line-height-base);
@@ -521,9 +584,9 @@ def build_html_document(
             background-color: var(--color-bg);
             margin: 0;
             transition: background-color var(--transition-duration), color var(--transition-duration);
-        }}
+        }
 
-        .skip-link {{
+        .skip-link {
             position: absolute;
             top: -40px;
             left: 0;
@@ -531,279 +594,279 @@ def build_html_document(
             color: var(--color-light);
             padding: var(--spacing-sm);
             z-index: 1000;
-        }}
+        }
 
-        .skip-link:focus {{
+        .skip-link:focus {
             top: 0;
-        }}
+        }
 
-        nav {{
+        nav {
             background-color: var(--color-dark);
             color: var(--color-light);
             padding: var(--spacing-sm) 0;
             position: sticky;
             top: 0;
             z-index: 100;
-        }}
+        }
 
-        nav .container {{
+        nav .container {
             width: 90%;
             max-width: 1200px;
             margin: 0 auto;
             display: flex;
             justify-content: space-between;
             align-items: center;
-        }}
+        }
 
-        nav ul {{
+        nav ul {
             list-style: none;
             display: flex;
             gap: var(--spacing-sm);
-        }}
+        }
 
-        nav a {{
+        nav a {
             color: var(--color-light);
             text-decoration: none;
             padding: var(--spacing-sm) var(--spacing-md);
             border-radius: var(--border-radius);
             display: inline-block;
-        }}
+        }
 
         nav a:hover,
-        nav a:focus {{
+        nav a:focus {
             background-color: rgba(255, 255, 255, 0.1);
-        }}
+        }
 
-        header.landing {{
+        header.landing {
             text-align: center;
             padding: var(--spacing-xl) 0;
             background: linear-gradient(135deg, var(--color-primary), var(--color-info));
             color: var(--color-light);
-        }}
+        }
 
-        header.landing h1 {{
+        header.landing h1 {
             font-size: clamp(2.2rem, 4vw, 3rem);
             margin-bottom: var(--spacing-md);
-        }}
+        }
 
-        header.landing p {{
+        header.landing p {
             font-size: 1.2rem;
-        }}
+        }
 
-        .container {{
+        .container {
             width: 90%;
             max-width: 1100px;
             margin: 0 auto;
             padding: var(--spacing-lg) 0;
-        }}
+        }
 
-        section {{
+        section {
             margin-bottom: var(--spacing-xl);
-        }}
+        }
 
-        section h2 {{
+        section h2 {
             margin-bottom: var(--spacing-md);
             border-bottom: 2px solid var(--color-primary);
             padding-bottom: var(--spacing-sm);
-        }}
+        }
 
-        h3 {{
+        h3 {
             margin-bottom: var(--spacing-sm);
             color: var(--color-dark);
-        }}
+        }
 
-        p {{
+        p {
             margin-bottom: var(--spacing-md);
-        }}
+        }
 
-        ul, ol {{
+        ul, ol {
             margin-bottom: var(--spacing-md);
             padding-left: 1.25rem;
-        }}
+        }
 
-        li {{
+        li {
             margin-bottom: var(--spacing-xs);
-        }}
+        }
 
-        table {{
+        table {
             width: 100%;
             border-collapse: collapse;
             margin-bottom: var(--spacing-lg);
-        }}
+        }
 
-        th, td {{
+        th, td {
             border: 1px solid var(--color-border);
             padding: var(--spacing-sm);
             text-align: left;
-        }}
+        }
 
-        th {{
+        th {
             background-color: var(--color-light);
-        }}
+        }
 
-        pre {{
+        pre {
             background: #1e1e1e;
             color: #f5f5f5;
             padding: var(--spacing-md);
             border-radius: var(--border-radius);
             overflow-x: auto;
             margin-bottom: var(--spacing-md);
-        }}
+        }
 
-        code {{
+        code {
             font-family: "SFMono-Regular", Consolas, "Liberation Mono", Menlo, Courier, monospace;
             font-size: 0.9rem;
-        }}
+        }
 
-        .toc ul {{
+        .toc ul {
             list-style: none;
             padding-left: 0;
-        }}
+        }
 
-        .toc li {{
+        .toc li {
             margin-bottom: var(--spacing-sm);
-        }}
+        }
 
-        .toc a {{
+        .toc a {
             color: var(--color-primary);
             text-decoration: none;
-        }}
+        }
 
-        .toc a:hover {{
+        .toc a:hover {
             text-decoration: underline;
-        }}
+        }
 
         .callout-info,
         .callout-warning,
         .callout-error,
-        .callout-success {{
+        .callout-success {
             padding: var(--spacing-md);
             border-left: 4px solid;
             border-radius: var(--border-radius);
             margin-bottom: var(--spacing-md);
-        }}
+        }
 
-        .callout-info {{
+        .callout-info {
             border-color: var(--color-info);
             background-color: rgba(23, 162, 184, 0.1);
-        }}
+        }
 
-        .callout-warning {{
+        .callout-warning {
             border-color: var(--color-warning);
             background-color: rgba(255, 193, 7, 0.1);
-        }}
+        }
 
-        .callout-error {{
+        .callout-error {
             border-color: var(--color-error);
             background-color: rgba(220, 53, 69, 0.1);
-        }}
+        }
 
-        .callout-success {{
+        .callout-success {
             border-color: var(--color-accent);
             background-color: rgba(40, 167, 69, 0.1);
-        }}
+        }
 
-        .learning-objective {{
+        .learning-objective {
             padding: var(--spacing-md);
             background-color: var(--color-light);
             border-left: 5px solid var(--color-accent);
             margin-bottom: var(--spacing-md);
-        }}
+        }
 
-        .checklist {{
+        .checklist {
             list-style: none;
             padding-left: 0;
-        }}
+        }
 
-        .checklist li::before {{
+        .checklist li::before {
             content: "\2713";
             color: var(--color-accent);
             margin-right: var(--spacing-sm);
-        }}
+        }
 
-        .assessment-card {{
+        .assessment-card {
             border: 1px solid var(--color-border);
             border-radius: var(--border-radius);
             padding: var(--spacing-md);
             margin-bottom: var(--spacing-md);
             box-shadow: var(--box-shadow);
-        }}
+        }
 
-        .chapter-quiz {{
+        .chapter-quiz {
             border: 1px solid var(--color-border);
             border-radius: var(--border-radius);
             padding: var(--spacing-md);
             margin: var(--spacing-lg) 0;
             background-color: var(--color-light);
-        }}
+        }
 
-        .chapter-quiz h4 {{
+        .chapter-quiz h4 {
             margin-bottom: var(--spacing-md);
-        }}
+        }
 
-        fieldset {{
+        fieldset {
             border: none;
             margin-bottom: var(--spacing-md);
-        }}
+        }
 
-        legend {{
+        legend {
             font-weight: 600;
             margin-bottom: var(--spacing-sm);
-        }}
+        }
 
-        label {{
+        label {
             display: block;
             margin-bottom: var(--spacing-xs);
-        }}
+        }
 
-        textarea {{
+        textarea {
             width: 100%;
             padding: var(--spacing-sm);
             border-radius: var(--border-radius);
             border: 1px solid var(--color-border);
             min-height: 5rem;
             resize: vertical;
-        }}
+        }
 
-        details {{
+        details {
             margin-top: var(--spacing-md);
             padding: var(--spacing-sm) var(--spacing-md);
             border: 1px solid var(--color-border);
             border-radius: var(--border-radius);
             background-color: white;
-        }}
+        }
 
-        summary {{
+        summary {
             font-weight: 600;
             cursor: pointer;
-        }}
+        }
 
-        .resource-appendix {{
+        .resource-appendix {
             margin-top: var(--spacing-lg);
             border-top: 1px solid var(--color-border);
             padding-top: var(--spacing-lg);
-        }}
+        }
 
-        .media-frame {{
+        .media-frame {
             position: relative;
             padding-bottom: 56.25%;
             height: 0;
             overflow: hidden;
             border-radius: var(--border-radius);
             margin-bottom: var(--spacing-md);
-        }}
+        }
 
         .media-frame iframe,
-        .media-frame img {{
+        .media-frame img {
             position: absolute;
             top: 0;
             left: 0;
             width: 100%;
             height: 100%;
             border: 0;
-        }}
+        }
 
-        .back-to-top {{
+        .back-to-top {
             display: inline-block;
             margin-top: var(--spacing-md);
             padding: var(--spacing-sm) var(--spacing-md);
@@ -811,32 +874,98 @@ def build_html_document(
             color: var(--color-light);
             border-radius: var(--border-radius);
             text-decoration: none;
-        }}
+        }
+
+        .lazy-chapter {
+            min-height: 50vh;
+        }
+
+        .search label {
+            display: block;
+            font-weight: bold;
+            margin-bottom: var(--spacing-sm);
+        }
+
+        .search input {
+            width: 100%;
+            padding: var(--spacing-sm);
+            border: 1px solid var(--color-border);
+            border-radius: var(--border-radius);
+            font-size: var(--font-size-base);
+        }
 
-        footer {{
+        .search ul {
+            list-style: none;
+            margin-top: var(--spacing-sm);
+        }
+
+        footer {
             background-color: var(--color-dark);
             color: var(--color-light);
             text-align: center;
             padding: var(--spacing-lg) 0;
             font-size: 0.875rem;
-        }}
+        }
 
-        @media (max-width: 768px) {{
-            nav .container {{
+        @media (max-width: 768px) {
+            nav .container {
                 flex-direction: column;
                 gap: var(--spacing-sm);
-            }}
+            }
 
-            nav ul {{
+            nav ul {
                 flex-wrap: wrap;
                 justify-content: center;
-            }}
+            }
 
-            .container {{
+            .container {
                 width: 95%;
-            }}
-        }}
-    </style>
+            }
+        }
+"""
+
+
+def _render_document(
+    topic: str,
+    book_title: str,
+    introduction_html: str,
+    chapter_articles_html: str,
+    resources_tools_html: str,
+    external_resources_html: str,
+    glossary_html: str,
+    references_html: str,
+    curated_resources_html: str,
+    summary_section_html: str,
+    toc_entries: List[Tuple[str, str]],
+    search_widget_html: str = "",
+    search_script_html: str = "",
+) -> str:
+    """Fill the page template with the rendered sections."""
+    toc_list = "\n".join(
+        f'<li><a href="#{anchor}">{label}</a></li>' for anchor, label in toc_entries
+    )
+
+    nav_entries = [
+        ("introduction", "Introduction"),
+        ("chapters", "Chapters"),
+        ("resources", "Resources"),
+        ("glossary", "Glossary"),
+    ]
+    if "summary" in {anchor for anchor, _ in toc_entries}:
+        nav_entries.append(("summary", "Summary"))
+
+    nav_links = "\n                ".join(
+        f'<li><a href="#{anchor}">{label}</a></li>' for anchor, label in nav_entries
+    )
+
+    html = f"""<!DOCTYPE html>
+<html lang=\"en\">
+<head>
+    <meta charset=\"UTF-8\">
+    <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\">
+    <title>{book_title}</title>
+    <style>
+{_PAGE_CSS}    </style>
 </head>
 <body>
     <a class=\"skip-link\" href=\"#main\">Skip to main content</a>
@@ -862,7 +991,7 @@ def build_html_document(
             <ul>
                 {toc_list}
             </ul>
-        </section>
+        </section>{search_widget_html}
 
         <section id=\"introduction\" class=\"container\">
             <h2>Introduction</h2>
@@ -911,13 +1040,206 @@ def build_html_document(
 
     <footer>
         <p>&copy; {book_title}. Crafted with the Comprehensive Tutorial Generator.</p>
-    </footer>
+    </footer>{search_script_html}
 </body>
 </html>"""
 
     return html
 
 
+def build_html_document(
+    topic: str,
+    compiled_book_text: str,
+    curated_resources_text: str,
+    assessments_text: str,
+    workers: Optional[int] = None,
+    cache: Optional[RenderCache] = None,
+    lazy_chapters: Optional[bool] = None,
+) -> str:
+    """Render a complete HTML document from the generated markdown artefacts.
+
+    ``workers``, ``cache`` and ``lazy_chapters`` apply to structured books;
+    see ``iter_html_document``.
+    """
+
+    compiled_book_text = _strip_code_fences(compiled_book_text)
+    curated_resources_text = _strip_code_fences(curated_resources_text)
+    _ = _strip_code_fences(assessments_text)
+
+    structured_payload: Optional[BookPayload] = None
+    try:
+        structured_payload = parse_book_payload(compiled_book_text)
+    except ValueError:
+        structured_payload = None
+
+    if structured_payload:
+        return "".join(
+            iter_html_document(topic, structured_payload, curated_resources_text, workers, cache, lazy_chapters)
+        )
+
+    title_match = re.search(r"^#\s+(.+)$", compiled_book_text, flags=re.MULTILINE)
+    book_title = title_match.group(1).strip() if title_match else topic.title()
+
+    body_after_title = compiled_book_text
+    if title_match:
+        title_line_end = title_match.end()
+        body_after_title = compiled_book_text[title_line_end:].strip()
+
+    top_sections = _split_sections(body_after_title, "##")
+
+    introduction_md = top_sections.get("1. BOOK INTRODUCTION", "")
+    tutorial_content_md = top_sections.get("2. COMPREHENSIVE TUTORIAL CONTENT", "")
+    supplementary_md = top_sections.get("3. SUPPLEMENTARY RESOURCES", "")
+
+    introduction_html = _markdown_to_html(introduction_md)
+
+    chapters = _extract_chapters(tutorial_content_md)
+
+    supplementary_sections = _split_sections(supplementary_md, "###")
+    resources_tools_html = _markdown_to_html(supplementary_sections.get("3.1. Recommended Tools and Materials", ""))
+    external_resources_html = _markdown_to_html(supplementary_sections.get("3.2. External Resources", ""))
+    glossary_html = _markdown_to_html(supplementary_sections.get("3.3. Glossary", ""))
+    references_html = _markdown_to_html(supplementary_sections.get("3.4. References", ""))
+
+    curated_resources_html = _render_curated_resources(curated_resources_text)
+
+    summary_section_html = ""
+
+    toc_entries = [("introduction", "Introduction")]
+    for chapter in chapters:
+        toc_entries.append((chapter.anchor, chapter.title))
+    toc_entries.append(("resources", "Resources"))
+    toc_entries.append(("glossary", "Glossary"))
+
+    chapter_articles = []
+    for chapter in chapters:
+        quiz_html = _render_default_quiz(chapter)
+        chapter_html = f"""
+        <article id="{chapter.anchor}">
+            <h3>{chapter.title}</h3>
+            {chapter.html}
+            {quiz_html}
+            <a href="#" class="back-to-top">Back to Top</a>
+        </article>
+        """
+        chapter_articles.append(chapter_html)
+
+    return _render_document(
+        topic,
+        book_title,
+        introduction_html,
+        "".join(chapter_articles),
+        resources_tools_html,
+        external_resources_html,
+        glossary_html,
+        references_html,
+        curated_resources_html,
+        summary_section_html,
+        toc_entries,
+    )
+
+
+def iter_html_document(
+    topic: str,
+    payload: BookPayload,
+    curated_resources_text: str = "",
+    workers: Optional[int] = None,
+    cache: Optional[RenderCache] = None,
+    lazy_chapters: Optional[bool] = None,
+) -> Iterator[str]:
+    """Yield the HTML document for a structured book piece by piece.
+
+    The page head and table of contents come first, then one chapter article
+    at a time, then the appendices, so only one rendered chapter is held at a
+    time and a caller can start sending bytes before rendering finishes.
+
+    With ``workers`` (or ``HTML_RENDER_WORKERS``) above 1, books with at least
+    ``HTML_RENDER_MIN_PARALLEL_CHAPTERS`` chapters (default 400) are rendered on
+    a process pool; the output is identical to a serial render.
+    A ``RenderCache`` makes re-renders convert only the chapters and blocks
+    whose content changed. ``lazy_chapters`` (or ``HTML_LAZY_CHAPTERS``)
+    defers each chapter body to a ``<template>`` until it is needed.
+    """
+    workers = _resolve_render_workers(workers)
+    lazy_chapters = resolve_lazy_chapters(lazy_chapters)
+    curated_resources_text = _strip_code_fences(curated_resources_text)
+    chapters = sorted(payload.chapters, key=lambda c: c.chapter_number or 0)
+    chapter_toc = [_structured_chapter_heading(chapter) for chapter in chapters]
+    head, tail, toc_entries = _structured_document_frame(
+        topic, payload, curated_resources_text, chapter_toc, cache, lazy_chapters
+    )
+    yield head
+    for (anchor, label), article_html in zip(chapter_toc, _render_chapter_articles(chapters, workers, cache)):
+        yield wrap_lazy_chapter(anchor, label, article_html) if lazy_chapters else article_html
+    terms: Dict[str, Counter] = {}
+    for chapter, (anchor, _) in zip(chapters, chapter_toc):
+        terms.setdefault(anchor, Counter()).update(chapter_terms(chapter))
+    yield _fill_search_index(tail, payload, toc_entries, terms)
+
+
+def render_to(
+    fp: IO[str],
+    payload: BookPayload,
+    topic: str,
+    curated_resources_text: str = "",
+    workers: Optional[int] = None,
+    cache: Optional[RenderCache] = None,
+    lazy_chapters: Optional[bool] = None,
+) -> None:
+    """Write the HTML document for ``payload`` to ``fp`` as it is rendered."""
+    for piece in iter_html_document(topic, payload, curated_resources_text, workers, cache, lazy_chapters):
+        fp.write(piece)
+
+
+def stream_html_document(
+    topic: str,
+    source: BookSource,
+    fp: IO[str],
+    curated_resources_text: str = "",
+    assessments_text: str = "",
+    lazy_chapters: Optional[bool] = None,
+) -> None:
+    """Render a compiled book JSON file or stream to ``fp`` one chapter at a time.
+
+    Produces the same document as ``build_html_document`` for structured
+    books, but never holds more than one chapter in memory: rendered articles
+    are spooled to a temporary file because the table of contents, written
+    first, is only known once every chapter has been read.
+    """
+    lazy_chapters = resolve_lazy_chapters(lazy_chapters)
+    curated_resources_text = _strip_code_fences(curated_resources_text)
+    fields: Dict[str, object] = {}
+    chapter_entries: List[Tuple[int, int, str, str, int, int]] = []
+    terms: Dict[str, Counter] = {}
+
+    with tempfile.TemporaryFile() as spool:
+        for key, value in iter_book_parts(source):
+            if key != "chapters":
+                fields[key] = value
+                continue
+            anchor, label, article_html = _render_structured_chapter(value)
+            terms.setdefault(anchor, Counter()).update(chapter_terms(value))
+            if lazy_chapters:
+                article_html = wrap_lazy_chapter(anchor, label, article_html)
+            start = spool.tell()
+            spool.write(article_html.encode("utf-8"))
+            chapter_entries.append((value.chapter_number or 0, len(chapter_entries), anchor, label, start, spool.tell()))
+        if not chapter_entries:
+            raise ValueError("Book payload must contain at least one chapter")
+
+        chapter_entries.sort(key=lambda entry: entry[:2])
+        payload = BookPayload.from_parts(fields, chapters=[])
+        chapter_toc = [(anchor, label) for _, _, anchor, label, _, _ in chapter_entries]
+        head, tail, toc_entries = _structured_document_frame(
+            topic, payload, curated_resources_text, chapter_toc, lazy_chapters=lazy_chapters
+        )
+        fp.write(head)
+        for *_, start, end in chapter_entries:
+            spool.seek(start)
+            fp.write(spool.read(end - start).decode("utf-8"))
+        fp.write(_fill_search_index(tail, payload, toc_entries, terms))
+
+
 def _render_default_quiz(chapter: Chapter) -> str:
     """Generate a lightweight formative quiz for each chapter."""
 
@@ -982,4 +1304,4 @@ def _render_default_quiz(chapter: Chapter) -> str:
     return quiz_html
 
 
-__all__ = ["build_html_document"]
+__all__ = ["build_html_document", "iter_html_document", "render_to", "stream_html_document"]
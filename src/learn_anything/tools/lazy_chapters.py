@@ -0,0 +1,80 @@
+"""Lazy chapter bodies for large single-file tutorials.
+
+With lazy chapters each article is emitted inside an inert ``<template>``
+behind a placeholder carrying the chapter's anchor and heading. The browser
+parses template content but does not lay it out or load its resources, so
+the page becomes interactive after rendering little more than the table of
+contents. A small inline script swaps a chapter in when it nears the
+viewport or when a link to it is followed. The file stays self-contained.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+_TRUTHY = {"1", "true", "yes", "on"}
+
+
+def resolve_lazy_chapters(lazy_chapters: Optional[bool]) -> bool:
+    if lazy_chapters is None:
+        return os.environ.get("HTML_LAZY_CHAPTERS", "").strip().lower() in _TRUTHY
+    return lazy_chapters
+
+
+def wrap_lazy_chapter(anchor: str, label: str, article_html: str) -> str:
+    """Hold ``article_html`` in a template behind a placeholder with the same anchor."""
+    return (
+        f'\n        <div id="{anchor}" class="lazy-chapter">'
+        f"<h3>{label}</h3><template>{article_html}</template></div>\n        "
+    )
+
+
+LAZY_CHAPTERS_SCRIPT = """
+    <script>
+    (function () {
+        function show(placeholder) {
+            if (!placeholder || !placeholder.classList.contains("lazy-chapter")) {
+                return;
+            }
+            var template = placeholder.querySelector("template");
+            if (observer) {
+                observer.unobserve(placeholder);
+            }
+            placeholder.replaceWith(template.content);
+        }
+        function showTarget(hash) {
+            var id = decodeURIComponent((hash || "").slice(1));
+            var placeholder = id && document.getElementById(id);
+            if (placeholder && placeholder.classList.contains("lazy-chapter")) {
+                show(placeholder);
+                document.getElementById(id).scrollIntoView();
+            }
+        }
+        var observer = null;
+        var placeholders = document.querySelectorAll(".lazy-chapter");
+        if ("IntersectionObserver" in window) {
+            observer = new IntersectionObserver(function (entries) {
+                entries.forEach(function (entry) {
+                    if (entry.isIntersecting) {
+                        show(entry.target);
+                    }
+                });
+            }, { rootMargin: "600px 0px" });
+            placeholders.forEach(function (placeholder) { observer.observe(placeholder); });
+        } else {
+            placeholders.forEach(show);
+        }
+        document.addEventListener("click", function (event) {
+            var link = event.target.closest && event.target.closest("a[href^='#']");
+            if (link) {
+                showTarget(link.getAttribute("href"));
+            }
+        });
+        window.addEventListener("hashchange", function () { showTarget(location.hash); });
+        showTarget(location.hash);
+    })();
+    </script>"""
+
+
+__all__ = ["LAZY_CHAPTERS_SCRIPT", "resolve_lazy_chapters", "wrap_lazy_chapter"]
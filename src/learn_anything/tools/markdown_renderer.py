@@ -0,0 +1,109 @@
+"""Markdown-to-HTML rendering with converter reuse and fragment memoization.
+
+Building a ``markdown.Markdown`` instance loads every extension, which costs
+far more than converting a typical fragment (a list item, glossary entry, or
+quiz answer). ``MarkdownRenderer`` keeps one converter per thread, resetting
+it between fragments, and memoizes rendered fragments in a bounded LRU keyed
+by a hash of their content, since boilerplate strings repeat across chapters
+and books.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Sequence
+
+try:
+    from markdown import Markdown  # type: ignore
+except ImportError:  # pragma: no cover - fallback when markdown isn't installed yet
+    Markdown = None  # type: ignore
+
+DEFAULT_EXTENSIONS = ("fenced_code", "tables", "sane_lists")
+DEFAULT_CACHE_SIZE = 4096
+
+
+def _cache_size_from_env() -> int:
+    try:
+        return max(0, int(os.environ.get("MARKDOWN_CACHE_SIZE", "") or DEFAULT_CACHE_SIZE))
+    except ValueError:
+        return DEFAULT_CACHE_SIZE
+
+
+def _fallback_to_html(text: str) -> str:
+    # Minimal fallback: wrap paragraphs and preserve code blocks verbatim.
+    escaped = text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    paragraphs = [p.strip() for p in escaped.split("\n\n") if p.strip()]
+    formatted = (para.replace("\n", "<br>") for para in paragraphs)
+    return "".join(f"<p>{chunk}</p>" for chunk in formatted)
+
+
+class MarkdownRenderer:
+    """Thread-safe Markdown renderer with a bounded LRU of rendered fragments.
+
+    ``cache_size=0`` disables memoization; by default the size comes from
+    ``MARKDOWN_CACHE_SIZE`` (4096 fragments).
+    """
+
+    def __init__(self, extensions: Sequence[str] = DEFAULT_EXTENSIONS, cache_size: Optional[int] = None) -> None:
+        self.extensions = list(extensions)
+        self.cache_size = _cache_size_from_env() if cache_size is None else max(0, cache_size)
+        self._cache: "OrderedDict[bytes, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+
+    def _converter(self):
+        converter = getattr(self._local, "converter", None)
+        if converter is None:
+            converter = Markdown(extensions=self.extensions)
+            self._local.converter = converter
+        return converter
+
+    def _convert(self, text: str) -> str:
+        if Markdown is None:
+            return _fallback_to_html(text)
+        converter = self._converter()
+        try:
+            return converter.convert(text)
+        finally:
+            converter.reset()
+
+    def render(self, text: str) -> str:
+        if not text:
+            return ""
+        if not self.cache_size:
+            return self._convert(text)
+
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        # Converted outside the lock; threads racing on the same fragment
+        # produce identical HTML, so the duplicate work is harmless.
+        rendered = self._convert(text)
+        with self._lock:
+            self._cache[key] = rendered
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return rendered
+
+    def cache_info(self) -> Dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._cache), "max_size": self.cache_size}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+
+__all__ = ["DEFAULT_CACHE_SIZE", "DEFAULT_EXTENSIONS", "MarkdownRenderer"]
@@ -0,0 +1,103 @@
+"""On-disk cache of rendered HTML fragments for incremental re-renders.
+
+Each chapter and appendix block is keyed by a hash of its payload plus the
+renderer version, so after one chapter is regenerated or hand-edited only
+that chapter is converted again and every other fragment is read back.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional, Set
+
+try:
+    import markdown as _markdown  # type: ignore
+except ImportError:  # pragma: no cover - fallback when markdown isn't installed yet
+    _markdown = None  # type: ignore
+
+DEFAULT_CACHE_DIRNAME = ".render-cache"
+
+# Sources whose output the fragments depend on; editing either invalidates the cache.
+_RENDERER_SOURCES = ("html_builder.py", "markdown_renderer.py")
+
+
+def _renderer_version() -> str:
+    digest = hashlib.sha256(getattr(_markdown, "__version__", "none").encode("utf-8"))
+    tools_dir = Path(__file__).resolve().parent
+    for name in _RENDERER_SOURCES:
+        digest.update((tools_dir / name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+RENDERER_VERSION = _renderer_version()
+
+
+def _jsonable(value: Any) -> Any:
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)
+    return value
+
+
+class RenderCache:
+    """Directory of rendered fragments, one file per content hash.
+
+    ``prune`` removes fragments that were not read or written since the cache
+    was opened, so a directory dedicated to one book stays the size of it.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._used: Set[str] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, kind: str, *parts: Any) -> str:
+        payload = json.dumps(
+            {"renderer": RENDERER_VERSION, "kind": kind, "parts": [_jsonable(part) for part in parts]},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.html"
+
+    def contains(self, key: str) -> bool:
+        """Whether a fragment is stored for ``key``, without reading it (a miss is counted here)."""
+        if self._path(key).is_file():
+            return True
+        self.misses += 1
+        return False
+
+    def get(self, key: str) -> Optional[str]:
+        try:
+            fragment = self._path(key).read_bytes().decode("utf-8")
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self._used.add(key)
+        self.hits += 1
+        return fragment
+
+    def put(self, key: str, fragment: str) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(fragment.encode("utf-8"))
+        os.replace(tmp_path, path)
+        self._used.add(key)
+
+    def prune(self) -> int:
+        removed = 0
+        for path in self.directory.glob("*.html"):
+            if path.stem not in self._used:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+__all__ = ["DEFAULT_CACHE_DIRNAME", "RENDERER_VERSION", "RenderCache"]
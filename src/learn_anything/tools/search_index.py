@@ -0,0 +1,193 @@
+"""Full-text search index embedded in the single-file tutorial.
+
+The index is computed at build time from the structured book: every term maps
+to the chapters and sections (by anchor) that contain it, weighted by how
+often it appears. Terms are sorted so the page script finds prefix matches
+with a binary search, and the whole index is gzipped and base64-encoded into
+the page, so a query is a lookup rather than a scan of the DOM.
+"""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import gzip
+import json
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Tuple
+
+from learn_anything.book_schema import BookPayload, ChapterPayload
+
+_TOKEN = re.compile(r"[^\W_]+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by can for from has have how in into is it its of on or that the their them then "
+    "there these this to use used using was what when where which will with you your http https www com".split()
+)
+
+
+def _strings(value: Any) -> Iterable[str]:
+    if isinstance(value, str):
+        yield value
+    elif dataclasses.is_dataclass(value):
+        for item in dataclasses.fields(value):
+            yield from _strings(getattr(value, item.name))
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _strings(item)
+
+
+def term_counts(*values: Any) -> Counter:
+    """Count the searchable terms in every string found in ``values``."""
+    counts: Counter = Counter()
+    for text in _strings(values):
+        counts.update(
+            token for token in _TOKEN.findall(text.lower()) if len(token) > 1 and token not in _STOPWORDS
+        )
+    return counts
+
+
+def chapter_terms(chapter: ChapterPayload) -> Counter:
+    return term_counts(chapter)
+
+
+def appendix_terms(payload: BookPayload) -> Dict[str, Counter]:
+    """Term counts for the non-chapter sections, keyed by their anchors."""
+    supplementary = payload.supplementary
+    return {
+        "introduction": term_counts(payload.introduction),
+        "resources": term_counts(supplementary.recommended_tools, supplementary.external_resources),
+        "glossary": term_counts(supplementary.glossary, supplementary.references),
+        "summary": term_counts(payload.summary),
+    }
+
+
+def encode_search_index(toc_entries: List[Tuple[str, str]], terms_by_anchor: Dict[str, Counter]) -> str:
+    """Encode the index for the sections in ``toc_entries`` as gzipped, base64 JSON.
+
+    The JSON holds ``docs`` (``[anchor, label]`` pairs), sorted ``terms``,
+    and per-term ``postings`` flattened as ``[doc, count, doc, count, ...]``.
+    """
+    docs: List[Tuple[str, str]] = []
+    seen = set()
+    postings: Dict[str, List[int]] = {}
+    for anchor, label in toc_entries:
+        if anchor in seen:
+            continue
+        seen.add(anchor)
+        doc = len(docs)
+        docs.append((anchor, label))
+        for term, count in sorted(terms_by_anchor.get(anchor, {}).items()):
+            postings.setdefault(term, []).extend((doc, count))
+    terms = sorted(postings)
+    data = json.dumps(
+        {"docs": docs, "terms": terms, "postings": [postings[term] for term in terms]},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    # mtime=0 keeps the output byte-identical between renders.
+    return base64.b64encode(gzip.compress(data.encode("utf-8"), mtime=0)).decode("ascii")
+
+
+SEARCH_WIDGET_HTML = """
+        <section class="container search" role="search">
+            <label for="book-search">Search this tutorial</label>
+            <input type="search" id="book-search" placeholder="Type a term, e.g. deploy" autocomplete="off">
+            <ul id="book-search-results" aria-live="polite"></ul>
+        </section>"""
+
+_SEARCH_SCRIPT = """
+    <script type="application/octet-stream" id="book-search-index">{blob}</script>
+    <script>
+    (function () {
+        var input = document.getElementById("book-search");
+        var results = document.getElementById("book-search-results");
+        if (!input || !window.DecompressionStream) {
+            return;
+        }
+        var loading = null;
+        function load() {
+            if (!loading) {
+                var text = atob(document.getElementById("book-search-index").textContent);
+                var bytes = new Uint8Array(text.length);
+                for (var i = 0; i < text.length; i++) {
+                    bytes[i] = text.charCodeAt(i);
+                }
+                var stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream("gzip"));
+                loading = new Response(stream).json();
+            }
+            return loading;
+        }
+        function firstAtLeast(terms, prefix) {
+            var lo = 0, hi = terms.length;
+            while (lo < hi) {
+                var mid = (lo + hi) >> 1;
+                if (terms[mid] < prefix) { lo = mid + 1; } else { hi = mid; }
+            }
+            return lo;
+        }
+        function lookup(index, prefix) {
+            var scores = {};
+            for (var i = firstAtLeast(index.terms, prefix); i < index.terms.length && index.terms[i].lastIndexOf(prefix, 0) === 0; i++) {
+                var postings = index.postings[i];
+                for (var j = 0; j < postings.length; j += 2) {
+                    scores[postings[j]] = (scores[postings[j]] || 0) + postings[j + 1];
+                }
+            }
+            return scores;
+        }
+        function show(index, tokens) {
+            var scores = null;
+            tokens.forEach(function (token) {
+                var found = lookup(index, token);
+                if (scores === null) {
+                    scores = found;
+                    return;
+                }
+                var both = {};
+                for (var doc in scores) {
+                    if (doc in found) { both[doc] = scores[doc] + found[doc]; }
+                }
+                scores = both;
+            });
+            var docs = Object.keys(scores).sort(function (a, b) { return scores[b] - scores[a]; }).slice(0, 10);
+            results.textContent = "";
+            docs.forEach(function (doc) {
+                var item = document.createElement("li");
+                var link = document.createElement("a");
+                link.href = "#" + index.docs[doc][0];
+                link.textContent = index.docs[doc][1];
+                item.appendChild(link);
+                results.appendChild(item);
+            });
+            if (!docs.length) {
+                results.textContent = "No matches";
+            }
+        }
+        input.addEventListener("input", function () {
+            var tokens = input.value.toLowerCase().match(/[\\p{L}\\p{N}]+/gu) || [];
+            if (!tokens.length) {
+                results.textContent = "";
+                return;
+            }
+            load().then(function (index) { show(index, tokens); });
+        });
+    })();
+    </script>"""
+
+
+def render_search_script(blob: str) -> str:
+    return _SEARCH_SCRIPT.replace("{blob}", blob)
+
+
+__all__ = [
+    "SEARCH_WIDGET_HTML",
+    "appendix_terms",
+    "chapter_terms",
+    "encode_search_index",
+    "render_search_script",
+    "term_counts",
+]
@@ -0,0 +1,225 @@
+"""Write a structured book as a multi-page static site.
+
+The single-file document inlines the stylesheet and every chapter, so a reader
+downloads the whole book to open chapter 1. ``write_site`` writes
+``index.html`` (table of contents and introduction), one page per chapter and
+appendix section, and the stylesheet once under a content-hashed name so
+browsers can cache it indefinitely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import List, Optional, Tuple
+
+from learn_anything.book_schema import BookPayload
+from learn_anything.tools.html_builder import (
+    _PAGE_CSS,
+    _prepare_structured_render_data,
+    _render_chapter_articles,
+    _resolve_render_workers,
+    _strip_code_fences,
+    _structured_chapter_heading,
+)
+from learn_anything.tools.render_cache import RenderCache
+
+ASSETS_DIRNAME = "assets"
+INDEX_PAGE = "index.html"
+
+_SITE_CSS = _PAGE_CSS + """\
+        .pager {
+            display: flex;
+            justify-content: space-between;
+            gap: var(--spacing-md);
+            margin: var(--spacing-xl) auto;
+        }
+
+        .pager a {
+            color: var(--color-primary);
+            text-decoration: none;
+        }
+"""
+
+
+def _page_name(anchor: str) -> str:
+    return INDEX_PAGE if anchor == "introduction" else f"{anchor}.html"
+
+
+def _write_stylesheet(output_dir: str) -> str:
+    """Write the stylesheet under a content-hashed name and return its relative href."""
+    data = _SITE_CSS.encode("utf-8")
+    href = f"{ASSETS_DIRNAME}/style.{hashlib.sha256(data).hexdigest()[:12]}.css"
+    path = os.path.join(output_dir, href)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as css_file:
+            css_file.write(data)
+    return href
+
+
+def _render_pager(toc_entries: List[Tuple[str, str]], position: int) -> str:
+    links = []
+    if position > 0:
+        anchor, label = toc_entries[position - 1]
+        links.append(f'<a href="{_page_name(anchor)}" rel="prev">&larr; {label}</a>')
+    else:
+        links.append("<span></span>")
+    if position + 1 < len(toc_entries):
+        anchor, label = toc_entries[position + 1]
+        links.append(f'<a href="{_page_name(anchor)}" rel="next">{label} &rarr;</a>')
+    return f'<nav class="pager container">{"".join(links)}</nav>'
+
+
+def _render_page(
+    book_title: str,
+    page_title: str,
+    css_href: str,
+    nav_links: str,
+    body_html: str,
+    pager_html: str,
+) -> str:
+    title = book_title if page_title == book_title else f"{page_title} | {book_title}"
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <link rel="stylesheet" href="{css_href}">
+</head>
+<body>
+    <a class="skip-link" href="#main">Skip to main content</a>
+    <nav>
+        <div class="container">
+            <a href="{INDEX_PAGE}">{book_title}</a>
+            <ul>
+                {nav_links}
+            </ul>
+        </div>
+    </nav>
+
+    <main id="main">
+        {body_html}
+        {pager_html}
+    </main>
+
+    <footer>
+        <p>&copy; {book_title}. Crafted with the Comprehensive Tutorial Generator.</p>
+    </footer>
+</body>
+</html>"""
+
+
+def write_site(
+    output_dir: str,
+    payload: BookPayload,
+    topic: str,
+    curated_resources_text: str = "",
+    workers: Optional[int] = None,
+    cache: Optional[RenderCache] = None,
+) -> str:
+    """Write the book as linked pages under ``output_dir`` and return the index path.
+
+    Pages follow the single-file table of contents, each with prev/next
+    links. ``workers`` and ``cache`` work as in ``iter_html_document``.
+    """
+    workers = _resolve_render_workers(workers)
+    curated_resources_text = _strip_code_fences(curated_resources_text)
+    os.makedirs(output_dir, exist_ok=True)
+
+    chapters = sorted(payload.chapters, key=lambda c: c.chapter_number or 0)
+    chapter_toc = [_structured_chapter_heading(chapter) for chapter in chapters]
+    (
+        book_title,
+        introduction_html,
+        resources_tools_html,
+        external_resources_html,
+        glossary_html,
+        references_html,
+        curated_resources_html,
+        summary_section_html,
+        toc_entries,
+    ) = _prepare_structured_render_data(topic, payload, curated_resources_text, chapter_toc, cache)
+
+    css_href = _write_stylesheet(output_dir)
+    nav_entries = [
+        ("introduction", "Introduction"),
+        (chapter_toc[0][0] if chapter_toc else "introduction", "Chapters"),
+        ("resources", "Resources"),
+        ("glossary", "Glossary"),
+    ]
+    if summary_section_html:
+        nav_entries.append(("summary", "Summary"))
+    nav_links = "\n                ".join(
+        f'<li><a href="{_page_name(anchor)}">{label}</a></li>' for anchor, label in nav_entries
+    )
+    toc_list = "\n".join(
+        f'<li><a href="{_page_name(anchor)}">{label}</a></li>' for anchor, label in toc_entries
+    )
+
+    bodies = {
+        "introduction": f"""<header class="landing">
+            <div class="container">
+                <h1>{book_title}</h1>
+                <p>Learn {topic.title()} from foundational concepts to confident application.</p>
+            </div>
+        </header>
+        <section class="container toc">
+            <h2>Table of Contents</h2>
+            <ul>
+                {toc_list}
+            </ul>
+        </section>
+        <section id="introduction" class="container">
+            <h2>Introduction</h2>
+            <article>
+                {introduction_html}
+            </article>
+        </section>""",
+        "resources": f"""<section id="resources" class="container">
+            <h2>Resources</h2>
+            <article>
+                <h3>Recommended Tools and Materials</h3>
+                {resources_tools_html}
+            </article>
+            <article>
+                <h3>External Resources</h3>
+                {external_resources_html}
+            </article>
+            <article class="resource-appendix">
+                <h3>Curated Resource Guide</h3>
+                {curated_resources_html}
+            </article>
+        </section>""",
+        "glossary": f"""<section id="glossary" class="container">
+            <h2>Glossary &amp; References</h2>
+            <article>
+                <h3>Glossary</h3>
+                {glossary_html}
+            </article>
+            <article>
+                <h3>References</h3>
+                {references_html}
+            </article>
+        </section>""",
+        "summary": summary_section_html,
+    }
+
+    def write_page(position: int, body_html: str) -> None:
+        anchor, label = toc_entries[position]
+        page_title = book_title if anchor == "introduction" else label
+        page = _render_page(book_title, page_title, css_href, nav_links, body_html, _render_pager(toc_entries, position))
+        with open(os.path.join(output_dir, _page_name(anchor)), "w", encoding="utf-8") as page_file:
+            page_file.write(page)
+
+    # toc_entries is introduction, the chapters in order, then the appendices.
+    write_page(0, bodies["introduction"])
+    for position, article_html in enumerate(_render_chapter_articles(chapters, workers, cache), start=1):
+        write_page(position, f'<section class="container">{article_html}</section>')
+    for position in range(len(chapters) + 1, len(toc_entries)):
+        write_page(position, bodies[toc_entries[position][0]])
+    return os.path.join(output_dir, INDEX_PAGE)
+
+
+__all__ = ["write_site"]